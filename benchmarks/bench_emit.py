@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Emit Benchmark - Compares the time to render and write all model files with 1/4/8 jobs
+
+Usage:
+    python benchmarks/bench_emit.py [rows] [models]
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import write_synthetic_schema
+from src.csv_parser import CSVSchemaParser
+from src.java_structure import JavaStructureGenerator
+from src.model_generator import ModelGenerator
+
+
+JOB_COUNTS = [1, 4, 8]
+
+
+def main():
+    """Benchmark model file emission with each job count"""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    model_count = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_file = os.path.join(temp_dir, 'synthetic_schema.csv')
+        write_synthetic_schema(csv_file, rows, models=model_count)
+        models = ModelGenerator().generate_models(CSVSchemaParser().parse_csv(csv_file))
+        field_count = sum(len(model.fields) for model in models.values())
+        print(f"Emitting {len(models)} models with {field_count:,} fields ({os.cpu_count()} CPUs)")
+        
+        baseline = None
+        for jobs in JOB_COUNTS:
+            # A fresh directory per run so every file is written
+            output_dir = os.path.join(temp_dir, f"jobs{jobs}")
+            generator = JavaStructureGenerator(jobs=jobs)
+            start = time.perf_counter()
+            generator.generate_java_files(models, output_dir)
+            elapsed = time.perf_counter() - start
+            
+            baseline = baseline or elapsed
+            print(f"  jobs={jobs:<3} {len(generator.written_files):>4} files  {elapsed:8.3f}s  "
+                  f"{len(models) / elapsed:>8.1f} files/sec  speedup {baseline / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Memory Benchmark - Reports memory per 1M SchemaField and ModelField objects
+
+Compares the slotted, interned field classes against plain dataclasses
+with a per-instance __dict__, which is how the fields were stored before.
+
+Usage:
+    python benchmarks/bench_memory.py [fields]
+"""
+
+import sys
+import os
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.csv_parser import SchemaField
+from src.model_generator import ModelField
+
+
+@dataclass
+class DictSchemaField:
+    """SchemaField layout before slots and interning, kept as the baseline."""
+    xpath: str
+    required: str
+    data_type: str
+    model1_value: str
+    model2_value: str
+    model3_value: str
+    model4_value: str
+    additional_info: str = ""
+
+
+@dataclass
+class DictModelField:
+    """ModelField layout before slots and interning, kept as the baseline."""
+    name: str
+    data_type: str
+    required: bool
+    default_value: Optional[str] = None
+    description: Optional[str] = None
+    xpath: Optional[str] = None
+    required_optional_status: Optional[str] = None
+    model_value: Optional[str] = None
+    additional_info: Optional[str] = None
+
+
+def fresh(value: str) -> str:
+    """Return an equal but distinct string object, as a CSV reader would produce."""
+    return (value + '.')[:-1]
+
+
+def schema_row(row_num: int) -> tuple:
+    """Build the cell values of one schema row."""
+    return (
+        f"/root/element{row_num % 50}/field{row_num}",
+        fresh('required' if row_num % 3 else 'optional'),
+        fresh('string' if row_num % 4 else 'integer'),
+        fresh(f"value{row_num % 1000}"),
+        fresh('do not use'),
+        fresh(f"name{row_num % 500}"),
+        fresh('string'),
+        fresh('maxLength:50'),
+    )
+
+
+def packed_schema_row(row_num: int) -> tuple:
+    """Build one schema row with the model values packed as SchemaField expects."""
+    xpath, required, data_type, *model_values, additional_info = schema_row(row_num)
+    return xpath, required, data_type, tuple(model_values), additional_info
+
+
+def model_row(row_num: int) -> tuple:
+    """Build the values of one model field."""
+    return (
+        fresh(f"field{row_num % 5000}"),
+        fresh('String' if row_num % 4 else 'Integer'),
+        bool(row_num % 3),
+        fresh(f"value{row_num % 1000}"),
+        f"Field mapped from XPath: /root/element{row_num % 50}/field{row_num}",
+        f"/root/element{row_num % 50}/field{row_num}",
+        fresh('required' if row_num % 3 else 'optional'),
+        fresh(f"value{row_num % 1000}"),
+        fresh('validation_rules: maxLength:50'),
+    )
+
+
+def measure(field_class, make_row, count: int) -> int:
+    """Return the bytes allocated to hold ``count`` instances of a field class."""
+    tracemalloc.start()
+    fields = [field_class(*make_row(row_num)) for row_num in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del fields
+    return size
+
+
+def report(label: str, before: int, after: int, count: int) -> None:
+    """Print memory per 1M fields before and after."""
+    scale = 1_000_000 / count
+    print(f"  {label:<12} {before * scale / 2**20:10.1f} MB -> {after * scale / 2**20:8.1f} MB per 1M fields"
+          f"  ({1 - after / before:.0%} smaller)")
+
+
+def main():
+    """Measure both field classes"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"Measuring {count:,} fields per class (scaled to 1M)")
+    
+    report('SchemaField', measure(DictSchemaField, schema_row, count), measure(SchemaField, packed_schema_row, count), count)
+    report('ModelField', measure(DictModelField, model_row, count), measure(ModelField, model_row, count), count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Parallel Parser Benchmark - Measures parsing scaling across 1/2/4/8 worker processes
+
+Usage:
+    python benchmarks/bench_parallel.py [rows]
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import write_synthetic_schema
+from src.csv_parser import CSVSchemaParser
+
+
+WORKER_COUNTS = [1, 2, 4, 8]
+
+
+def main():
+    """Benchmark the stdlib parser with each worker count"""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_file = os.path.join(temp_dir, 'synthetic_schema.csv')
+        write_synthetic_schema(csv_file, rows)
+        size_mb = os.path.getsize(csv_file) / 2**20
+        print(f"Parsing {rows:,} synthetic schema rows ({size_mb:.1f} MB) on {os.cpu_count()} CPUs")
+        
+        baseline = None
+        for workers in WORKER_COUNTS:
+            parser = CSVSchemaParser(workers=workers)
+            start = time.perf_counter()
+            fields = parser.parse_csv(csv_file)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"  {workers} worker(s) {len(fields):>9} fields  {elapsed:8.3f}s  "
+                  f"{rows / elapsed:>12,.0f} rows/sec  {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Parser Benchmark - Compares rows/sec of the row-by-row, vectorized and stdlib parsers
+
+Usage:
+    python benchmarks/bench_parser.py [rows]
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from benchmarks.synthetic import write_synthetic_schema
+from src.csv_parser import CSVSchemaParser, SchemaField
+
+
+# Fixed column layout the row-by-row parser expected
+LEGACY_COLUMNS = ['xpath', 'required/optional', 'data_type', 'model1', 'model2', 'model3', 'model4']
+
+
+def parse_with_iterrows(file_path: str) -> list:
+    """Row-by-row parser that parse_csv used before vectorization, kept as the baseline."""
+    df = pd.read_csv(file_path)
+    schema_fields = []
+    for _, row in df.iterrows():
+        if pd.isna(row['xpath']) or row['xpath'].strip() == '':
+            continue
+        
+        additional_info = []
+        for col in df.columns:
+            if col.lower().strip() not in [req_col.lower().strip() for req_col in LEGACY_COLUMNS]:
+                if pd.notna(row[col]) and str(row[col]).strip():
+                    additional_info.append(f"{col}: {str(row[col]).strip()}")
+        
+        schema_fields.append(SchemaField(
+            xpath=str(row['xpath']).strip(),
+            required=str(row['required/optional']).strip(),
+            data_type=str(row['data_type']).strip(),
+            model_values=tuple(
+                str(row[col]).strip() if pd.notna(row[col]) else ''
+                for col in ['model1', 'model2', 'model3', 'model4']
+            ),
+            additional_info=' | '.join(additional_info) if additional_info else ''
+        ))
+    return schema_fields
+
+
+def time_parse(label: str, parse, rows: int) -> float:
+    """Run a parse function once and print its throughput."""
+    start = time.perf_counter()
+    fields = parse()
+    elapsed = time.perf_counter() - start
+    rate = rows / elapsed
+    print(f"  {label:<12} {len(fields):>8} fields  {elapsed:8.3f}s  {rate:>12,.0f} rows/sec")
+    return rate
+
+
+def main():
+    """Benchmark each parser on a synthetic schema"""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_file = os.path.join(temp_dir, 'synthetic_schema.csv')
+        write_synthetic_schema(csv_file, rows)
+        print(f"Parsing {rows:,} synthetic schema rows")
+        
+        pandas_parser = CSVSchemaParser(engine='pandas')
+        stdlib_parser = CSVSchemaParser(engine='stdlib')
+        before = time_parse('iterrows', lambda: parse_with_iterrows(csv_file), rows)
+        vectorized = time_parse('vectorized', lambda: pandas_parser.parse_csv(csv_file), rows)
+        stdlib = time_parse('stdlib', lambda: stdlib_parser.parse_csv(csv_file), rows)
+        print(f"  Speedup: vectorized {vectorized / before:.1f}x, stdlib {stdlib / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Render Benchmark - Compares classes/sec of the template renderer and the line-by-line emitter
+
+Usage:
+    python benchmarks/bench_render.py [field counts...]
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.java_structure import METHOD_CHUNK_FIELDS, JavaStructureGenerator
+from src.model_generator import Model, ModelField
+
+
+DATA_TYPES = ['String', 'Integer', 'Long', 'Boolean', 'LocalDate', 'BigDecimal', 'Double', 'List<String>']
+
+# Minimum time spent rendering each model, so small models are timed over several runs
+MIN_SECONDS = 1.0
+
+
+class LegacyJavaEmitter(JavaStructureGenerator):
+    """
+    Line-by-line emitter that _generate_java_class used before templates, kept as the baseline.
+    
+    toString, equals and hashCode of models wider than METHOD_CHUNK_FIELDS are
+    split into helper methods, which the line-by-line emitter never did; for
+    those it emits the renderer's methods, so both emitters produce the same class.
+    """
+    
+    def _generate_java_class(self, model: Model) -> str:
+        """
+        Generate Java class content for a model.
+        
+        Args:
+            model: Model object to generate Java class for
+        
+        Returns:
+            Java class content as string
+        """
+        # Collect required imports
+        required_imports = self._get_required_imports(model)
+        
+        # Generate class content
+        class_content = []
+        
+        # Package declaration
+        class_content.append(f"package {model.package_name};")
+        class_content.append("")
+        
+        # Imports
+        if required_imports:
+            for import_statement in sorted(required_imports):
+                class_content.append(f"import {import_statement};")
+            class_content.append("")
+        
+        # Class documentation
+        class_content.append("/**")
+        class_content.append(f" * {model.class_name} - Auto-generated model class")
+        class_content.append(" * Generated from CSV schema definition")
+        class_content.append(" */")
+        
+        # Class declaration
+        class_content.append(f"public class {model.class_name} {{")
+        class_content.append("")
+        
+        # Field declarations
+        for field in model.fields:
+            class_content.extend(self._generate_field_declaration(field))
+        
+        # Default constructor
+        class_content.append("    /**")
+        class_content.append("     * Default constructor")
+        class_content.append("     */")
+        class_content.append(f"    public {model.class_name}() {{")
+        class_content.append("    }")
+        class_content.append("")
+        
+        # Parameterized constructor
+        if model.fields:
+            class_content.extend(self._generate_parameterized_constructor(model))
+        
+        # Getters and setters
+        for field in model.fields:
+            class_content.extend(self._generate_getter_setter(field))
+        
+        # toString method
+        class_content.extend(self._generate_to_string_method(model))
+        
+        # equals and hashCode methods
+        class_content.extend(self._generate_equals_method(model))
+        class_content.extend(self._generate_hash_code_method(model))
+        
+        # Close class
+        class_content.append("}")
+        
+        return "\n".join(class_content)
+    
+    def _get_required_imports(self, model: Model) -> set:
+        """Get required import statements for the model."""
+        required_imports = set()
+        
+        for field in model.fields:
+            data_type = field.data_type
+            if data_type in self.imports:
+                required_imports.add(self.imports[data_type])
+            elif data_type.startswith('List<'):
+                required_imports.add(self.imports['List'])
+        
+        return required_imports
+    
+    def _generate_field_declaration(self, field: ModelField) -> list:
+        """Generate field declaration with comprehensive documentation."""
+        lines = []
+        
+        # Field documentation
+        lines.append("    /**")
+        
+        # XPath information
+        if field.xpath:
+            lines.append(f"     * xpath: {field.xpath}")
+        
+        # Required/Optional status
+        if field.required_optional_status:
+            lines.append(f"     * required/optional: {field.required_optional_status}")
+        
+        # Data type
+        lines.append(f"     * data_type: {field.data_type}")
+        
+        # Model value for this specific model
+        if field.model_value:
+            lines.append(f"     * model_value: {field.model_value}")
+        
+        # Additional info from extra columns
+        if field.additional_info:
+            lines.append(f"     * additional_info: {field.additional_info}")
+        
+        # Default value
+        if field.default_value:
+            lines.append(f"     * default_value: {field.default_value}")
+        
+        lines.append("     */")
+        
+        # Field declaration
+        field_line = f"    private {field.data_type} {field.name}"
+        if field.default_value and field.data_type == "String":
+            field_line += f' = "{field.default_value}"'
+        field_line += ";"
+        
+        lines.append(field_line)
+        lines.append("")
+        
+        return lines
+    
+    def _generate_parameterized_constructor(self, model: Model) -> list:
+        """Generate parameterized constructor."""
+        lines = []
+        
+        # Constructor documentation
+        lines.append("    /**")
+        lines.append("     * Parameterized constructor")
+        for field in model.fields:
+            lines.append(f"     * @param {field.name} {field.description or field.name}")
+        lines.append("     */")
+        
+        # Constructor signature
+        params = [f"{field.data_type} {field.name}" for field in model.fields]
+        lines.append(f"    public {model.class_name}({', '.join(params)}) {{")
+        
+        # Constructor body
+        for field in model.fields:
+            lines.append(f"        this.{field.name} = {field.name};")
+        
+        lines.append("    }")
+        lines.append("")
+        
+        return lines
+    
+    def _generate_getter_setter(self, field: ModelField) -> list:
+        """Generate getter and setter methods for a field."""
+        lines = []
+        
+        # Getter
+        getter_name = f"get{field.name.capitalize()}"
+        lines.append(f"    /**")
+        lines.append(f"     * Get {field.name}")
+        lines.append(f"     * @return {field.data_type}")
+        lines.append(f"     */")
+        lines.append(f"    public {field.data_type} {getter_name}() {{")
+        lines.append(f"        return {field.name};")
+        lines.append("    }")
+        lines.append("")
+        
+        # Setter
+        setter_name = f"set{field.name.capitalize()}"
+        lines.append(f"    /**")
+        lines.append(f"     * Set {field.name}")
+        lines.append(f"     * @param {field.name} {field.data_type}")
+        lines.append(f"     */")
+        lines.append(f"    public void {setter_name}({field.data_type} {field.name}) {{")
+        lines.append(f"        this.{field.name} = {field.name};")
+        lines.append("    }")
+        lines.append("")
+        
+        return lines
+    
+    def _generate_to_string_method(self, model: Model) -> list:
+        """Generate toString method."""
+        if len(model.fields) > METHOD_CHUNK_FIELDS:
+            return _lines(super()._generate_to_string_method(model))
+        
+        lines = []
+        
+        lines.append("    /**")
+        lines.append("     * String representation of the object")
+        lines.append("     * @return String")
+        lines.append("     */")
+        lines.append("    @Override")
+        lines.append("    public String toString() {")
+        
+        if model.fields:
+            field_strings = [f'"{field.name}=" + {field.name}' for field in model.fields]
+            toString_content = f'"{model.class_name}{{" + ' + ' + ", " + '.join(field_strings) + ' + "}"'
+            lines.append(f"        return {toString_content};")
+        else:
+            lines.append(f'        return "{model.class_name}{{}}";')
+        
+        lines.append("    }")
+        lines.append("")
+        
+        return lines
+    
+    def _generate_equals_method(self, model: Model) -> list:
+        """Generate equals method."""
+        if len(model.fields) > METHOD_CHUNK_FIELDS:
+            return _lines(super()._generate_equals_method(model))
+        
+        lines = []
+        
+        lines.append("    /**")
+        lines.append("     * Check equality with another object")
+        lines.append("     * @param obj Object to compare")
+        lines.append("     * @return boolean")
+        lines.append("     */")
+        lines.append("    @Override")
+        lines.append("    public boolean equals(Object obj) {")
+        lines.append("        if (this == obj) return true;")
+        lines.append("        if (obj == null || getClass() != obj.getClass()) return false;")
+        lines.append(f"        {model.class_name} that = ({model.class_name}) obj;")
+        
+        if model.fields:
+            conditions = []
+            for field in model.fields:
+                if field.data_type in ['String', 'BigDecimal'] or field.data_type.startswith('List'):
+                    conditions.append(f"java.util.Objects.equals({field.name}, that.{field.name})")
+                else:
+                    conditions.append(f"java.util.Objects.equals({field.name}, that.{field.name})")
+            
+            lines.append(f"        return {' && '.join(conditions)};")
+        else:
+            lines.append("        return true;")
+        
+        lines.append("    }")
+        lines.append("")
+        
+        return lines
+    
+    def _generate_hash_code_method(self, model: Model) -> list:
+        """Generate hashCode method."""
+        if len(model.fields) > METHOD_CHUNK_FIELDS:
+            return _lines(super()._generate_hash_code_method(model))
+        
+        lines = []
+        
+        lines.append("    /**")
+        lines.append("     * Generate hash code")
+        lines.append("     * @return int")
+        lines.append("     */")
+        lines.append("    @Override")
+        lines.append("    public int hashCode() {")
+        
+        if model.fields:
+            field_names = [field.name for field in model.fields]
+            lines.append(f"        return java.util.Objects.hash({', '.join(field_names)});")
+        else:
+            lines.append("        return 0;")
+        
+        lines.append("    }")
+        lines.append("")
+        
+        return lines
+
+
+def _lines(fragments) -> list:
+    """Split rendered fragments into the lines the line-by-line emitter would produce."""
+    return "".join(fragments).split("\n")[:-1]
+
+
+def build_model(field_count: int) -> Model:
+    """Build a model with the given number of documented fields."""
+    fields = [
+        ModelField(
+            name=f"field{index}",
+            data_type=DATA_TYPES[index % len(DATA_TYPES)],
+            required=index % 2 == 0,
+            default_value=f"value{index}" if index % 3 else None,
+            description=f"Field mapped from XPath: /root/element{index % 20}/field_{index}",
+            xpath=f"/root/element{index % 20}/field_{index}",
+            required_optional_status='required' if index % 2 == 0 else 'optional',
+            model_value=f"value{index}",
+            additional_info=f"validation_rules: maxLength:{index % 200}"
+        )
+        for index in range(field_count)
+    ]
+    return Model(name="Model1", fields=fields)
+
+
+def time_render(label: str, render, model: Model) -> float:
+    """Render a model repeatedly for at least MIN_SECONDS and print classes/sec."""
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        render(model)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SECONDS:
+            break
+    rate = runs / elapsed
+    print(f"  {label:<10} {runs:>6} runs  {elapsed / runs * 1000:10.1f} ms/class  {rate:>10,.2f} classes/sec")
+    return rate
+
+
+def main():
+    """Benchmark both emitters on models of increasing size"""
+    field_counts = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000]
+    legacy = LegacyJavaEmitter()
+    renderer = JavaStructureGenerator()
+    
+    for field_count in field_counts:
+        model = build_model(field_count)
+        if renderer._generate_java_class(model) != legacy._generate_java_class(model):
+            raise SystemExit(f"Rendered output differs from the legacy emitter for {field_count} fields")
+        
+        print(f"Rendering a {field_count:,}-field model")
+        before = time_render('legacy', legacy._generate_java_class, model)
+        after = time_render('template', renderer._generate_java_class, model)
+        print(f"  Speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
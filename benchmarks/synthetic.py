@@ -0,0 +1,45 @@
+"""
+Synthetic Schema Builder
+
+Writes large schema CSV files in the same format as sample_schema.csv for benchmarking.
+"""
+
+import csv
+import random
+
+
+DATA_TYPES = ['string', 'integer', 'long', 'boolean', 'date', 'decimal', 'double', 'list']
+MODEL_VALUES = ['do not use', 'skip', 'value', 'name', 'code']
+
+
+def write_synthetic_schema(file_path: str, rows: int, models: int = 4, depth: int = 4, seed: int = 42) -> None:
+    """
+    Write a synthetic schema CSV file.
+    
+    Args:
+        file_path: Path of the CSV file to write
+        rows: Number of schema rows
+        models: Number of modelN columns
+        depth: Number of XPath segments below the root element
+        seed: Random seed so repeated runs produce the same file
+    """
+    rng = random.Random(seed)
+    header = ['xpath', 'required/optional', 'data_type']
+    header += [f"model{model_num}" for model_num in range(1, models + 1)]
+    header += ['validation_rules']
+    
+    with open(file_path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(header)
+        for row_num in range(rows):
+            segments = [f"element{rng.randrange(20)}" for _ in range(depth - 1)]
+            segments.append(f"field_{row_num}")
+            row = [
+                '/root/' + '/'.join(segments),
+                rng.choice(['required', 'optional']),
+                rng.choice(DATA_TYPES),
+            ]
+            row += [f"{rng.choice(MODEL_VALUES)}{row_num}" if rng.random() > 0.2 else 'do not use'
+                    for _ in range(models)]
+            row.append(f"maxLength:{rng.randrange(1, 200)}")
+            writer.writerow(row)
@@ -7,10 +7,23 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.encoding_detector import open_text
 from src.uml_generator import UMLGenerator
 import csv
 
 
+def schema_field_items(generator, schema_field):
+    """Get the column name and value pairs of a parsed schema field"""
+    items = [
+        ('xpath', schema_field.xpath),
+        ('required/optional', schema_field.required),
+        ('data_type', schema_field.data_type),
+    ]
+    items.extend(zip(generator.parser.model_columns, schema_field.model_values))
+    items.append(('additional_info', schema_field.additional_info))
+    return items
+
+
 def debug_csv_parsing(csv_file_path):
     """Debug CSV parsing to identify issues"""
     print(f"🔍 Debugging CSV file: {csv_file_path}")
@@ -22,18 +35,19 @@ def debug_csv_parsing(csv_file_path):
     
     try:
         # Check file encoding and content
-        with open(csv_file_path, 'r', encoding='utf-8') as f:
+        with open_text(csv_file_path) as (f, detected):
             first_lines = [f.readline().strip() for _ in range(5)]
         
+        bom_note = f" (BOM {detected.bom!r} stripped)" if detected.bom else ""
+        print(f"🔤 Detected encoding: {detected.encoding}{bom_note}")
         print("📄 First 5 lines of file:")
         for i, line in enumerate(first_lines, 1):
             print(f"  {i}: {repr(line)}")
         
         # Check CSV delimiter detection
         print("\n🔍 CSV Delimiter Detection:")
-        with open(csv_file_path, 'r', encoding='utf-8') as f:
+        with open_text(csv_file_path) as (f, _):
             sample = f.read(1024)
-            f.seek(0)
             sniffer = csv.Sniffer()
             try:
                 delimiter = sniffer.sniff(sample).delimiter
@@ -44,7 +58,7 @@ def debug_csv_parsing(csv_file_path):
                 print(f"  Using default delimiter: {repr(delimiter)}")
         
         # Check column headers
-        with open(csv_file_path, 'r', encoding='utf-8') as f:
+        with open_text(csv_file_path) as (f, _):
             reader = csv.DictReader(f, delimiter=delimiter)
             headers = reader.fieldnames
             print(f"  Column headers: {headers}")
@@ -64,21 +78,22 @@ def debug_csv_parsing(csv_file_path):
         generator = UMLGenerator()
         schema_data = generator._parse_csv_file(csv_file_path)
         
-        print(f"📊 Parsed {len(schema_data)} rows")
+        print(f"📊 Parsed {len(schema_data)} rows (delimiter: {repr(generator.parser.delimiter)}, "
+              f"encoding: {generator.parser.encoding})")
         print("\n🔍 First 3 parsed rows:")
         
         for i, row in enumerate(schema_data[:3]):
             print(f"\nRow {i+1}:")
-            for key, value in row.items():
+            for key, value in schema_field_items(generator, row):
                 print(f"  '{key}': '{value}'")
             
             # Test XPath conversion
-            xpath = row.get('xpath', '')
+            xpath = row.xpath
             print(f"  XPath: '{xpath}' (type: {type(xpath).__name__}, len: {len(xpath) if xpath is not None else 0})")
             
             # DEBUG: Let's check all possible column names that might contain the XPath
             print("  🔍 DEBUGGING column names:")
-            for key, value in row.items():
+            for key, value in schema_field_items(generator, row):
                 if value and ('/' in str(value) or '@' in str(value)):  # Looks like an XPath
                     print(f"      Column '{key}' (len={len(key)}, repr={repr(key)}): '{value}'")
                     # Try using this value for field name conversion
@@ -115,19 +130,18 @@ def debug_csv_parsing(csv_file_path):
         
         # Test model field extraction
         print("🏗️ Model field extraction test:")
-        for model_num in range(1, 5):
-            model_column = f"model{model_num}"
-            fields = generator._get_model_fields(schema_data, model_column)
+        for model_num, model_column in enumerate(generator.parser.model_columns, start=1):
+            fields = generator._get_model_fields(schema_data, model_num)
             print(f"  Model{model_num} ({model_column}): {len(fields)} fields")
             if fields:
                 print(f"    First 3 fields: {fields[:3]}")
             else:
                 print(f"    No fields found!")
                 # Debug why no fields
-                print(f"    Available columns: {list(schema_data[0].keys()) if schema_data else 'No data'}")
+                print(f"    Available columns: {[key for key, _ in schema_field_items(generator, schema_data[0])] if schema_data else 'No data'}")
                 if schema_data:
                     sample_row = schema_data[0]
-                    model_value = sample_row.get(model_column, 'MISSING_COLUMN')
+                    model_value = sample_row.model_value(model_num)
                     print(f"    Sample {model_column} value: '{model_value}'")
     
     except Exception as e:
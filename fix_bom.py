@@ -7,6 +7,8 @@ The BOM (Byte Order Mark) \ufeff causes column name mismatches
 import sys
 import os
 
+from src.encoding_detector import open_text
+
 
 def fix_bom_in_csv(input_file, output_file=None):
     """Remove BOM from CSV file"""
@@ -23,34 +25,16 @@ def fix_bom_in_csv(input_file, output_file=None):
         print(f"🔄 Removing BOM from: {input_file} → {output_file}")
     
     try:
-        # Read the file and check for BOM
-        with open(input_file, 'rb') as f:
-            raw_content = f.read()
-        
-        print(f"📄 Original file size: {len(raw_content)} bytes")
+        # Read the file once, detecting its encoding and stripping any BOM
+        print(f"📄 Original file size: {os.path.getsize(input_file)} bytes")
+        with open_text(input_file) as (f, detected):
+            content = f.read()
         
-        # Check if file starts with UTF-8 BOM
-        if raw_content.startswith(b'\xef\xbb\xbf'):
-            print("🔍 UTF-8 BOM detected! Removing...")
-            # Remove the BOM (first 3 bytes)
-            raw_content = raw_content[3:]
-            print(f"✅ BOM removed. New size: {len(raw_content)} bytes")
-        else:
-            print("ℹ️  No UTF-8 BOM found, but checking for other issues...")
-        
-        # Convert to text and check for Unicode BOM character
-        try:
-            content = raw_content.decode('utf-8')
-        except UnicodeDecodeError:
-            # Try other encodings
-            try:
-                content = raw_content.decode('utf-8-sig')  # This automatically removes BOM
-                print("✅ Decoded with UTF-8-SIG (BOM handling)")
-            except UnicodeDecodeError:
-                content = raw_content.decode('windows-1252')
-                print("✅ Decoded with Windows-1252")
+        if detected.bom:
+            print(f"🔍 {detected.encoding.upper()} BOM {detected.bom!r} detected and removed")
         else:
-            print("✅ Decoded with UTF-8")
+            print("ℹ️  No BOM found, but checking for other issues...")
+        print(f"✅ Decoded with {detected.encoding}")
         
         # Remove Unicode BOM character if present
         if content.startswith('\ufeff'):
@@ -62,8 +46,8 @@ def fix_bom_in_csv(input_file, output_file=None):
         first_line = content.split('\n')[0]
         print(f"📋 First line after cleaning: {repr(first_line)}")
         
-        # Write the cleaned content
-        with open(output_file, 'w', encoding='utf-8') as f:
+        # Write the cleaned content as UTF-8 without a BOM
+        with open(output_file, 'w', encoding='utf-8', newline='') as f:
             f.write(content)
         
         print(f"\n✅ BOM removal completed!")
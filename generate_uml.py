@@ -8,6 +8,8 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.csv_parser import CSVSchemaParser
+from src.schema_cache import SchemaCache
 from src.uml_generator import UMLGenerator
 
 
@@ -38,7 +40,8 @@ def main():
     
     try:
         # Generate UML diagram
-        generator = UMLGenerator()
+        # Reuse parsed schemas from $CSV_SCHEMA_CACHE_DIR when it is set
+        generator = UMLGenerator(CSVSchemaParser(cache=SchemaCache.from_env()))
         generator.generate_plantuml(csv_file, output_file)
         
         print(f"✅ UML diagram generated successfully!")
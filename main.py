@@ -3,35 +3,116 @@
 CSV to Java Structure Generator
 
 This application reads a CSV file containing XPath schema information and generates
-Java-like class structures for four different models.
+Java-like class structures for each model column (model1..modelN).
 
 Usage:
-    python main.py <csv_file_path> [output_directory]
+    python main.py <csv_file_path> [output_directory] [--engine=stdlib|pandas] [--java] [--uml] [--nested]
+          [--style=pojo|immutable|record] [--xml-readers] [--json] [--mappers]
+          [--tostring=concat|builder] [--tostring-max-items=N] [--shared-base]
 
 CSV Format:
-    xpath, required/optional, data_type, model1, model2, model3, model4
+    xpath, required/optional, data_type, model1, model2, ..., modelN
 """
 
+import argparse
 import sys
 import os
 from pathlib import Path
 from typing import Optional
 
-from src.csv_parser import CSVSchemaParser
-from src.model_generator import ModelGenerator
-from src.java_structure import JavaStructureGenerator
+from src.csv_parser import CSVSchemaParser, ENGINES
+from src.schema_cache import SchemaCache, CACHE_DIR_ENV, DEFAULT_MAX_BYTES
+from src.java_structure import JavaStructureGenerator, STYLES, TO_STRING_MODES
+from src.model_generator import MAX_CONSTRUCTOR_SLOTS, ModelGenerator
+from src.uml_generator import UMLGenerator
+
+
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    arg_parser = argparse.ArgumentParser(
+        description="Generate Java class structures from a CSV schema file.",
+        epilog="Example: python main.py schema.csv output/"
+    )
+    arg_parser.add_argument("csv_file_path", help="Path to the CSV schema file")
+    arg_parser.add_argument("output_dir", nargs="?", default="output",
+                            help="Output directory for generated files (default: output)")
+    arg_parser.add_argument("--java", action="store_true",
+                            help="Generate Java model classes (default when --uml is not given)")
+    arg_parser.add_argument("--uml", action="store_true",
+                            help="Generate a PlantUML diagram; with --java the schema is parsed once for both")
+    arg_parser.add_argument("--uml-output",
+                            help="Path of the PlantUML diagram (default: <output_dir>/schema_uml.puml)")
+    arg_parser.add_argument("--nested", action="store_true",
+                            help="Generate a nested class per XPath element instead of one flat class per model")
+    arg_parser.add_argument("--style", choices=STYLES, default="pojo",
+                            help="Java output: mutable classes, immutable classes with a cached hashCode, "
+                                 "or records (default: pojo)")
+    arg_parser.add_argument("--shared-base", action="store_true",
+                            help="Move the fields every model maps from the same XPath into an abstract "
+                                 "ModelBase class extended by the models")
+    arg_parser.add_argument("--tostring", choices=TO_STRING_MODES, default="concat",
+                            help="toString as one string concatenation, or appending to a presized "
+                                 "StringBuilder (default: concat)")
+    arg_parser.add_argument("--tostring-max-items", type=int,
+                            help="With --tostring=builder, show at most this many elements of each List field")
+    arg_parser.add_argument("--xml-readers", action="store_true",
+                            help="Generate a StAX fromXml(XMLStreamReader) method per model")
+    arg_parser.add_argument("--json", action="store_true",
+                            help="Generate reflection-free writeJson/readJson methods per model and a JsonSupport class")
+    arg_parser.add_argument("--mappers", action="store_true",
+                            help="Generate ModelXToModelYMapper classes copying fields mapped from the same XPath")
+    arg_parser.add_argument("--max-slots", type=int, default=MAX_CONSTRUCTOR_SLOTS,
+                            help="Split classes whose constructor needs more parameter slots than this into "
+                                 "component classes grouped by XPath parent; 0 disables (default: %(default)s)")
+    arg_parser.add_argument("--primitives", action="store_true",
+                            help="Use int/long/double/float/boolean for required numeric and boolean fields")
+    arg_parser.add_argument("--fast-equals", action="store_true",
+                            help="Generate an unrolled hashCode and a short-circuit equals without Objects.hash")
+    arg_parser.add_argument("--benchmarks", action="store_true",
+                            help="Generate a JMH benchmark harness per model (and of the mappers, with --mappers) "
+                                 "in <output_dir>/benchmarks")
+    arg_parser.add_argument("--stats", action="store_true",
+                            help="Print name and type conversion cache statistics")
+    arg_parser.add_argument("--engine", choices=ENGINES, default="stdlib",
+                            help="CSV ingestion engine; pandas is only imported when selected (default: stdlib)")
+    arg_parser.add_argument("--workers", type=int, default=1,
+                            help="Parse large CSV files in parallel with this many processes (stdlib engine, default: 1)")
+    arg_parser.add_argument("--jobs", type=int, default=1,
+                            help="Render and write this many model files concurrently (default: 1)")
+    arg_parser.add_argument("--cache-dir", default=os.environ.get(CACHE_DIR_ENV),
+                            help=f"Cache parsed schemas in this directory (default: ${CACHE_DIR_ENV}, unset disables caching)")
+    arg_parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                            help="Maximum size of the schema cache in MB (default: %(default)s)")
+    args = arg_parser.parse_args(argv)
+    if args.xml_readers and args.nested:
+        arg_parser.error("--xml-readers reads flat models only and cannot be combined with --nested")
+    if args.mappers and args.nested:
+        arg_parser.error("--mappers maps flat models only and cannot be combined with --nested")
+    if args.shared_base and (args.nested or args.style == "record"):
+        arg_parser.error("--shared-base cannot be combined with --nested or --style=record")
+    if args.tostring_max_items is not None and (args.tostring != "builder" or args.tostring_max_items < 0):
+        arg_parser.error("--tostring-max-items must be at least 0 and requires --tostring=builder")
+    if args.max_slots == 1 or args.max_slots < 0:
+        arg_parser.error("--max-slots must be 0 or at least 2")
+    return args
+
+
+def print_cache_stats(model_generator: ModelGenerator) -> None:
+    """Print hit/miss statistics of the model generator's conversion caches."""
+    print("\nConversion cache statistics:")
+    for cache_name, info in model_generator.cache_stats().items():
+        lookups = info.hits + info.misses
+        hit_rate = info.hits / lookups if lookups else 0.0
+        print(f"  {cache_name:<11} hits={info.hits} misses={info.misses} "
+              f"hit_rate={hit_rate:.1%} size={info.currsize}/{info.maxsize}")
 
 
 def main():
     """Main entry point for the application."""
-    if len(sys.argv) < 2:
-        print("Usage: python main.py <csv_file_path> [output_directory]")
-        print("\nExample:")
-        print("python main.py schema.csv output/")
-        sys.exit(1)
-    
-    csv_file_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else "output"
+    args = parse_args()
+    csv_file_path = args.csv_file_path
+    output_dir = args.output_dir
+    generate_java = args.java or not args.uml
     
     # Validate input file
     if not os.path.exists(csv_file_path):
@@ -44,21 +125,51 @@ def main():
     try:
         # Parse CSV schema
         print(f"Reading schema from {csv_file_path}...")
-        parser = CSVSchemaParser()
-        schema_data = parser.parse_csv(csv_file_path)
+        cache = SchemaCache(args.cache_dir, args.cache_max_mb * 1024 * 1024) if args.cache_dir else None
+        parser = CSVSchemaParser(engine=args.engine, cache=cache, workers=args.workers)
+        
+        if args.uml:
+            # Both outputs share one parsed copy of the schema
+            schema_fields = parser.parse_csv(csv_file_path)
+        else:
+            # Java only; stream the schema straight into model generation
+            schema_fields = parser.iter_fields(csv_file_path)
         
-        # Generate models
-        print("Generating Java-like class structures...")
-        model_generator = ModelGenerator()
-        models = model_generator.generate_models(schema_data)
+        if generate_java:
+            print("Generating Java-like class structures...")
+            model_generator = ModelGenerator(primitives=args.primitives, max_slots=args.max_slots or None)
+            java_generator = JavaStructureGenerator(
+                jobs=args.jobs, fast_equals=args.fast_equals, benchmarks=args.benchmarks,
+                style=args.style, xml_readers=args.xml_readers, json=args.json,
+                mappers=args.mappers, to_string=args.tostring, to_string_max_items=args.tostring_max_items,
+                shared_base=args.shared_base
+            )
+            models = java_generator.generate_from_schema(
+                schema_fields, output_dir, model_generator, nested=args.nested
+            )
+            
+            print(f"\nSuccess! Generated {len(models)} model files in '{output_dir}' directory:")
+            skipped_files = set(java_generator.skipped_files)
+            for model_name in models.keys():
+                file_name = f"{model_name}.java"
+                print(f"  - {file_name}{' (unchanged)' if file_name in skipped_files else ''}")
+            print(f"Wrote {len(java_generator.written_files)} files, "
+                  f"skipped {len(skipped_files)} unchanged files.")
+            
+            name_conflicts = model_generator.name_conflicts
+            if name_conflicts:
+                print(f"\nWarning: renamed {len(name_conflicts)} duplicate field names:")
+                for conflict in name_conflicts:
+                    print(f"  - {conflict}")
+            
+            if args.stats:
+                print_cache_stats(model_generator)
         
-        # Generate Java structure files
-        java_generator = JavaStructureGenerator()
-        java_generator.generate_java_files(models, output_dir)
+        print(f"Schema encoding: {parser.encoding}, delimiter: {parser.delimiter!r}")
         
-        print(f"\nSuccess! Generated {len(models)} model files in '{output_dir}' directory:")
-        for model_name in models.keys():
-            print(f"  - {model_name}.java")
+        if args.uml:
+            uml_output = args.uml_output or os.path.join(output_dir, "schema_uml.puml")
+            UMLGenerator(parser).write_plantuml(schema_fields, uml_output)
         
     except Exception as e:
         print(f"Error: {e}")
@@ -4,45 +4,300 @@ CSV Schema Parser Module
 This module handles reading and parsing CSV files containing XPath schema information.
 """
 
-import pandas as pd
-from typing import List, Dict, Any
-from dataclasses import dataclass
+import csv
+import io
+import os
+import re
+from functools import partial
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Callable, List, Dict, Generator, Iterable, Iterator, NamedTuple, Optional, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field
+from sys import intern
 
+from src.encoding_detector import (
+    SAMPLE_BYTES, DetectedEncoding, detect_encoding, fallback_encoding, find_undecodable_byte, open_text
+)
+from src.schema_cache import SchemaCache
 
-@dataclass
+if TYPE_CHECKING:
+    import mmap
+    import pandas as pd
+
+
+# Number of CSV rows read into memory at a time by the pandas engine
+DEFAULT_CHUNKSIZE = 10000
+
+# Available ingestion engines; pandas is only imported when its engine is used
+ENGINES = ('stdlib', 'pandas')
+
+# Delimiters recognized in the CSV header, in order of preference
+DELIMITERS = (',', ';', '\t', '|')
+
+# Files smaller than this are parsed in-process even when workers are requested
+MIN_PARALLEL_BYTES = 4 * 1024 * 1024
+
+# Smallest byte range handed to a worker process by the parallel parser
+MIN_CHUNK_BYTES = 1024 * 1024
+
+# Version of the parsed schema format; bump whenever parsing results change
+# so that cached schemas from older versions are not reused
+PARSER_VERSION = 3
+
+
+# Model columns are named model1, model2, ... modelN
+MODEL_COLUMN_PATTERN = re.compile(r'model(\d+)')
+
+# Values treated as "required" in the required/optional column
+REQUIRED_VALUES = frozenset(['required', 'true', 'yes', '1'])
+
+
+@dataclass(slots=True)
 class SchemaField:
-    """Represents a single field from the schema CSV."""
+    """
+    Represents a single field from the schema CSV.
+    
+    Instances are slotted, and the short, highly repetitive values (required
+    status, data type, model values) are interned so that every row shares
+    one copy of each distinct string. The derived field name and required
+    flag are computed once on creation.
+    """
     xpath: str
     required: str  # Changed to string to preserve original value
     data_type: str
-    model1_value: str
-    model2_value: str
-    model3_value: str
-    model4_value: str
+    model_values: Tuple[str, ...]  # One value per modelN column, in column order
     additional_info: str = ""  # For any additional columns
+    _field_name: str = field(init=False, repr=False, compare=False)
+    _is_required: bool = field(init=False, repr=False, compare=False)
     
-    @property
-    def field_name(self) -> str:
-        """Extract field name from XPath."""
+    def __post_init__(self):
+        self.required = intern(self.required)
+        self.data_type = intern(self.data_type)
+        self.model_values = tuple(map(intern, self.model_values))
+        self.additional_info = intern(self.additional_info)
+        
         # Extract the last element from xpath as field name
         # e.g., "/root/person/name" -> "name"
         parts = self.xpath.strip('/').split('/')
-        return parts[-1] if parts else 'field'
+        self._field_name = intern(parts[-1] if parts else 'field')
+        self._is_required = self.required.lower() in REQUIRED_VALUES
+    
+    @property
+    def field_name(self) -> str:
+        """Extract field name from XPath."""
+        return self._field_name
     
     @property
     def is_required(self) -> bool:
         """Check if field is required."""
-        return self.required.lower() in ['required', 'true', 'yes', '1']
+        return self._is_required
+    
+    def model_value(self, model_num: int) -> str:
+        """Get the value for a specific model (1-based), or '' if there is no such model."""
+        if 1 <= model_num <= len(self.model_values):
+            return self.model_values[model_num - 1]
+        return ''
+
+
+class RowLayout(NamedTuple):
+    """Column positions used to convert CSV rows into SchemaField objects."""
+    columns: Tuple[str, ...]
+    width: int
+    required_positions: Tuple[int, ...]
+    model_positions: Tuple[int, ...]
+    extra_columns: Tuple[Tuple[str, int], ...]  # (label, position) pairs
+
+
+def _detect_delimiter(header_line: str) -> str:
+    """
+    Detect the delimiter of a CSV file from its header line.
+    
+    Args:
+        header_line: First line of the CSV file
+        
+    Returns:
+        The delimiter occurring most often in the header, or ',' if none occurs
+    """
+    count, _, delimiter = max(
+        (header_line.count(candidate), -preference, candidate)
+        for preference, candidate in enumerate(DELIMITERS)
+    )
+    return delimiter if count else ','
+
+
+def _warn_missing_xpath(row_num: int, columns: Iterable[str], row: Iterable[str]) -> None:
+    """
+    Report a row that is skipped because it has data but no xpath.
+    
+    Args:
+        row_num: Line number of the row in the CSV file
+        columns: Column names from the header
+        row: Cell values of the row
+    """
+    cleaned_row = {column.strip(): value.strip() for column, value in zip(columns, row)}
+    print(f"⚠️  Warning: Row {row_num} has data but missing xpath: {cleaned_row}")
+
+
+def _rows_to_values(rows: Iterable[List[str]], layout: RowLayout,
+                    on_missing_xpath: Optional[Callable[[List[str]], None]] = None) -> Iterator[Tuple]:
+    """
+    Convert csv module rows into SchemaField constructor arguments.
+    
+    Args:
+        rows: Rows of cell values, without the header
+        layout: Column positions resolved from the header
+        on_missing_xpath: Called with every skipped row that has data but no xpath
+        
+    Yields:
+        (xpath, required, data_type, model_values, additional_info) for every non-empty row
+    """
+    required_values = itemgetter(*layout.required_positions)
+    model_positions = layout.model_positions
+    extra_columns = layout.extra_columns
+    width = layout.width
+    
+    for row in rows:
+        # Short rows (including blank lines) are padded with empty cells
+        if len(row) < width:
+            row += [''] * (width - len(row))
+        
+        xpath, required, data_type = (value.strip() for value in required_values(row))
+        
+        # Skip empty rows
+        if not xpath:
+            if on_missing_xpath is not None and any(value.strip() for value in row):
+                on_missing_xpath(row)
+            continue
+        
+        additional_info = ' | '.join(
+            label + row[index].strip() for label, index in extra_columns if row[index].strip()
+        )
+        
+        yield (
+            xpath, required, data_type,
+            tuple(row[index].strip() for index in model_positions),
+            additional_info
+        )
+
+
+def _find_record_end(data: 'mmap.mmap', start: int, end: int, in_quotes: bool = False) -> int:
+    """
+    Find the end of the CSV record containing ``start``.
+    
+    Newlines inside quoted fields do not end a record. Quote state is tracked
+    by the parity of quote characters, which holds for RFC 4180 quoting where
+    embedded quotes are doubled.
+    
+    Args:
+        data: Memory-mapped file contents
+        start: Offset to search from
+        end: Offset to stop searching at
+        in_quotes: Whether ``start`` is inside a quoted field
+        
+    Returns:
+        Offset just past the newline ending the record, or ``end``
+    """
+    position = start
+    while True:
+        newline = data.find(b'\n', position, end)
+        if newline == -1:
+            return end
+        in_quotes ^= data[position:newline].count(b'"') % 2 == 1
+        position = newline + 1
+        if not in_quotes:
+            return position
+
+
+def _split_records(data: 'mmap.mmap', start: int, end: int, chunk_bytes: int) -> List[Tuple[int, int]]:
+    """
+    Split a byte range into ranges of roughly ``chunk_bytes`` aligned to record boundaries.
+    
+    Args:
+        data: Memory-mapped file contents
+        start: Offset of the first record
+        end: Offset just past the last record
+        chunk_bytes: Target size of each range
+        
+    Returns:
+        List of (start, end) offsets covering the range in order
+    """
+    ranges = []
+    while start < end:
+        target = start + chunk_bytes
+        if target >= end:
+            ranges.append((start, end))
+            break
+        
+        in_quotes = data[start:target].count(b'"') % 2 == 1
+        record_end = _find_record_end(data, target, end, in_quotes)
+        ranges.append((start, record_end))
+        start = record_end
+    
+    return ranges
+
+
+def _parse_byte_range(file_path: str, start: int, end: int, layout: RowLayout,
+                      delimiter: str, encoding: str) -> Tuple[List[Tuple], int, List[Tuple[int, List[str]]]]:
+    """
+    Parse one byte range of a CSV file in a worker process.
+    
+    Args:
+        file_path: Path to the CSV file
+        start: Offset of the first record in the range
+        end: Offset just past the last record in the range
+        layout: Column positions resolved from the header
+        delimiter: Field delimiter of the file
+        encoding: Detected encoding of the file
+        
+    Returns:
+        SchemaField constructor arguments for every non-empty row in the range
+        (plain tuples are much cheaper to send back to the parent than objects),
+        the number of lines in the range, and (line within the range, row) for
+        every row skipped for having data but no xpath
+    """
+    import mmap
+    
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        text = data[start:end].decode(encoding)
+    reader = csv.reader(io.StringIO(text, newline=''), delimiter=delimiter)
+    skipped = []
+    values = list(_rows_to_values(reader, layout, lambda row: skipped.append((reader.line_num, row))))
+    return values, reader.line_num, skipped
 
 
 class CSVSchemaParser:
     """Parser for CSV files containing schema information."""
     
-    def __init__(self):
+    def __init__(self, engine: str = 'stdlib', cache: Optional[SchemaCache] = None, workers: int = 1):
+        """
+        Initialize the parser.
+        
+        Args:
+            engine: Ingestion engine, either 'stdlib' (csv module) or 'pandas'
+            cache: Optional on-disk cache of parsed schemas
+            workers: Number of worker processes; more than one parses large
+                files in parallel (stdlib engine only)
+            
+        Raises:
+            ValueError: If the engine or number of workers is not supported
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unsupported engine '{engine}'. Choose from: {', '.join(ENGINES)}")
+        if workers < 1:
+            raise ValueError(f"Number of workers must be at least 1, got {workers}")
+        if workers > 1 and engine != 'stdlib':
+            raise ValueError("Parallel parsing is only supported by the stdlib engine")
+        
+        self.engine = engine
+        self.cache = cache
+        self.workers = workers
         self.required_columns = [
-            'xpath', 'required/optional', 'data_type', 
-            'model1', 'model2', 'model3', 'model4'
+            'xpath', 'required/optional', 'data_type'
         ]
+        # Model columns, delimiter and encoding detected in the last parsed file
+        self.model_columns: List[str] = []
+        self.delimiter = ','
+        self.encoding = 'utf-8'
     
     def parse_csv(self, file_path: str) -> List[SchemaField]:
         """
@@ -54,59 +309,411 @@ class CSVSchemaParser:
         Returns:
             List of SchemaField objects
             
+        Raises:
+            ValueError: If CSV format is invalid
+            FileNotFoundError: If file doesn't exist
+        """
+        return list(self.iter_fields(file_path))
+    
+    def iter_fields(self, file_path: str, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[SchemaField]:
+        """
+        Parse CSV file incrementally, yielding SchemaField objects as they are read.
+        
+        The stdlib engine reads one row at a time; the pandas engine holds
+        ``chunksize`` rows in memory at a time. Either way memory use does not
+        grow with the size of the file.
+        
+        With a cache, an unchanged file is loaded from the cache without being
+        parsed; otherwise the parsed rows are collected while they are yielded
+        and stored once the whole file has been read.
+        
+        Args:
+            file_path: Path to the CSV file
+            chunksize: Number of rows to read per chunk (pandas engine only)
+            
+        Yields:
+            SchemaField objects in file order
+            
         Raises:
             ValueError: If CSV format is invalid
             FileNotFoundError: If file doesn't exist
         """
         try:
-            # Read CSV file
-            df = pd.read_csv(file_path)
-            
-            # Validate columns
-            self._validate_columns(df.columns.tolist())
-            
-            # Parse each row into SchemaField objects
-            schema_fields = []
-            for _, row in df.iterrows():
-                # Skip empty rows
-                if pd.isna(row['xpath']) or row['xpath'].strip() == '':
-                    continue
-                
-                # Get additional column info (any columns beyond the required ones)
-                additional_info = []
-                for col in df.columns:
-                    if col.lower().strip() not in [req_col.lower().strip() for req_col in self.required_columns]:
-                        if pd.notna(row[col]) and str(row[col]).strip():
-                            additional_info.append(f"{col}: {str(row[col]).strip()}")
-                
-                field = SchemaField(
-                    xpath=str(row['xpath']).strip(),
-                    required=str(row['required/optional']).strip(),
-                    data_type=str(row['data_type']).strip(),
-                    model1_value=str(row['model1']).strip() if pd.notna(row['model1']) else '',
-                    model2_value=str(row['model2']).strip() if pd.notna(row['model2']) else '',
-                    model3_value=str(row['model3']).strip() if pd.notna(row['model3']) else '',
-                    model4_value=str(row['model4']).strip() if pd.notna(row['model4']) else '',
-                    additional_info=' | '.join(additional_info) if additional_info else ''
-                )
-                schema_fields.append(field)
-            
-            return schema_fields
+            if self.cache is None:
+                yield from self._iter_parsed_fields(file_path, chunksize)
+                return
+            
+            cache_key = self.cache.key_for(file_path, 'schema', PARSER_VERSION)
+            cached = self.cache.load(cache_key)
+            if cached is not None:
+                self.model_columns, self.delimiter, self.encoding, rows = cached
+                for row in rows:
+                    yield SchemaField(*row)
+                return
+            
+            rows = []
+            for schema_field in self._iter_parsed_fields(file_path, chunksize):
+                rows.append((
+                    schema_field.xpath, schema_field.required, schema_field.data_type,
+                    schema_field.model_values, schema_field.additional_info
+                ))
+                yield schema_field
+            self.cache.store(cache_key, (self.model_columns, self.delimiter, self.encoding, rows))
             
         except FileNotFoundError:
             raise FileNotFoundError(f"CSV file not found: {file_path}")
         except Exception as e:
             raise ValueError(f"Error parsing CSV file: {e}")
     
+    def _iter_parsed_fields(self, file_path: str, chunksize: int) -> Iterator[SchemaField]:
+        """
+        Parse CSV file with the selected engine.
+        
+        The encoding is detected from a sample at the start of the file, so a
+        byte further on can still fail to decode. Parsing then restarts in the
+        next fallback encoding, skipping the fields that were already yielded.
+        
+        Raises:
+            ValueError: If the file cannot be decoded and there is no fallback
+        """
+        encoding = None
+        yielded = 0
+        while True:
+            try:
+                for schema_field in islice(self._iter_engine_fields(file_path, chunksize, encoding), yielded, None):
+                    yield schema_field
+                    yielded += 1
+                return
+            except UnicodeDecodeError as e:
+                encoding = self._fallback_after_decode_error(file_path, e)
+    
+    def _iter_engine_fields(self, file_path: str, chunksize: int, encoding: Optional[str]) -> Iterator[SchemaField]:
+        """Parse CSV file with the selected engine, optionally overriding the detected encoding."""
+        if self.engine == 'pandas':
+            return self._iter_fields_pandas(file_path, chunksize, encoding)
+        if self.workers > 1:
+            return self._iter_fields_parallel(file_path, encoding)
+        return self._iter_fields_stdlib(file_path, encoding)
+    
+    def _fallback_after_decode_error(self, file_path: str, error: UnicodeDecodeError) -> str:
+        """
+        Pick the encoding to restart parsing with after a decoding error.
+        
+        Args:
+            file_path: Path to the CSV file
+            error: Error raised while decoding in ``self.encoding``
+            
+        Returns:
+            Fallback encoding to parse the file with
+            
+        Raises:
+            ValueError: If there is no fallback for the failed encoding
+        """
+        failed = self.encoding
+        offset = find_undecodable_byte(file_path, failed)
+        location = f"byte 0x{error.object[error.start]:02x}"
+        if offset is not None:
+            location += f" at offset {offset}"
+        
+        fallback = fallback_encoding(failed)
+        if fallback is None:
+            raise ValueError(
+                f"Cannot decode {location} as {failed}; convert the file to UTF-8 and try again"
+            )
+        print(f"⚠️  Warning: {location} is not valid {failed} (encoding was detected from the "
+              f"first {SAMPLE_BYTES // 1024} KB); re-reading the file as {fallback}")
+        return fallback
+    
+    def _iter_fields_stdlib(self, file_path: str, encoding: Optional[str] = None) -> Iterator[SchemaField]:
+        """
+        Parse CSV file row by row with the standard library csv module.
+        
+        Args:
+            file_path: Path to the CSV file
+            encoding: Encoding to use instead of the detected one
+            
+        Yields:
+            SchemaField objects for every non-empty row
+        """
+        with open_text(file_path, encoding) as (file, detected):
+            self.encoding = detected.encoding
+            header_line = file.readline()
+            self.delimiter = _detect_delimiter(header_line)
+            reader = csv.reader(chain([header_line], file), delimiter=self.delimiter)
+            columns = next(reader, None)
+            if columns is None:
+                raise ValueError("No columns to parse from file")
+            
+            layout = self._row_layout(columns)
+            warn = lambda row: _warn_missing_xpath(reader.line_num, columns, row)
+            for row in _rows_to_values(reader, layout, warn):
+                yield SchemaField(*row)
+    
+    def _iter_fields_parallel(self, file_path: str, encoding: Optional[str] = None) -> Iterator[SchemaField]:
+        """
+        Parse CSV file in parallel across a process pool.
+        
+        The file is memory-mapped and split into byte ranges that end on record
+        boundaries, each range is parsed by a worker process with the csv
+        module, and the results are yielded in original row order.
+        
+        Args:
+            file_path: Path to the CSV file
+            encoding: Encoding to use instead of the detected one
+            
+        Yields:
+            SchemaField objects for every non-empty row
+        """
+        if os.path.getsize(file_path) < MIN_PARALLEL_BYTES:
+            # Starting worker processes costs more than parsing small files
+            yield from self._iter_fields_stdlib(file_path, encoding)
+            return
+        
+        # Only needed for parallel parsing, so kept out of startup
+        import mmap
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            detected = detect_encoding(data[:SAMPLE_BYTES])
+            if encoding is not None:
+                detected = DetectedEncoding(encoding, detected.bom)
+            if not detected.ascii_compatible:
+                # Record boundaries can only be found by byte search in ASCII-compatible encodings
+                yield from self._iter_fields_stdlib(file_path, encoding)
+                return
+            
+            self.encoding = detected.encoding
+            header_start = len(detected.bom)
+            header_end = _find_record_end(data, header_start, len(data))
+            header = data[header_start:header_end].decode(self.encoding)
+            self.delimiter = _detect_delimiter(header)
+            columns = next(csv.reader(io.StringIO(header, newline=''), delimiter=self.delimiter), None)
+            if columns is None:
+                raise ValueError("No columns to parse from file")
+            
+            layout = self._row_layout(columns)
+            chunk_bytes = max(MIN_CHUNK_BYTES, (len(data) - header_end) // (self.workers * 4) + 1)
+            ranges = _split_records(data, header_end, len(data), chunk_bytes)
+        
+        starts, ends = zip(*ranges) if ranges else ((), ())
+        parse_range = partial(
+            _parse_byte_range, file_path, layout=layout, delimiter=self.delimiter, encoding=self.encoding
+        )
+        # Workers count lines within their own range; the offset makes them file line numbers
+        line_offset = header.count('\n')
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for rows, line_count, skipped in executor.map(parse_range, starts, ends):
+                for line_num, row in skipped:
+                    _warn_missing_xpath(line_offset + line_num, columns, row)
+                for row in rows:
+                    yield SchemaField(*row)
+                line_offset += line_count
+    
+    def _row_layout(self, columns: List[str]) -> 'RowLayout':
+        """
+        Validate the header and resolve the position of every column once.
+        
+        Args:
+            columns: List of column names from CSV
+            
+        Returns:
+            RowLayout used to convert rows into SchemaField objects
+        """
+        self._validate_columns(columns)
+        column_map = self._map_columns(columns)
+        
+        # Extra columns feed additional_info
+        positions = {col: index for index, col in enumerate(columns)}
+        return RowLayout(
+            columns=tuple(columns),
+            width=len(columns),
+            required_positions=tuple(
+                positions[column_map[col.strip().lower()]] for col in self.required_columns
+            ),
+            model_positions=tuple(positions[col] for col in self.model_columns),
+            extra_columns=tuple(
+                (f"{col}: ", positions[col]) for col in self._extra_columns(columns)
+            )
+        )
+    
+    def _iter_fields_pandas(self, file_path: str, chunksize: int,
+                            encoding: Optional[str] = None) -> Iterator[SchemaField]:
+        """
+        Parse CSV file in chunks with pandas.
+        
+        Args:
+            file_path: Path to the CSV file
+            chunksize: Number of rows to read per chunk
+            encoding: Encoding to use instead of the detected one
+            
+        Yields:
+            SchemaField objects for every non-empty row
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("The pandas engine requires pandas (pip install pandas)")
+        
+        with open_text(file_path, encoding) as (file, detected):
+            self.encoding = detected.encoding
+            header_line = file.readline()
+            self.delimiter = _detect_delimiter(header_line)
+            columns = next(csv.reader([header_line], delimiter=self.delimiter), None)
+            if columns is None:
+                raise ValueError("No columns to parse from file")
+            
+            # Validate columns from the header before reading any rows
+            self._validate_columns(columns)
+            column_map = self._map_columns(columns)
+            extra_columns = self._extra_columns(columns)
+            
+            # Read the rest of the decoded stream, every cell as a string,
+            # keeping values like "null" and "n/a" verbatim and blank lines so
+            # reported row numbers match the file
+            with pd.read_csv(file, sep=self.delimiter, header=None, names=columns, index_col=False,
+                             chunksize=chunksize, dtype=str, keep_default_na=False,
+                             skip_blank_lines=False) as reader:
+                # Physical lines read so far, starting with the header
+                line_count = 1
+                for chunk in reader:
+                    line_count = yield from self._parse_chunk(chunk, column_map, extra_columns, line_count)
+    
+    def _parse_chunk(self, df: 'pd.DataFrame', column_map: Dict[str, str],
+                     extra_columns: List[str], line_count: int) -> Generator[SchemaField, None, int]:
+        """
+        Convert one chunk of CSV rows into SchemaField objects.
+        
+        All cleanup is done column-wise with vectorized string operations;
+        the only per-row work left is constructing the SchemaField objects.
+        
+        Args:
+            df: DataFrame holding a chunk of the CSV file
+            column_map: Normalized required column name to actual column name
+            extra_columns: Columns beyond the required ones
+            line_count: Physical lines of the file before the chunk
+            
+        Yields:
+            SchemaField objects for every non-empty row in the chunk
+            
+        Returns:
+            Physical lines of the file up to the end of the chunk
+        """
+        import pandas as pd
+        
+        df = df.fillna('')
+        
+        # Skip empty rows
+        xpath = df[column_map['xpath']].str.strip()
+        keep = xpath != ''
+        
+        # Every record takes one line plus the line breaks inside its quoted
+        # cells, so warnings give the line the record ends on like the stdlib
+        # reader; lines are only counted per row in chunks that warn
+        skipped = df[~keep]
+        skipped = skipped[skipped.apply(lambda col: col.str.strip() != '').any(axis=1)]
+        if len(skipped):
+            line_breaks = sum(df[col].str.count('\n') for col in df.columns)
+            end_lines = line_count + (line_breaks + 1).cumsum()
+            for line_num, row in zip(end_lines[skipped.index].tolist(), skipped.itertuples(index=False)):
+                _warn_missing_xpath(line_num, df.columns, row)
+        line_count += len(df) + sum(''.join(df[col].tolist()).count('\n') for col in df.columns)
+        df = df[keep]
+        
+        def column(name: str) -> List[str]:
+            return df[name].str.strip().tolist()
+        
+        # Get additional column info as "column: value" pairs joined by " | "
+        additional_info = pd.Series('', index=df.index)
+        for col in extra_columns:
+            value = df[col].str.strip()
+            joined = additional_info.where(additional_info == '', additional_info + ' | ')
+            additional_info = additional_info.where(value == '', joined + f"{col}: " + value)
+        
+        model_values = zip(*(column(col) for col in self.model_columns))
+        rows = zip(
+            xpath[keep].tolist(),
+            column(column_map['required/optional']),
+            column(column_map['data_type']),
+            model_values,
+            additional_info.tolist()
+        )
+        for row in rows:
+            yield SchemaField(*row)
+        return line_count
+    
+    def _map_columns(self, actual_columns: List[str]) -> Dict[str, str]:
+        """
+        Map each normalized required column name to its name in the CSV header.
+        
+        Args:
+            actual_columns: List of column names from CSV
+            
+        Returns:
+            Dictionary of normalized required column name to actual column name
+        """
+        normalized_actual = {col.strip().lower(): col for col in actual_columns}
+        return {
+            col.strip().lower(): normalized_actual[col.strip().lower()]
+            for col in self.required_columns
+        }
+    
+    def _extra_columns(self, actual_columns: List[str]) -> List[str]:
+        """
+        Get the columns beyond the required and model columns.
+        
+        Args:
+            actual_columns: List of column names from CSV
+            
+        Returns:
+            Extra column names in header order
+        """
+        known_columns = {col.strip().lower() for col in self.required_columns}
+        known_columns.update(col.strip().lower() for col in self.model_columns)
+        return [col for col in actual_columns if col.strip().lower() not in known_columns]
+    
+    def _detect_model_columns(self, actual_columns: List[str]) -> List[str]:
+        """
+        Find the modelN columns in the header, ordered by model number.
+        
+        Args:
+            actual_columns: List of column names from CSV
+            
+        Returns:
+            Actual names of the model columns
+            
+        Raises:
+            ValueError: If there are no model columns or their numbering has gaps
+        """
+        numbered = {}
+        for col in actual_columns:
+            match = MODEL_COLUMN_PATTERN.fullmatch(col.strip().lower())
+            if match:
+                numbered[int(match.group(1))] = col
+        
+        if not numbered:
+            raise ValueError(
+                f"Missing model columns: expected model1, model2, ...\n"
+                f"Actual columns: {actual_columns}"
+            )
+        
+        expected = list(range(1, len(numbered) + 1))
+        if sorted(numbered) != expected:
+            raise ValueError(
+                f"Model columns must be numbered consecutively from model1\n"
+                f"Model columns: {[numbered[num] for num in sorted(numbered)]}"
+            )
+        
+        return [numbered[num] for num in expected]
+    
     def _validate_columns(self, actual_columns: List[str]) -> None:
         """
-        Validate that CSV has expected columns.
+        Validate that CSV has expected columns and record its model columns.
         
         Args:
             actual_columns: List of column names from CSV
             
         Raises:
-            ValueError: If required columns are missing
+            ValueError: If required or model columns are missing
         """
         # Normalize column names (strip whitespace, lowercase)
         normalized_actual = [col.strip().lower() for col in actual_columns]
@@ -123,3 +730,5 @@ class CSVSchemaParser:
                 f"Required columns: {self.required_columns}\n"
                 f"Actual columns: {actual_columns}"
             )
+        
+        self.model_columns = self._detect_model_columns(actual_columns)
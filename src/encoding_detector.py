@@ -0,0 +1,146 @@
+"""
+Encoding Detector Module
+
+This module detects the text encoding of CSV files from a bounded sample of their bytes
+and decodes them incrementally, so each file is read from disk only once.
+"""
+
+import codecs
+import io
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional, TextIO, Tuple
+
+
+# Number of leading bytes inspected to detect the encoding
+SAMPLE_BYTES = 64 * 1024
+
+# Byte order marks and the encoding they announce; UTF-32 is checked before
+# UTF-16 because the UTF-32 LE mark starts with the UTF-16 LE mark
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+
+# Encodings tried in order when there is no BOM; latin-1 decodes any byte sequence
+FALLBACK_ENCODINGS = ('utf-8', 'cp1252', 'latin-1')
+
+
+@dataclass
+class DetectedEncoding:
+    """Result of encoding detection."""
+    encoding: str
+    bom: bytes = b''  # Byte order mark found at the start of the file, if any
+    
+    @property
+    def ascii_compatible(self) -> bool:
+        """Check if ASCII characters such as quotes and newlines are single bytes."""
+        return not self.encoding.startswith(('utf-16', 'utf-32'))
+
+
+def detect_encoding(sample: bytes) -> DetectedEncoding:
+    """
+    Detect the encoding of a file from its leading bytes.
+    
+    Args:
+        sample: Leading bytes of the file (at most SAMPLE_BYTES are needed)
+    
+    Returns:
+        DetectedEncoding with the encoding name and any byte order mark
+    """
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return DetectedEncoding(encoding, bom)
+    
+    for encoding in FALLBACK_ENCODINGS:
+        try:
+            # final=False tolerates a multi-byte character cut off at the end of the sample
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+        except UnicodeDecodeError:
+            continue
+        return DetectedEncoding(encoding)
+    
+    return DetectedEncoding('latin-1')
+
+
+def fallback_encoding(encoding: str) -> Optional[str]:
+    """
+    Get the encoding to retry with when a file fails to decode past the sample.
+    
+    Args:
+        encoding: Encoding the file failed to decode in
+    
+    Returns:
+        The next encoding in FALLBACK_ENCODINGS, or None if there is none
+        (latin-1 decodes everything, and a BOM announces its encoding)
+    """
+    if encoding in FALLBACK_ENCODINGS[:-1]:
+        return FALLBACK_ENCODINGS[FALLBACK_ENCODINGS.index(encoding) + 1]
+    return None
+
+
+def find_undecodable_byte(file_path: str, encoding: str) -> Optional[int]:
+    """
+    Find the offset of the first byte of a file that cannot be decoded.
+    
+    Only used to report decoding errors, so the whole file may be read.
+    
+    Args:
+        file_path: Path to the file
+        encoding: Encoding to decode the file in
+    
+    Returns:
+        Byte offset from the start of the file, or None if it decodes cleanly
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(file_path, 'rb') as raw:
+        offset = len(detect_encoding(raw.read(SAMPLE_BYTES)).bom)
+        raw.seek(offset)
+        while True:
+            chunk = raw.read(SAMPLE_BYTES)
+            # Bytes of a character cut off at the end of the last chunk are still pending
+            pending = len(decoder.getstate()[0])
+            try:
+                decoder.decode(chunk, final=not chunk)
+            except UnicodeDecodeError as e:
+                return offset - pending + e.start
+            if not chunk:
+                return None
+            offset += len(chunk)
+
+
+@contextmanager
+def open_text(file_path: str, encoding: Optional[str] = None) -> Iterator[Tuple[TextIO, DetectedEncoding]]:
+    """
+    Open a file as a text stream in its detected encoding.
+    
+    The encoding is detected from a bounded sample peeked from the read buffer,
+    the BOM is skipped, and the remaining bytes are decoded incrementally as
+    the stream is read. Newlines are passed through untranslated, as the csv
+    module expects.
+    
+    Args:
+        file_path: Path to the file
+        encoding: Encoding to use instead of the detected one; a BOM is still skipped
+    
+    Yields:
+        (text stream, DetectedEncoding) tuple
+    
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    with open(file_path, 'rb', buffering=SAMPLE_BYTES) as raw:
+        detected = detect_encoding(raw.peek(SAMPLE_BYTES)[:SAMPLE_BYTES])
+        if encoding is not None:
+            detected = DetectedEncoding(encoding, detected.bom)
+        raw.read(len(detected.bom))
+        
+        stream = io.TextIOWrapper(raw, encoding=detected.encoding, newline='')
+        try:
+            yield stream, detected
+        finally:
+            # Leave closing the file to the outer with statement
+            stream.detach()
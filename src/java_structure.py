@@ -4,15 +4,249 @@ Java Structure Generator Module
 This module generates Java class files from model structures.
 """
 
-from typing import Dict
+import hashlib
+import os
+import threading
+import uuid
+from collections import deque
+from functools import partial
+from itertools import chain, islice
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, TextIO, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
-from src.model_generator import Model, ModelField
+from src.csv_parser import SchemaField
+from src.model_generator import (
+    MAX_CONSTRUCTOR_SLOTS, Model, ModelField, ModelGenerator, component_models, leaf_fields, parameter_slots,
+    shared_field_key
+)
+from src.java_templates import JavaTemplates
+from src.xml_reader import build_path_table
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+# Write buffer of generated Java files; sections are streamed through it
+WRITE_BUFFER_SIZE = 256 * 1024
+
+# Hash functions of primitive types; each matches hashCode of the boxed type
+PRIMITIVE_HASH_FUNCTIONS = {
+    'int': 'Integer.hashCode',
+    'long': 'Long.hashCode',
+    'short': 'Short.hashCode',
+    'byte': 'Byte.hashCode',
+    'char': 'Character.hashCode',
+    'boolean': 'Boolean.hashCode',
+    'float': 'Float.hashCode',
+    'double': 'Double.hashCode'
+}
+
+# Relative cost of comparing fields of a type in equals; cheaper fields are
+# compared first, and unlisted types (lists, nested classes) come last
+EQUALS_COSTS = {
+    **dict.fromkeys(PRIMITIVE_HASH_FUNCTIONS, 0),
+    **dict.fromkeys(['Integer', 'Long', 'Short', 'Byte', 'Character', 'Boolean', 'Float', 'Double'], 1),
+    **dict.fromkeys(['LocalDate', 'LocalDateTime', 'BigDecimal'], 2),
+    'String': 3
+}
+DEFAULT_EQUALS_COST = 4
+
+# Java expressions used as field values in generated benchmarks
+SAMPLE_VALUES = {
+    'int': '1', 'Integer': '1',
+    'long': '1L', 'Long': '1L',
+    'double': '1.0', 'Double': '1.0',
+    'float': '1.0f', 'Float': '1.0f',
+    'boolean': 'true', 'Boolean': 'true',
+    'LocalDate': 'java.time.LocalDate.of(2024, 1, 1)',
+    'LocalDateTime': 'java.time.LocalDateTime.of(2024, 1, 1, 0, 0)',
+    'BigDecimal': 'new java.math.BigDecimal("1.00")',
+    'List<String>': 'java.util.List.of("value")'
+}
+
+# Output styles: mutable classes with setters, final-field classes with a
+# cached hashCode, or Java records
+STYLES = ('pojo', 'immutable', 'record')
+
+# Name of the cached hash code field of immutable classes
+HASH_CACHE_FIELD = 'cachedHashCode'
+
+# Fields handled per helper method once toString, equals and hashCode are split
+# into chunks, which keeps each method far below the JVM's 64 KB code limit
+METHOD_CHUNK_FIELDS = 200
+
+# Items joined into each fragment of a streamed per-field section
+STREAM_BATCH_ITEMS = 200
+
+# Java expressions converting XML text held in xmlValue to each field type
+XML_CONVERSIONS = {
+    'String': 'xmlValue',
+    'Integer': 'Integer.valueOf(xmlValue.trim())',
+    'int': 'Integer.parseInt(xmlValue.trim())',
+    'Long': 'Long.valueOf(xmlValue.trim())',
+    'long': 'Long.parseLong(xmlValue.trim())',
+    'Double': 'Double.valueOf(xmlValue.trim())',
+    'double': 'Double.parseDouble(xmlValue.trim())',
+    'Float': 'Float.valueOf(xmlValue.trim())',
+    'float': 'Float.parseFloat(xmlValue.trim())',
+    'Boolean': 'Boolean.valueOf(xmlValue.trim())',
+    'boolean': 'Boolean.parseBoolean(xmlValue.trim())',
+    'LocalDate': 'LocalDate.parse(xmlValue.trim())',
+    'LocalDateTime': 'LocalDateTime.parse(xmlValue.trim())',
+    'BigDecimal': 'new BigDecimal(xmlValue.trim())'
+}
+
+# Initial values of primitive local variables
+PRIMITIVE_DEFAULTS = {
+    'int': '0', 'long': '0L', 'short': '(short) 0', 'byte': '(byte) 0', 'char': "'\\0'",
+    'boolean': 'false', 'float': '0.0f', 'double': '0.0'
+}
+
+# Imports needed by generated XmlFields classes, and by fromXml readers
+XML_READER_IMPORT = 'javax.xml.stream.XMLStreamReader'
+XML_EXCEPTION_IMPORT = 'javax.xml.stream.XMLStreamException'
+
+# Subdirectory and package suffix of generated benchmark harnesses
+BENCHMARK_PACKAGE = 'benchmarks'
+
+# Class name of the generated JMH benchmark of the model mappers
+MAPPER_BENCHMARK_CLASS = 'MapperBenchmark'
+
+# Imports needed by generated JSON writers and readers
+JSON_IMPORTS = (
+    'java.io.IOException',
+    'java.io.StringReader',
+    'java.io.UncheckedIOException'
+)
+
+# Class name of the generated JSON writing and streaming reading helpers
+JSON_SUPPORT_CLASS = 'JsonSupport'
+
+# Class name of the generated StAX reading loop
+XML_SUPPORT_CLASS = 'XmlSupport'
+
+# JsonSupport methods writing a value of each field type; nested classes write themselves
+JSON_WRITERS = {
+    'String': 'writeString',
+    'Integer': 'writeNumber', 'Long': 'writeNumber', 'Double': 'writeNumber', 'Float': 'writeNumber',
+    'BigDecimal': 'writeNumber',
+    'int': 'writeInt', 'long': 'writeLong', 'double': 'writeDouble', 'float': 'writeFloat',
+    'Boolean': 'writeBoolean', 'boolean': 'writeBoolean',
+    'LocalDate': 'writeValue', 'LocalDateTime': 'writeValue',
+    'List<String>': 'writeStringList'
+}
+
+# JsonSupport.Reader methods reading a value of each field type; nested classes read themselves
+JSON_READERS = {
+    'String': 'nextString',
+    'Integer': 'nextIntegerOrNull', 'int': 'nextInt',
+    'Long': 'nextLongOrNull', 'long': 'nextLong',
+    'Double': 'nextDoubleOrNull', 'double': 'nextDouble',
+    'Float': 'nextFloatOrNull', 'float': 'nextFloat',
+    'Boolean': 'nextBooleanOrNull', 'boolean': 'nextBoolean',
+    'BigDecimal': 'nextBigDecimal',
+    'LocalDate': 'nextLocalDate', 'LocalDateTime': 'nextLocalDateTime',
+    'List<String>': 'nextStringList'
+}
+
+# Expected printed length of a value of each field type, used to presize buffers
+VALUE_SIZE_ESTIMATES = {
+    'String': 16, 'BigDecimal': 12, 'LocalDate': 12, 'LocalDateTime': 21,
+    'Boolean': 5, 'boolean': 5, 'List<String>': 32
+}
+DEFAULT_VALUE_SIZE_ESTIMATE = 8
+NESTED_VALUE_SIZE_ESTIMATE = 64
+
+# toString implementations: one string concatenation, or a presized StringBuilder
+TO_STRING_MODES = ('concat', 'builder')
 
 
 class JavaStructureGenerator:
-    """Generates Java class files from model structures."""
+    """
+    Generates Java class files from model structures.
+    
+    Classes are rendered from templates compiled once per generator. Each
+    section is built by joining per-field fragments in bulk rather than
+    appending individual lines.
+    """
     
-    def __init__(self):
+    def __init__(self, templates: Optional[Dict[str, str]] = None, jobs: int = 1,
+                 fast_equals: bool = False, benchmarks: bool = False, style: str = 'pojo',
+                 xml_readers: bool = False, json: bool = False, mappers: bool = False,
+                 to_string: str = 'concat', to_string_max_items: Optional[int] = None,
+                 shared_base: bool = False):
+        """
+        Initialize the generator.
+        
+        Args:
+            templates: Replacement Java source templates by name (see java_templates.TEMPLATES)
+            jobs: Number of models rendered and written concurrently; more than one
+                renders in worker processes and writes through a thread pool
+            fast_equals: Generate an unrolled hashCode and a short-circuit equals
+                comparing cheap fields first, instead of java.util.Objects.hash/equals
+            benchmarks: Also generate a JMH benchmark harness per model in a
+                benchmarks subdirectory
+            style: 'pojo' for mutable classes with setters, 'immutable' for final
+                classes with final fields and a cached hashCode, or 'record' for
+                Java records (models too wide for a record constructor fall back
+                to 'immutable')
+            xml_readers: Generate a static fromXml(XMLStreamReader) method per model that
+                binds fields from their XPaths (flat models; nested-class fields are not read),
+                an XmlFields class per class reading its own fields, and the XmlSupport
+                class driving them
+            json: Generate writeJson(Appendable) and a streaming readJson method per
+                class, and the JsonSupport helper class they share
+            mappers: Generate a mapper class between every ordered pair of (flat) models
+                that copies the fields mapped from the same XPath; with benchmarks, also
+                a JMH harness of the mappers
+            to_string: 'concat' for a toString returning one string concatenation, or
+                'builder' for one appending to a StringBuilder presized from the
+                expected length of the fields (records keep their implicit toString)
+            to_string_max_items: With the 'builder' toString, show at most this many
+                elements of each List field, followed by the number left out
+            shared_base: Move the fields that every model maps from the same XPath, with
+                the same type and name, into an abstract ModelBase class with their
+                accessors, and generate the models as its subclasses (not with 'record')
+        
+        Raises:
+            ValueError: If the number of jobs is less than 1, the style or toString mode
+                is not supported, to_string_max_items is negative or set without the
+                'builder' toString, or shared_base is combined with the 'record' style
+        """
+        if jobs < 1:
+            raise ValueError(f"Number of jobs must be at least 1, got {jobs}")
+        if style not in STYLES:
+            raise ValueError(f"Unsupported style '{style}'. Choose from: {', '.join(STYLES)}")
+        if to_string not in TO_STRING_MODES:
+            raise ValueError(f"Unsupported toString mode '{to_string}'. Choose from: {', '.join(TO_STRING_MODES)}")
+        if to_string_max_items is not None and (to_string != 'builder' or to_string_max_items < 0):
+            raise ValueError("to_string_max_items must be at least 0 and requires the 'builder' toString")
+        if shared_base and style == 'record':
+            raise ValueError("Records cannot extend a shared base class")
+        
+        self.template_overrides = templates
+        self.templates = JavaTemplates(templates)
+        self.jobs = jobs
+        self.fast_equals = fast_equals
+        self.benchmarks = benchmarks
+        self.style = style
+        self.xml_readers = xml_readers
+        self.json = json
+        self.mappers = mappers
+        self.to_string = to_string
+        self.to_string_max_items = to_string_max_items
+        self.shared_base = shared_base
+        
+        # Base class of the models of the last generate_java_files call, if any,
+        # and the keys of its fields (see shared_field_key)
+        self.base_model: Optional[Model] = None
+        self._inherited_keys: FrozenSet[Tuple[Optional[str], str, str]] = frozenset()
+        
+        # Component classes of the models of the last generate_java_files call, by class name
+        self._components: Dict[str, Model] = {}
+        
+        # Java file names written and skipped as unchanged by the last generate_java_files call
+        self.written_files = []
+        self.skipped_files = []
         self.imports = {
             'LocalDate': 'java.time.LocalDate',
             'LocalDateTime': 'java.time.LocalDateTime',
@@ -21,23 +255,194 @@ class JavaStructureGenerator:
             'ArrayList': 'java.util.ArrayList'
         }
     
-    def generate_java_files(self, models: Dict[str, Model], output_dir: str) -> None:
+    def __getstate__(self) -> Dict[str, Any]:
+        # Compiled templates cannot be pickled; workers compile their own
+        state = self.__dict__.copy()
+        del state['templates']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.templates = JavaTemplates(self.template_overrides)
+    
+    def generate_from_schema(self, schema_fields: Iterable[SchemaField], output_dir: str,
+                             model_generator: Optional[ModelGenerator] = None,
+                             nested: bool = False) -> Dict[str, Model]:
+        """
+        Generate models from schema fields and write their Java class files.
+        
+        Args:
+            schema_fields: Iterable of parsed schema fields, consumed in a single pass
+            output_dir: Output directory for generated files
+            model_generator: Generator used to build the models (a new one by default)
+            nested: Generate nested classes per element path instead of flat models
+            
+        Returns:
+            Dictionary of model name to the generated Model objects
+        """
+        model_generator = model_generator or ModelGenerator()
+        if nested:
+            models = model_generator.generate_nested_models(schema_fields)
+        else:
+            models = model_generator.generate_models(schema_fields)
+        self.generate_java_files(models, output_dir, model_generator)
+        return models
+    
+    def generate_java_files(self, models: Dict[str, Model], output_dir: str,
+                            model_generator: Optional[ModelGenerator] = None) -> None:
         """
         Generate Java class files for all models.
         
+        Files whose content would not change are left untouched, so their
+        modification times do not trigger downstream recompilation. Changed
+        files are replaced atomically. The file names are recorded in
+        ``written_files`` and ``skipped_files``.
+        
         Args:
-            models: Dictionary of model name to Model objects
+            models: Dictionary of model name to Model objects; with shared_base,
+                split models are split again around the base in place
             output_dir: Output directory for generated files
+            model_generator: Generator that built the models, which extracts the
+                shared base (a new one by default)
         """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
+        self.written_files = []
+        self.skipped_files = []
+        if self.shared_base:
+            self.base_model = (model_generator or ModelGenerator()).extract_shared_base(models)
+        else:
+            self.base_model = None
+        self._inherited_keys = frozenset(map(shared_field_key, self.base_model.fields)) if self.base_model else frozenset()
+        self._components = component_models(models)
         
-        for model_name, model in models.items():
-            java_content = self._generate_java_class(model)
-            file_path = output_path / f"{model.class_name}.java"
+        file_models = [(output_path / f"{model.class_name}.java", model) for model in models.values()]
+        if self.jobs > 1 and len(file_models) > 1:
+            results = self._write_files_concurrently(file_models)
+        else:
+            results = (self._write_if_changed(model, file_path) for file_path, model in file_models)
+        
+        # Results come back in model order, whatever order the files finished in
+        for (file_path, _), written in zip(file_models, results):
+            self._record_write(file_path.name, written)
+        
+        for relative_path, render in self._iter_support_files(models):
+            file_path = output_path / relative_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            written = _replace_if_changed(file_path, _encoded(render))
+            self._record_write(relative_path, written)
+    
+    def _record_write(self, file_name: str, written: bool) -> None:
+        """Record a generated file as written or skipped."""
+        if written:
+            self.written_files.append(file_name)
+        else:
+            self.skipped_files.append(file_name)
+    
+    def _iter_support_files(self, models: Dict[str, Model]) -> Iterator[Tuple[str, Callable[[], Iterable[str]]]]:
+        """
+        List the generated files other than the model classes.
+        
+        Args:
+            models: Dictionary of model name to Model objects
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(java_content)
+        Yields:
+            (path relative to the output directory, function rendering the
+            content fragments) tuples
+        """
+        # Components are benchmarked and mapped as part of their top-level models
+        top_models = [model for model in models.values() if model.component_of is None]
+        
+        if self.base_model:
+            yield f"{self.base_model.class_name}.java", partial(self._iter_base_class, self.base_model, models)
+        
+        if self.benchmarks:
+            for model in top_models:
+                yield (f"{BENCHMARK_PACKAGE}/{model.class_name}Benchmark.java",
+                       partial(self._generate_benchmark_class, model))
+        
+        if models:
+            package = next(iter(models.values())).package_name
+            if self.xml_readers:
+                yield f"{XML_SUPPORT_CLASS}.java", partial(iter, (self.templates.xml_support(package=package),))
+            if self.json:
+                yield f"{JSON_SUPPORT_CLASS}.java", partial(iter, (self.templates.json_support(package=package),))
+        
+        if self.mappers and len(top_models) > 1:
+            pairs = [(source, target) for source in top_models for target in top_models
+                     if source is not target]
+            for source, target in pairs:
+                yield f"{_mapper_name(source, target)}.java", partial(self._generate_mapper_class, source, target)
+            if self.benchmarks:
+                yield (f"{BENCHMARK_PACKAGE}/{MAPPER_BENCHMARK_CLASS}.java",
+                       partial(self._generate_mapper_benchmark_class, top_models, pairs))
+    
+    def _write_files_concurrently(self, file_models: List[Tuple[Path, Model]]) -> List[bool]:
+        """
+        Render models in worker processes and write them through a thread pool.
+        
+        At most ``2 * jobs`` rendered classes are held in memory at a time:
+        a model is only submitted for rendering once an earlier one has
+        been written.
+        
+        Args:
+            file_models: (file path, model) pairs
+            
+        Returns:
+            Whether each file was written, in the order of file_models
+        """
+        # Only needed with --jobs > 1, so kept out of startup
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        
+        jobs = min(self.jobs, len(file_models))
+        in_flight = threading.BoundedSemaphore(2 * jobs)
+        rendering = deque()
+        writes = []
+        
+        def submit_write(file_path: Path, render_future: 'Future') -> None:
+            write_future = writers.submit(_replace_if_changed, file_path, render_future.result())
+            write_future.add_done_callback(lambda _: in_flight.release())
+            writes.append(write_future)
+        
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_render_worker,
+                                 initargs=(self,)) as renderers, \
+                ThreadPoolExecutor(max_workers=jobs) as writers:
+            for file_path, model in file_models:
+                # Hand finished renders to the writers so the window can drain
+                while len(rendering) >= jobs:
+                    submit_write(*rendering.popleft())
+                in_flight.acquire()
+                rendering.append((file_path, renderers.submit(_render_worker_class, model)))
+            
+            while rendering:
+                submit_write(*rendering.popleft())
+            return [write.result() for write in writes]
+    
+    def _write_if_changed(self, model: Model, file_path: Path) -> bool:
+        """
+        Write the Java class of a model unless the file already has the same content.
+        
+        Args:
+            model: Model object to generate Java class for
+            file_path: Path of the Java file
+            
+        Returns:
+            True if the file was written, False if it was unchanged
+        """
+        return _replace_if_changed(file_path, _encoded(partial(self._iter_java_class, model)))
+    
+    def write_java_class(self, model: Model, file: TextIO) -> None:
+        """
+        Stream the Java class of a model to a text file.
+        
+        Sections are written fragment by fragment as they are rendered, so
+        only the file buffer is held in memory, however large the class is.
+        
+        Args:
+            model: Model object to generate Java class for
+            file: Writable text file; wrap unbuffered handles for efficiency
+        """
+        file.writelines(self._iter_java_class(model))
     
     def _generate_java_class(self, model: Model) -> str:
         """
@@ -49,69 +454,157 @@ class JavaStructureGenerator:
         Returns:
             Java class content as string
         """
-        # Collect required imports
-        required_imports = self._get_required_imports(model)
+        return "".join(self._iter_java_class(model))
+    
+    def _iter_java_class(self, model: Model) -> Iterator[str]:
+        """
+        Render the Java class of a model as a stream of source fragments.
+        
+        Fixed sections are rendered in one piece; per-field sections are
+        streamed in fragments of at most STREAM_BATCH_ITEMS fields, so no
+        fragment grows with the number of fields.
         
-        # Generate class content
-        class_content = []
+        Args:
+            model: Model object to generate Java class for
+            
+        Yields:
+            Consecutive fragments of the Java class content
+        """
+        templates = self.templates
+        class_name = model.class_name
+        style = self._model_style(model)
         
-        # Package declaration
-        class_content.append(f"package {model.package_name};")
-        class_content.append("")
+        # Package declaration and imports
+        header = self._generate_header(model.package_name, self._get_required_imports(model))
         
-        # Imports
-        if required_imports:
-            for import_statement in sorted(required_imports):
-                class_content.append(f"import {import_statement};")
-            class_content.append("")
+        if style == 'record':
+            yield header
+            yield from self._generate_record(model)
+            return
         
-        # Class documentation
-        class_content.append("/**")
-        class_content.append(f" * {model.class_name} - Auto-generated model class")
-        class_content.append(" * Generated from CSV schema definition")
-        class_content.append(" */")
+        immutable = style == 'immutable'
+        base_model = self.base_model if self._extends_base(model) else None
+        # Inherited fields are declared, and their accessors defined, by the base class
+        own_fields = self._own_fields(model)
         
-        # Class declaration
-        class_content.append(f"public class {model.class_name} {{")
-        class_content.append("")
+        # Class documentation and declaration
+        yield header + templates.class_header(
+            class_name=class_name,
+            modifiers="final " if immutable else "",
+            superclass=f" extends {base_model.class_name}" if base_model else ""
+        )
         
         # Field declarations
-        for field in model.fields:
-            class_content.extend(self._generate_field_declaration(field))
-        
-        # Default constructor
-        class_content.append("    /**")
-        class_content.append("     * Default constructor")
-        class_content.append("     */")
-        class_content.append(f"    public {model.class_name}() {{")
-        class_content.append("    }")
-        class_content.append("")
+        if immutable:
+            yield from _joined(
+                (self._generate_field_declaration(field, final=True) for field in own_fields), len(own_fields)
+            )
+            yield templates.hash_cache_field(name=self._hash_cache_field(model))
+        else:
+            yield from _joined(map(self._generate_field_declaration, own_fields), len(own_fields))
         
-        # Parameterized constructor
+        # Constructors; final fields can only be set by the parameterized constructor
+        if not (immutable and model.fields):
+            yield self._generate_default_constructor(model)
         if model.fields:
-            class_content.extend(self._generate_parameterized_constructor(model))
+            if base_model:
+                yield from self._generate_subclass_constructor(model, base_model, own_fields)
+            else:
+                yield from self._generate_parameterized_constructor(model)
         
-        # Getters and setters
-        for field in model.fields:
-            class_content.extend(self._generate_getter_setter(field))
+        # Getters, and setters for mutable classes
+        if immutable:
+            yield from _joined(map(self._generate_getter, own_fields), len(own_fields))
+        else:
+            yield from _joined(map(self._generate_getter_setter, own_fields), len(own_fields))
         
-        # toString method
-        class_content.extend(self._generate_to_string_method(model))
+        # toString, equals and hashCode methods
+        yield from self._generate_to_string_method(model)
+        yield from self._generate_equals_method(model)
+        if immutable:
+            yield from self._generate_cached_hash_code_method(model)
+        else:
+            yield from self._generate_hash_code_method(model)
         
-        # equals and hashCode methods
-        class_content.extend(self._generate_equals_method(model))
-        class_content.extend(self._generate_hash_code_method(model))
+        # Streaming XML reader and JSON methods
+        yield from self._generate_serialization_methods(model, style)
         
         # Close class
-        class_content.append("}")
+        yield templates.class_footer()
+    
+    def _iter_base_class(self, base_model: Model, models: Dict[str, Model]) -> Iterator[str]:
+        """
+        Render the abstract base class holding the fields shared by all models.
+        
+        Fields are protected so that the toString and serialization methods
+        of the subclasses can read them directly. The base class compares and
+        hashes the shared fields itself, and the equals and hashCode methods
+        of the subclasses start from super.equals and super.hashCode.
+        
+        Args:
+            base_model: Model of the base class, from ModelGenerator.extract_shared_base
+            models: Dictionary of model name to Model objects; the top-level ones extend it
+            
+        Yields:
+            Consecutive fragments of the Java class content
+        """
+        templates = self.templates
+        immutable = self.style == 'immutable'
         
-        return "\n".join(class_content)
+        header = self._generate_header(base_model.package_name, self._get_type_imports(base_model.fields))
+        yield header + templates.base_class_header(
+            class_name=base_model.class_name,
+            subclasses=", ".join(model.class_name for model in models.values() if model.component_of is None)
+        )
+        yield from _joined((
+            self._generate_field_declaration(field, final=immutable, access="protected")
+            for field in base_model.fields
+        ), len(base_model.fields))
+        if not immutable:
+            yield templates.base_default_constructor(class_name=base_model.class_name)
+        yield from self._generate_parameterized_constructor(base_model, templates.base_constructor)
+        if immutable:
+            yield from _joined(map(self._generate_getter, base_model.fields), len(base_model.fields))
+        else:
+            yield from _joined(map(self._generate_getter_setter, base_model.fields), len(base_model.fields))
+        # Subclasses compare and hash their own fields after these; they cache the hash code themselves
+        yield from self._generate_equals_method(base_model)
+        yield from self._generate_hash_code_method(base_model)
+        yield templates.class_footer()
+    
+    def _generate_header(self, package: str, required_imports: set) -> str:
+        """Generate the package declaration and sorted import statements of a class."""
+        templates = self.templates
+        imports = "".join([templates.import_statement(name=name) for name in sorted(required_imports)])
+        return templates.package(package=package) + (imports + "\n" if imports else "")
+    
+    def _model_style(self, model: Model) -> str:
+        """Get the output style of a model, falling back from record for very wide models."""
+        if self.style == 'record' and parameter_slots(model.fields) > MAX_CONSTRUCTOR_SLOTS:
+            return 'immutable'
+        return self.style
     
     def _get_required_imports(self, model: Model) -> set:
         """Get required import statements for the model."""
+        required_imports = self._get_type_imports(model.fields)
+        
+        if self.xml_readers:
+            # XmlFields collects repeated elements into lists and registers with XmlSupport
+            if any(field.data_type.startswith('List<') for field in model.fields):
+                required_imports.add(self.imports['ArrayList'])
+            required_imports.update((self.imports['List'], XML_READER_IMPORT))
+            if self._reads_xml(model):
+                required_imports.add(XML_EXCEPTION_IMPORT)
+        if self.json:
+            required_imports.update(JSON_IMPORTS)
+        
+        return required_imports
+    
+    def _get_type_imports(self, fields: Iterable[ModelField]) -> set:
+        """Get the import statements of the types of fields."""
         required_imports = set()
         
-        for field in model.fields:
+        for field in fields:
             data_type = field.data_type
             if data_type in self.imports:
                 required_imports.add(self.imports[data_type])
@@ -120,174 +613,970 @@ class JavaStructureGenerator:
         
         return required_imports
     
-    def _generate_field_declaration(self, field: ModelField) -> list:
+    def _generate_field_declaration(self, field: ModelField, final: bool = False,
+                                    access: str = "private") -> str:
         """Generate field declaration with comprehensive documentation."""
-        lines = []
+        templates = self.templates
         
-        # Field documentation
-        lines.append("    /**")
+        # Field documentation; only the data type line is always present
+        doc = "".join((
+            templates.field_doc_xpath(value=field.xpath) if field.xpath else "",
+            templates.field_doc_required(value=field.required_optional_status)
+            if field.required_optional_status else "",
+            templates.field_doc_data_type(value=field.data_type),
+            templates.field_doc_model_value(value=field.model_value) if field.model_value else "",
+            templates.field_doc_additional_info(value=field.additional_info) if field.additional_info else "",
+            templates.field_doc_default_value(value=field.default_value) if field.default_value else "",
+        ))
         
-        # XPath information
-        if field.xpath:
-            lines.append(f"     * xpath: {field.xpath}")
+        # Mutable String fields are initialized with their default value
+        initializer = ""
+        if field.default_value and field.data_type == "String" and not final:
+            initializer = f' = "{field.default_value}"'
         
-        # Required/Optional status
-        if field.required_optional_status:
-            lines.append(f"     * required/optional: {field.required_optional_status}")
+        return templates.field(
+            doc=doc,
+            access=access,
+            modifiers="final " if final else "",
+            data_type=field.data_type,
+            name=field.name,
+            initializer=initializer
+        )
+    
+    def _generate_default_constructor(self, model: Model) -> str:
+        """Generate the default constructor, which sets the defaults of inherited fields."""
+        templates = self.templates
+        assignments = "".join([
+            templates.field_assignment(name=field.name, value=f'"{field.default_value}"')
+            for field in model.fields
+            if field.default_value and field.data_type == "String"
+            and shared_field_key(field) in self._inherited_keys
+        ]) if self.base_model and model.component_of is None and self.style == 'pojo' else ""
         
-        # Data type
-        lines.append(f"     * data_type: {field.data_type}")
+        if assignments:
+            return templates.subclass_default_constructor(class_name=model.class_name, assignments=assignments)
+        return templates.default_constructor(class_name=model.class_name)
+    
+    def _generate_parameterized_constructor(self, model: Model,
+                                            renderer: Optional[Callable[..., str]] = None) -> Iterator[str]:
+        """Generate parameterized constructor."""
+        templates = self.templates
+        fields = model.fields
+        return templates.stream(
+            renderer or templates.constructor,
+            {
+                'param_docs': _joined((
+                    templates.constructor_param_doc(name=field.name, description=field.description or field.name)
+                    for field in fields
+                ), len(fields)),
+                'params': _separated(", ", (f"{field.data_type} {field.name}" for field in fields), len(fields)),
+                'assignments': _joined(
+                    (templates.constructor_assignment(name=field.name) for field in fields), len(fields)
+                ),
+            },
+            class_name=model.class_name
+        )
+    
+    def _generate_subclass_constructor(self, model: Model, base_model: Model,
+                                       own_fields: List[ModelField]) -> Iterator[str]:
+        """Generate the parameterized constructor of a subclass, passing inherited fields to the base class."""
+        templates = self.templates
+        return templates.stream(
+            templates.subclass_constructor,
+            {
+                'param_docs': _joined((
+                    templates.constructor_param_doc(name=field.name, description=field.description or field.name)
+                    for field in model.fields
+                ), len(model.fields)),
+                'params': _separated(
+                    ", ", (f"{field.data_type} {field.name}" for field in model.fields), len(model.fields)
+                ),
+                'super_arguments': _separated(
+                    ", ", (field.name for field in base_model.fields), len(base_model.fields)
+                ),
+                'assignments': _joined(
+                    (templates.constructor_assignment(name=field.name) for field in own_fields), len(own_fields)
+                ),
+            },
+            class_name=model.class_name
+        )
+    
+    def _generate_getter_setter(self, field: ModelField) -> str:
+        """Generate getter and setter methods for a field."""
+        return self.templates.accessors(
+            name=field.name,
+            data_type=field.data_type,
+            capitalized=field.name.capitalize()
+        )
+    
+    def _generate_getter(self, field: ModelField) -> str:
+        """Generate the getter method of a field."""
+        return self.templates.getter(
+            name=field.name,
+            data_type=field.data_type,
+            capitalized=field.name.capitalize()
+        )
+    
+    def _generate_to_string_method(self, model: Model) -> Iterator[str]:
+        """Generate toString method."""
+        # Wider models get helper methods, so a single method is rendered in one piece
+        if len(model.fields) > METHOD_CHUNK_FIELDS:
+            methods = self._generate_chunked_to_string_method(model)
+        elif self.to_string == 'builder' and model.fields:
+            methods = iter((self.templates.to_string_builder(
+                statements="".join(self._to_string_statements(model.fields, f"{model.class_name}{{")),
+                capacity=_to_string_capacity(model, self.to_string_max_items)
+            ),))
+        else:
+            if model.fields:
+                fields = ' + ", " + '.join([f'"{field.name}=" + {field.name}' for field in model.fields])
+                expression = f'"{model.class_name}{{" + {fields} + "}}"'
+            else:
+                expression = f'"{model.class_name}{{}}"'
+            methods = iter((self.templates.to_string(expression=expression),))
         
-        # Model value for this specific model
-        if field.model_value:
-            lines.append(f"     * model_value: {field.model_value}")
+        if self.to_string_max_items is not None and any(_is_list(field) for field in model.fields):
+            return chain(methods, (self.templates.to_string_truncated_list(max_items=self.to_string_max_items),))
+        return methods
+    
+    def _generate_chunked_to_string_method(self, model: Model) -> Iterator[str]:
+        """Generate a toString method appending the fields through helper methods, one per chunk."""
+        templates = self.templates
+        chunks = _chunks(model.fields, METHOD_CHUNK_FIELDS)
+        method = templates.to_string_chunked(
+            statements="".join([
+                templates.to_string_statement(statement=f"toStringFields{index}(toStringBuilder)")
+                for index in range(len(chunks))
+            ]),
+            prefix=_java_string(f"{model.class_name}{{"),
+            capacity=_to_string_capacity(model, self.to_string_max_items),
+            chunk_size=METHOD_CHUNK_FIELDS
+        )
+        helpers = (
+            templates.to_string_helper(
+                index=index,
+                statements="".join(self._to_string_statements(chunk, ", " if index else ""))
+            )
+            for index, chunk in enumerate(chunks)
+        )
+        return chain((method,), helpers)
+    
+    def _to_string_statements(self, fields: List[ModelField], prefix: str = "") -> Iterator[str]:
+        """
+        Generate the statements appending fields to toStringBuilder.
         
-        # Additional info from extra columns
-        if field.additional_info:
-            lines.append(f"     * additional_info: {field.additional_info}")
+        Each statement appends the field's label, including the text before
+        it, as a single literal, then the field's value.
         
-        # Default value
-        if field.default_value:
-            lines.append(f"     * default_value: {field.default_value}")
+        Args:
+            fields: Fields to append
+            prefix: Text before the label of the first field, e.g. the class name
+                and opening brace; later fields are preceded by ", "
         
-        lines.append("     */")
+        Yields:
+            Statements, one per field
+        """
+        for position, field in enumerate(fields):
+            label = _java_string(f"{', ' if position else prefix}{field.name}=")
+            if self.to_string_max_items is not None and _is_list(field):
+                statement = f"appendTruncated(toStringBuilder.append({label}), {field.name})"
+            else:
+                statement = f"toStringBuilder.append({label}).append({field.name})"
+            yield self.templates.to_string_statement(statement=statement)
+    
+    def _extends_base(self, model: Model) -> bool:
+        """Check if a class extends the shared base class; components and the base itself do not."""
+        return self.base_model is not None and model.component_of is None and model is not self.base_model
+    
+    def _own_fields(self, model: Model) -> List[ModelField]:
+        """Get the fields a class declares, compares and hashes itself, leaving out those it inherits."""
+        if not self._extends_base(model):
+            return model.fields
+        return [field for field in model.fields if shared_field_key(field) not in self._inherited_keys]
+    
+    def _generate_equals_method(self, model: Model) -> Iterator[str]:
+        """Generate equals method; subclasses of the base class compare their own fields after super.equals."""
+        templates = self.templates
+        own_fields = self._own_fields(model)
+        inherited = ["super.equals(obj)"] if self._extends_base(model) else []
+        if self.fast_equals:
+            # Stable sort keeps schema order among fields of equal cost
+            fields = sorted(own_fields, key=lambda field: EQUALS_COSTS.get(field.data_type, DEFAULT_EQUALS_COST))
+            super_checks = [templates.equals_check(condition=f"!{call}") for call in inherited]
+            if len(fields) > METHOD_CHUNK_FIELDS:
+                chunks = _chunks(fields, METHOD_CHUNK_FIELDS)
+                method = templates.equals_fast(
+                    checks="".join(super_checks + [
+                        templates.equals_check(condition=f"!equalsFields{index}(that)")
+                        for index in range(len(chunks))
+                    ]),
+                    class_name=model.class_name
+                )
+                helpers = (
+                    templates.equals_fast_helper(
+                        index=index,
+                        class_name=model.class_name,
+                        checks="".join([templates.equals_check(condition=_inequality(field)) for field in chunk])
+                    )
+                    for index, chunk in enumerate(chunks)
+                )
+                return chain((method,), helpers)
+            
+            return iter((templates.equals_fast(
+                checks="".join(super_checks + [
+                    templates.equals_check(condition=_inequality(field)) for field in fields
+                ]),
+                class_name=model.class_name
+            ),))
         
-        # Field declaration
-        field_line = f"    private {field.data_type} {field.name}"
-        if field.default_value and field.data_type == "String":
-            field_line += f' = "{field.default_value}"'
-        field_line += ";"
+        if len(own_fields) > METHOD_CHUNK_FIELDS:
+            chunks = _chunks(own_fields, METHOD_CHUNK_FIELDS)
+            method = templates.equals(
+                expression=" && ".join(inherited + [f"equalsFields{index}(that)" for index in range(len(chunks))]),
+                class_name=model.class_name
+            )
+            helpers = (
+                templates.equals_helper(index=index, class_name=model.class_name,
+                                        expression=" && ".join(map(_equality, chunk)))
+                for index, chunk in enumerate(chunks)
+            )
+            return chain((method,), helpers)
         
-        lines.append(field_line)
-        lines.append("")
+        expression = " && ".join(inherited + list(map(_equality, own_fields))) or "true"
+        return iter((templates.equals(expression=expression, class_name=model.class_name),))
+    
+    def _generate_hash_code_method(self, model: Model) -> Iterator[str]:
+        """Generate hashCode method; subclasses of the base class hash super.hashCode() first."""
+        templates = self.templates
+        own_fields = self._own_fields(model)
+        inherited = ["super.hashCode()"] if self._extends_base(model) else []
+        if len(own_fields) > METHOD_CHUNK_FIELDS:
+            chunks = _chunks(own_fields, METHOD_CHUNK_FIELDS)
+            method = templates.hash_code_chunked(
+                calls="".join([templates.hash_code_term(term=term) for term in inherited]
+                              + [templates.hash_code_call(index=index) for index in range(len(chunks))]),
+                chunk_size=METHOD_CHUNK_FIELDS
+            )
+            return chain((method,), self._generate_hash_code_helpers(chunks))
         
-        return lines
+        if self.fast_equals:
+            # Same order and seed as Objects.hash, so hash values do not change
+            return iter((templates.hash_code_fast(
+                terms="".join([templates.hash_code_term(term=term)
+                               for term in inherited + list(map(_hash_term, own_fields))])
+            ),))
+        
+        terms = inherited + [field.name for field in own_fields]
+        expression = f"java.util.Objects.hash({', '.join(terms)})" if terms else "0"
+        return iter((templates.hash_code(expression=expression),))
     
-    def _generate_parameterized_constructor(self, model: Model) -> list:
-        """Generate parameterized constructor."""
-        lines = []
+    def _generate_cached_hash_code_method(self, model: Model) -> Iterator[str]:
+        """Generate a hashCode method computing the hash once and caching it in a field."""
+        line = self.templates.hash_code_cached_line
+        own_fields = self._own_fields(model)
+        inherited = ["super.hashCode()"] if self._extends_base(model) else []
+        helpers = ()
+        if len(own_fields) > METHOD_CHUNK_FIELDS:
+            chunks = _chunks(own_fields, METHOD_CHUNK_FIELDS)
+            statements = ["h = 1;", *(f"h = 31 * h + {term};" for term in inherited),
+                          *(f"h = hashCodeFields{index}(h);" for index in range(len(chunks)))]
+            helpers = self._generate_hash_code_helpers(chunks)
+        elif self.fast_equals:
+            terms = inherited + list(map(_hash_term, own_fields))
+            statements = ["h = 1;", *(f"h = 31 * h + {term};" for term in terms)]
+        elif inherited or own_fields:
+            terms = inherited + [field.name for field in own_fields]
+            statements = [f"h = java.util.Objects.hash({', '.join(terms)});"]
+        else:
+            statements = ["h = 0;"]
         
-        # Constructor documentation
-        lines.append("    /**")
-        lines.append("     * Parameterized constructor")
-        for field in model.fields:
-            lines.append(f"     * @param {field.name} {field.description or field.name}")
-        lines.append("     */")
+        method = self.templates.hash_code_cached(
+            computation="".join([line(statement=statement) for statement in statements]),
+            cache_field=self._hash_cache_field(model)
+        )
+        return chain((method,), helpers)
+    
+    def _generate_hash_code_helpers(self, chunks: List[List[ModelField]]) -> Iterator[str]:
+        """Generate the helper methods folding each chunk of fields into a hash code."""
+        templates = self.templates
+        return (
+            templates.hash_code_helper(index=index, terms="".join([
+                templates.hash_code_term(term=_hash_term(field)) for field in chunk
+            ]))
+            for index, chunk in enumerate(chunks)
+        )
+    
+    def _hash_cache_field(self, model: Model) -> str:
+        """Get a name for the cached hash code field that no model field uses."""
+        field_names = {field.name for field in model.fields}
+        name = HASH_CACHE_FIELD
+        while name in field_names:
+            name += "_"
+        return name
+    
+    def _generate_record(self, model: Model) -> Iterator[str]:
+        """Generate a Java record declaration; records provide accessors, equals, hashCode and toString."""
+        templates = self.templates
+        return templates.stream(
+            templates.record,
+            {
+                'component_docs': _joined((
+                    templates.record_component_doc(name=field.name, description=field.description or field.name)
+                    for field in model.fields
+                ), len(model.fields)),
+                'components': _separated(
+                    ", ", (f"{field.data_type} {field.name}" for field in model.fields), len(model.fields)
+                ),
+                'body': (
+                    chain(("\n",), self._generate_serialization_methods(model, 'record'))
+                    if self._reads_xml(model) or self.json else ()
+                ),
+            },
+            class_name=model.class_name
+        )
+    
+    def _reads_xml(self, model: Model) -> bool:
+        """Check if a class gets a fromXml reader; components are read by their top-level class."""
+        return self.xml_readers and model.component_of is None
+    
+    def _generate_serialization_methods(self, model: Model, style: str) -> Iterator[str]:
+        """Generate the enabled XML reader and JSON methods of a class."""
+        if self._reads_xml(model):
+            yield self.templates.xml_reader(class_name=model.class_name)
+        if self.xml_readers:
+            yield from self._generate_xml_fields(model, style)
+        if self.json:
+            yield from self._generate_json_methods(model, style)
+    
+    def _generate_xml_fields(self, model: Model, style: str) -> Iterator[str]:
+        """
+        Generate the XmlFields class reading the fields of a class from XML.
         
-        # Constructor signature
-        params = [f"{field.data_type} {field.name}" for field in model.fields]
-        lines.append(f"    public {model.class_name}({', '.join(params)}) {{")
+        Fields are read through a path-state table of their XPaths: element
+        starts move to the child state through a switch on the state and the
+        element's local name, and element ends return to the parent state
+        from a static array. Attributes are read on entering their element's
+        state and text on leaving it. Components are read by XmlFields of
+        their own, which XmlSupport.read drives in the same pass, and built
+        from them. Each switch is split into helper methods over ranges of
+        states once it has cases for more than METHOD_CHUNK_FIELDS fields or
+        child elements.
         
-        # Constructor body
-        for field in model.fields:
-            lines.append(f"        this.{field.name} = {field.name};")
+        Args:
+            model: Model object to generate the reader for
+            style: Output style of the class, which decides the initial values
+            
+        Returns:
+            Iterator over fragments of the XmlFields class
+        """
+        templates = self.templates
+        own_fields = [field for field in model.fields if field.data_type not in self._components]
+        states = build_path_table(own_fields)
         
-        lines.append("    }")
-        lines.append("")
+        transition, transition_helpers = self._xml_state_switch(
+            [
+                (number, len(state.transitions), templates.xml_transition_case(
+                    state=number,
+                    name_cases="".join([
+                        templates.xml_name_case(name=_java_string(name), state=child)
+                        for name, child in state.transitions.items()
+                    ])
+                ))
+                for number, state in enumerate(states) if state.transitions
+            ],
+            templates.xml_transition_switch, templates.xml_transition_helper,
+            "return transition{index}(xmlState, xmlName);"
+        )
+        attributes, attribute_helpers = self._xml_state_switch(
+            [
+                (number, len(reads), templates.xml_attribute_case(state=number, statements="".join(reads)))
+                for number, state in enumerate(states)
+                if (reads := [
+                    templates.xml_attribute_read(attribute=_java_string(attribute), assignment=assignment)
+                    for attribute, field in state.attribute_fields
+                    if (assignment := _xml_assignment(field))
+                ])
+            ],
+            templates.xml_attributes_switch, templates.xml_attributes_helper,
+            "attributes{index}(xmlState, xmlReader);"
+        )
+        text, text_helpers = self._xml_state_switch(
+            [
+                (number, len(reads), templates.xml_text_case(state=number, statements="".join(reads)))
+                for number, state in enumerate(states)
+                if (reads := [
+                    templates.xml_text_read(assignment=assignment)
+                    for field in state.text_fields
+                    if (assignment := _xml_assignment(field))
+                ])
+            ],
+            templates.xml_text_switch, templates.xml_text_helper,
+            "text{index}(xmlState, xmlValue);"
+        )
         
-        return lines
+        return templates.stream(
+            templates.xml_fields,
+            {
+                'parent_states': _separated(", ", (str(state.parent) for state in states), len(states)),
+                'text_states': _separated(", ", (
+                    "true" if state.text_fields else "false" for state in states
+                ), len(states)),
+                'fields': _joined((
+                    templates.xml_field(name=field.name, data_type=field.data_type,
+                                        value=_initial_value(field, style))
+                    if (component := self._components.get(field.data_type)) is None
+                    else templates.xml_component_field(name=field.name, class_name=component.class_name)
+                    for field in model.fields
+                ), len(model.fields)),
+                'add_readers': [
+                    *((templates.xml_add_self(),) if len(states) > 1 else ()),
+                    *(templates.xml_add_component(name=field.name)
+                      for field in model.fields if field.data_type in self._components)
+                ],
+                'arguments': _separated(", ", (
+                    f"{field.name}.build()" if field.data_type in self._components else field.name
+                    for field in model.fields
+                ), len(model.fields)),
+                'helpers': transition_helpers + attribute_helpers + text_helpers,
+            },
+            class_name=model.class_name,
+            transition=transition or templates.xml_no_transition(),
+            attributes=attributes,
+            text=text
+        )
     
-    def _generate_getter_setter(self, field: ModelField) -> list:
-        """Generate getter and setter methods for a field."""
-        lines = []
-        
-        # Getter
-        getter_name = f"get{field.name.capitalize()}"
-        lines.append(f"    /**")
-        lines.append(f"     * Get {field.name}")
-        lines.append(f"     * @return {field.data_type}")
-        lines.append(f"     */")
-        lines.append(f"    public {field.data_type} {getter_name}() {{")
-        lines.append(f"        return {field.name};")
-        lines.append("    }")
-        lines.append("")
-        
-        # Setter
-        setter_name = f"set{field.name.capitalize()}"
-        lines.append(f"    /**")
-        lines.append(f"     * Set {field.name}")
-        lines.append(f"     * @param {field.name} {field.data_type}")
-        lines.append(f"     */")
-        lines.append(f"    public void {setter_name}({field.data_type} {field.name}) {{")
-        lines.append(f"        this.{field.name} = {field.name};")
-        lines.append("    }")
-        lines.append("")
-        
-        return lines
-    
-    def _generate_to_string_method(self, model: Model) -> list:
-        """Generate toString method."""
-        lines = []
+    def _xml_state_switch(self, cases: List[Tuple[int, int, str]], switch: Callable[..., str],
+                          helper: Callable[..., str], call: str) -> Tuple[str, List[str]]:
+        """
+        Render a switch on the path state, split into helper methods over ranges of states.
+        
+        Args:
+            cases: (state, number of fields or child elements, case source) tuples, in state order
+            switch: Template of the switch statement, taking its cases
+            helper: Template of a helper method, taking its index and switch statement
+            call: Statement calling a helper method, with an {index} placeholder
+            
+        Returns:
+            (body of the method, its helper methods) tuple; the body is empty
+            if there are no cases
+        """
+        # (first state, cases) of each range, with cases for at most METHOD_CHUNK_FIELDS items
+        ranges: List[Tuple[int, List[str]]] = []
+        size = 0
+        for state, items, case in cases:
+            if not ranges or size + items > METHOD_CHUNK_FIELDS:
+                ranges.append((state, []))
+                size = 0
+            ranges[-1][1].append(case)
+            size += items
         
-        lines.append("    /**")
-        lines.append("     * String representation of the object")
-        lines.append("     * @return String")
-        lines.append("     */")
-        lines.append("    @Override")
-        lines.append("    public String toString() {")
+        if not ranges:
+            return "", []
+        if len(ranges) == 1:
+            return switch(cases="".join(ranges[0][1])), []
         
-        if model.fields:
-            field_strings = [f'"{field.name}=" + {field.name}' for field in model.fields]
-            toString_content = f'"{model.class_name}{{" + ' + ' + ", " + '.join(field_strings) + ' + "}"'
-            lines.append(f"        return {toString_content};")
-        else:
-            lines.append(f'        return "{model.class_name}{{}}";')
+        templates = self.templates
+        dispatch = [templates.xml_dispatch_first(bound=ranges[1][0], statement=call.format(index=0))]
+        dispatch.extend(
+            templates.xml_dispatch_next(bound=ranges[index + 1][0], statement=call.format(index=index))
+            for index in range(1, len(ranges) - 1)
+        )
+        dispatch.append(templates.xml_dispatch_last(statement=call.format(index=len(ranges) - 1)))
+        helpers = [
+            helper(index=index, switch=switch(cases="".join(range_cases)))
+            for index, (_, range_cases) in enumerate(ranges)
+        ]
+        return "".join(dispatch), helpers
+    
+    def _generate_json_methods(self, model: Model, style: str) -> Iterator[str]:
+        """
+        Generate reflection-free writeJson, toJson, readJson and fromJson methods.
         
-        lines.append("    }")
-        lines.append("")
+        Member names are written from static constants that are escaped once,
+        at generation time, and already include the separators around them, so
+        each member costs one append for its name and one for its value.
+        toJson presizes its buffer from the expected length of every field.
+        readJson pulls tokens from a JsonSupport.Reader and dispatches on the
+        member name with a string switch.
         
-        return lines
+        Args:
+            model: Model object to generate the methods for
+            style: Output style of the class, which decides the initial values
+            
+        Returns:
+            Iterator over fragments of the JSON methods
+        """
+        templates = self.templates
+        fields = model.fields
+        constants = [f"JSON_NAME_{index}" for index in range(len(fields))]
+        
+        return templates.stream(
+            templates.json_methods,
+            {
+                'name_constants': _joined((
+                    templates.json_name_constant(
+                        constant=constant,
+                        literal=_java_string(f'{"," if index else ""}"{field.name}":')
+                    )
+                    for index, (constant, field) in enumerate(zip(constants, fields))
+                ), len(fields)),
+                'writes': _joined((
+                    templates.json_write(constant=constant, statement=_json_write(field))
+                    for constant, field in zip(constants, fields)
+                ), len(fields)),
+                'locals': _joined((
+                    templates.local_variable(name=field.name, data_type=field.data_type,
+                                             value=_initial_value(field, style))
+                    for field in fields
+                ), len(fields)),
+                'cases': _joined((
+                    templates.json_read_case(member=_java_string(field.name), name=field.name,
+                                             value=_json_read(field))
+                    for field in fields
+                ), len(fields)),
+                'arguments': _separated(", ", (field.name for field in fields), len(fields)),
+            },
+            class_name=model.class_name,
+            size_hint=str(2 + sum(len(field.name) + 4 + _value_size_estimate(field) for field in fields))
+        )
     
-    def _generate_equals_method(self, model: Model) -> list:
-        """Generate equals method."""
-        lines = []
+    def _generate_mapper_class(self, source: Model, target: Model) -> Iterator[str]:
+        """
+        Generate a class mapping one model to another by direct field copies.
         
-        lines.append("    /**")
-        lines.append("     * Check equality with another object")
-        lines.append("     * @param obj Object to compare")
-        lines.append("     * @return boolean")
-        lines.append("     */")
-        lines.append("    @Override")
-        lines.append("    public boolean equals(Object obj) {")
-        lines.append("        if (this == obj) return true;")
-        lines.append("        if (obj == null || getClass() != obj.getClass()) return false;")
-        lines.append(f"        {model.class_name} that = ({model.class_name}) obj;")
+        Fields are joined on their XPath: each target field is passed the
+        source field of the same XPath and type through its accessor, so no
+        reflection or intermediate map is involved. Target fields without a
+        counterpart, such as fields the source model does not use, get the
+        initial value their own class would give them. Every component of the
+        target is built by a nested component mapper of its own, which reads
+        the source components it needs into locals, so no method grows with
+        the number of fields of the whole model.
         
-        if model.fields:
-            conditions = []
-            for field in model.fields:
-                if field.data_type in ['String', 'BigDecimal'] or field.data_type.startswith('List'):
-                    conditions.append(f"java.util.Objects.equals({field.name}, that.{field.name})")
-                else:
-                    conditions.append(f"java.util.Objects.equals({field.name}, that.{field.name})")
+        Args:
+            source: Model mapped from
+            target: Model mapped to
             
-            lines.append(f"        return {' && '.join(conditions)};")
-        else:
-            lines.append("        return true;")
+        Returns:
+            Iterator over fragments of the mapper class
+        """
+        templates = self.templates
+        # XPath -> (field, component fields leading to the class holding it)
+        source_values: Dict[str, Tuple[ModelField, Tuple[ModelField, ...]]] = {}
+        
+        def index_source(model: Model, path: Tuple[ModelField, ...]) -> None:
+            for field in model.fields:
+                component = self._components.get(field.data_type)
+                if component is not None:
+                    index_source(component, path + (field,))
+                elif field.xpath:
+                    # The first field of a repeated XPath wins
+                    source_values.setdefault(field.xpath, (field, path))
+        
+        index_source(source, ())
+        
+        def mapped(field: ModelField) -> bool:
+            source_field = source_values.get(field.xpath, (None,))[0]
+            return source_field is not None and source_field.data_type == field.data_type
         
-        lines.append("    }")
-        lines.append("")
+        target_fields = list(leaf_fields(target, self._components))
+        target_components: Dict[str, Model] = {}
         
-        return lines
+        def collect_components(model: Model) -> None:
+            for field in model.fields:
+                component = self._components.get(field.data_type)
+                if component is not None and component.class_name not in target_components:
+                    target_components[component.class_name] = component
+                    collect_components(component)
+        
+        collect_components(target)
+        
+        def component_mapper(component: Model) -> str:
+            declarations, arguments = self._mapper_fields(
+                component, source, source_values, templates.mapper_component_local
+            )
+            return templates.mapper_component_class(
+                source_name=source.class_name,
+                target_name=target.class_name,
+                component_name=component.class_name,
+                locals="".join(declarations),
+                arguments="".join(arguments)
+            )
+        
+        declarations, arguments = self._mapper_fields(target, source, source_values, templates.local_variable)
+        return templates.stream(
+            templates.mapper_class,
+            {
+                'locals': declarations,
+                'arguments': arguments,
+                'component_mappers': map(component_mapper, target_components.values()),
+            },
+            package=target.package_name,
+            mapper_name=_mapper_name(source, target),
+            source_name=source.class_name,
+            target_name=target.class_name,
+            mapped_count=str(sum(map(mapped, target_fields))),
+            field_count=str(len(target_fields))
+        )
     
-    def _generate_hash_code_method(self, model: Model) -> list:
-        """Generate hashCode method."""
-        lines = []
+    def _mapper_fields(self, target: Model, source: Model,
+                       source_values: Dict[str, Tuple[ModelField, Tuple[ModelField, ...]]],
+                       local_variable: Callable[..., str]) -> Tuple[List[str], Iterable[str]]:
+        """
+        Get the source component locals and constructor arguments mapping a source model to a class.
+        
+        Args:
+            target: Class built, a top-level model or one of its components
+            source: Model mapped from, held in the variable "source"
+            source_values: Source fields by XPath, with the component fields
+                leading to the class holding each
+            local_variable: Template declaring a local variable
+            
+        Returns:
+            (local variable declarations, fragments of the argument list) tuple;
+            components of the target are built by their component mappers
+        """
+        target_style = self._model_style(target)
+        declarations: List[str] = []
+        # Names of the component fields from the source model down -> (local holding the component, its class)
+        holders: Dict[Tuple[str, ...], Tuple[str, Model]] = {(): ("source", source)}
         
-        lines.append("    /**")
-        lines.append("     * Generate hash code")
-        lines.append("     * @return int")
-        lines.append("     */")
-        lines.append("    @Override")
-        lines.append("    public int hashCode() {")
+        def holder(path: Tuple[ModelField, ...]) -> Tuple[str, Model]:
+            key = tuple(field.name for field in path)
+            if key not in holders:
+                parent, parent_model = holder(path[:-1])
+                component = self._components[path[-1].data_type]
+                local = f"sourceComponent{len(holders)}"
+                access = f"{parent}.{_accessor_name(path[-1], self._model_style(parent_model) == 'record')}()"
+                declarations.append(local_variable(
+                    name=local, data_type=component.class_name,
+                    value=access if len(path) == 1 else f"{parent} == null ? null : {access}"
+                ))
+                holders[key] = (local, component)
+            return holders[key]
         
-        if model.fields:
-            field_names = [field.name for field in model.fields]
-            lines.append(f"        return java.util.Objects.hash({', '.join(field_names)});")
-        else:
-            lines.append("        return 0;")
+        def value(field: ModelField) -> str:
+            component = self._components.get(field.data_type)
+            if component is not None:
+                return f"{component.class_name}Mapper.map(source)"
+            source_field, path = source_values.get(field.xpath, (None, ()))
+            initial_value = _initial_value(field, target_style)
+            if source_field is None or source_field.data_type != field.data_type:
+                return initial_value
+            local, model = holder(path)
+            access = f"{local}.{_accessor_name(source_field, self._model_style(model) == 'record')}()"
+            return access if not path else f"{local} == null ? {initial_value} : {access}"
+        
+        # Arguments are rendered first, declaring the locals they use
+        arguments = list(_separated(", ", map(value, target.fields), len(target.fields)))
+        return declarations, arguments
+    
+    def _generate_mapper_benchmark_class(self, models: List[Model],
+                                         pairs: List[Tuple[Model, Model]]) -> Iterator[str]:
+        """Generate a JMH benchmark of every mapper, mapping one sample instance per model."""
+        templates = self.templates
+        package = models[0].package_name
+        imports = sorted(chain(
+            (model.class_name for model in models),
+            (_mapper_name(source, target) for source, target in pairs)
+        ))
+        
+        return templates.stream(
+            templates.mapper_benchmark_class,
+            {
+                'imports': (templates.import_statement(name=f"{package}.{name}") for name in imports),
+                'sources': (
+                    templates.mapper_benchmark_source(class_name=model.class_name,
+                                                      variable=_variable_name(model))
+                    for model in models
+                ),
+                'setups': (
+                    templates.mapper_benchmark_setup(class_name=model.class_name, variable=_variable_name(model))
+                    for model in models
+                ),
+                'methods': (
+                    templates.mapper_benchmark_method(
+                        target_name=target.class_name,
+                        method=f"{_variable_name(source)}To{target.class_name}",
+                        mapper_name=_mapper_name(source, target),
+                        variable=_variable_name(source)
+                    )
+                    for source, target in pairs
+                ),
+                'factories': chain.from_iterable(map(self._sample_factories, models)),
+            },
+            package=f"{package}.{BENCHMARK_PACKAGE}"
+        )
+    
+    def _generate_benchmark_class(self, model: Model) -> Iterator[str]:
+        """Generate a JMH benchmark of the equals and hashCode methods of a model."""
+        return self.templates.stream(
+            self.templates.benchmark_class,
+            {'factories': self._sample_factories(model)},
+            package=f"{model.package_name}.{BENCHMARK_PACKAGE}",
+            model_package=model.package_name,
+            class_name=model.class_name
+        )
+    
+    def _sample_factories(self, model: Model) -> Iterator[str]:
+        """
+        Generate the benchmark methods creating a sample instance of a model.
         
-        lines.append("    }")
-        lines.append("")
+        Args:
+            model: Model to create
+            
+        Returns:
+            Iterator over one create method per class, the model first and then
+            each of its components, so no method grows with the number of
+            fields of the whole model
+        """
+        yield self.templates.benchmark_factory(
+            class_name=model.class_name,
+            arguments="".join(_separated(", ", (
+                _sample_value(field) if (component := self._components.get(field.data_type)) is None
+                else f"create{component.class_name}()"
+                for field in model.fields
+            ), len(model.fields)))
+        )
+        for field in model.fields:
+            component = self._components.get(field.data_type)
+            if component is not None:
+                yield from self._sample_factories(component)
+
+
+def _initial_value(field: ModelField, style: str) -> str:
+    """Get the Java initial value of a field read from XML or JSON: the field's own default."""
+    if style == 'pojo' and field.default_value and field.data_type == "String":
+        return f'"{field.default_value}"'
+    return PRIMITIVE_DEFAULTS.get(field.data_type, "null")
+
+
+def _xml_assignment(field: ModelField) -> Optional[str]:
+    """Get the Java statement storing XML text held in xmlValue into an XmlFields field."""
+    name = field.name
+    if field.data_type.startswith('List<'):
+        # Repeated elements are collected in document order
+        return f"if ({name} == null) {name} = new ArrayList<>(); {name}.add(xmlValue);"
+    
+    conversion = XML_CONVERSIONS.get(field.data_type)
+    if conversion is None:
+        # Nested classes are not bound from XML
+        return None
+    if field.data_type == 'String':
+        return f"{name} = {conversion};"
+    return f"if (!xmlValue.isBlank()) {name} = {conversion};"
+
+
+def _json_write(field: ModelField) -> str:
+    """Get the Java statement writing the JSON value of a field to jsonOut."""
+    writer = JSON_WRITERS.get(field.data_type)
+    if writer is None:
+        # Nested classes write themselves
+        return f'if ({field.name} == null) jsonOut.append("null"); else {field.name}.writeJson(jsonOut);'
+    return f"{JSON_SUPPORT_CLASS}.{writer}(jsonOut, {field.name});"
+
+
+def _json_read(field: ModelField) -> str:
+    """Get the Java expression reading the JSON value of a field from jsonIn."""
+    reader = JSON_READERS.get(field.data_type)
+    if reader is None:
+        # Nested classes read themselves
+        return f"{field.data_type}.readJson(jsonIn)"
+    return f"jsonIn.{reader}()"
+
+
+def _value_size_estimate(field: ModelField) -> int:
+    """Get the expected printed length of the value of a field."""
+    if field.data_type not in JSON_WRITERS:
+        # Nested classes
+        return NESTED_VALUE_SIZE_ESTIMATE
+    return VALUE_SIZE_ESTIMATES.get(field.data_type, DEFAULT_VALUE_SIZE_ESTIMATE)
+
+
+def _mapper_name(source: Model, target: Model) -> str:
+    """Get the class name of the mapper from one model to another."""
+    return f"{source.class_name}To{target.class_name}Mapper"
+
+
+def _accessor_name(field: ModelField, record: bool) -> str:
+    """Get the name of a field's accessor method: the component name for records, else its getter."""
+    return field.name if record else f"get{field.name.capitalize()}"
+
+
+def _variable_name(model: Model) -> str:
+    """Get a Java variable name for an instance of a model."""
+    class_name = model.class_name
+    return class_name[:1].lower() + class_name[1:]
+
+
+def _java_string(value: str) -> str:
+    """Quote a value as a Java string literal."""
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"')
+               .replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t'))
+    return f'"{escaped}"'
+
+
+def _equality(field: ModelField) -> str:
+    """Get the Java condition under which a field equals the same field of 'that'."""
+    name = field.name
+    if field.data_type in ('float', 'double'):
+        # Same semantics as Float/Double.equals for NaN and signed zeros
+        return f"{field.data_type.capitalize()}.compare({name}, that.{name}) == 0"
+    if field.data_type in PRIMITIVE_HASH_FUNCTIONS:
+        return f"{name} == that.{name}"
+    return f"java.util.Objects.equals({name}, that.{name})"
+
+
+def _inequality(field: ModelField) -> str:
+    """Get the Java condition under which a field differs from the same field of 'that'."""
+    name = field.name
+    if field.data_type in ('float', 'double'):
+        # Same semantics as Float/Double.equals for NaN and signed zeros
+        return f"{field.data_type.capitalize()}.compare({name}, that.{name}) != 0"
+    if field.data_type in PRIMITIVE_HASH_FUNCTIONS:
+        return f"{name} != that.{name}"
+    return f"!java.util.Objects.equals({name}, that.{name})"
+
+
+def _hash_term(field: ModelField) -> str:
+    """Get the Java expression hashing a field without boxing."""
+    hash_function = PRIMITIVE_HASH_FUNCTIONS.get(field.data_type)
+    if hash_function:
+        return f"{hash_function}({field.name})"
+    return f"java.util.Objects.hashCode({field.name})"
+
+
+def _sample_value(field: ModelField) -> str:
+    """Get a Java expression of a sample value for a field."""
+    if field.data_type == 'String':
+        return _java_string(field.model_value or field.name)
+    # Nested classes have no constructor that every style provides, so they stay null
+    return SAMPLE_VALUES.get(field.data_type) or PRIMITIVE_DEFAULTS.get(field.data_type, 'null')
+
+
+# Generator used by render worker processes, set by _init_render_worker
+_worker_generator: Optional[JavaStructureGenerator] = None
+
+
+def _init_render_worker(generator: JavaStructureGenerator) -> None:
+    """Set the generator used by this render worker process."""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _render_worker_class(model: Model) -> bytes:
+    """Render the Java class of a model in a worker process, encoded as UTF-8."""
+    return _worker_generator._generate_java_class(model).encode('utf-8')
+
+
+def _replace_if_changed(file_path: Path, content: Union[bytes, Callable[[], Iterable[bytes]]]) -> bool:
+    """
+    Write content to a file unless the file already has the same content.
+    
+    The SHA-256 digest of the content is computed first, chunk by chunk, and
+    compared to that of the existing file, so an unchanged file is neither
+    written nor touched. Otherwise the content is streamed into a temporary
+    file next to the target, which is renamed over it. Content given as a
+    function is rendered again for the write rather than held in memory; a
+    missing file is written in a single pass.
+    
+    Args:
+        file_path: Path of the file
+        content: Content, or a function returning an iterable of consecutive
+            chunks of it
         
-        return lines
+    Returns:
+        True if the file was written, False if it was unchanged
+    """
+    render = partial(iter, (content,)) if isinstance(content, bytes) else content
+    
+    existing_digest = _file_digest(file_path)
+    if existing_digest is not None:
+        digest = hashlib.sha256()
+        for data in render():
+            digest.update(data)
+        if digest.digest() == existing_digest:
+            return False
+    
+    # Created with open() rather than tempfile so the usual umask applies
+    temp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temp_path, 'xb', buffering=WRITE_BUFFER_SIZE) as f:
+            for data in render():
+                f.write(data)
+        os.replace(temp_path, file_path)
+        return True
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _encoded(render: Callable[[], Iterable[str]]) -> Callable[[], Iterator[bytes]]:
+    """Get a function rendering the same content as UTF-8 chunks."""
+    return lambda: (fragment.encode('utf-8') for fragment in render())
+
+
+def _file_digest(file_path: Path) -> Optional[bytes]:
+    """Get the SHA-256 digest of a file, or None if it does not exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(WRITE_BUFFER_SIZE), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.digest()
+
+
+def _is_list(field: ModelField) -> bool:
+    """Check if a field holds a java.util.List."""
+    return field.data_type.startswith('List<')
+
+
+def _to_string_capacity(model: Model, max_items: Optional[int]) -> int:
+    """Get the expected length of the toString result of a model."""
+    capacity = len(model.class_name) + 2
+    for field in model.fields:
+        if max_items is not None and _is_list(field):
+            # Shown elements, then "... (N more)"
+            value_size = max_items * (VALUE_SIZE_ESTIMATES['String'] + 2) + 16
+        else:
+            value_size = _value_size_estimate(field)
+        capacity += len(field.name) + 3 + value_size
+    return capacity
+
+
+def _chunks(items: List[ModelField], size: int) -> List[List[ModelField]]:
+    """Split a list into consecutive chunks of at most size items."""
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def _separated(separator: str, items: Iterable[str], count: int) -> Iterable[str]:
+    """
+    Join items with a separator into the fragments of a streamed section.
+    
+    Args:
+        separator: Text between consecutive items
+        items: Items to join
+        count: Number of items, or an upper bound of it
+    
+    Returns:
+        A single fragment when there are at most STREAM_BATCH_ITEMS items,
+        else an iterator over fragments of STREAM_BATCH_ITEMS items each
+    """
+    if count <= STREAM_BATCH_ITEMS:
+        return [separator.join(items)]
+    return _separated_batches(separator, iter(items))
+
+
+def _separated_batches(separator: str, items: Iterator[str]) -> Iterator[str]:
+    """Yield items joined STREAM_BATCH_ITEMS at a time, each batch after the first prefixed with the separator."""
+    prefix = ""
+    while batch := list(islice(items, STREAM_BATCH_ITEMS)):
+        yield prefix + separator.join(batch)
+        prefix = separator
+
+
+def _joined(fragments: Iterable[str], count: int) -> Iterable[str]:
+    """Concatenate fragments into the fragments of a streamed section; see _separated."""
+    return _separated("", fragments, count)
@@ -0,0 +1,1617 @@
+"""
+Java Templates Module
+
+This module holds the source templates of generated Java classes and compiles them for rendering.
+"""
+
+from string import Formatter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+
+# Templates of the generated Java source; every line ends with a newline and
+# literal braces are doubled, as in str.format
+TEMPLATES = {
+    'package': "package {package};\n\n",
+    'import_statement': "import {name};\n",
+    'class_header': (
+        "/**\n"
+        " * {class_name} - Auto-generated model class\n"
+        " * Generated from CSV schema definition\n"
+        " */\n"
+        "public {modifiers}class {class_name}{superclass} {{\n"
+        "\n"
+    ),
+    'class_footer': "}}",
+    'field_doc_xpath': "     * xpath: {value}\n",
+    'field_doc_required': "     * required/optional: {value}\n",
+    'field_doc_data_type': "     * data_type: {value}\n",
+    'field_doc_model_value': "     * model_value: {value}\n",
+    'field_doc_additional_info': "     * additional_info: {value}\n",
+    'field_doc_default_value': "     * default_value: {value}\n",
+    'field': (
+        "    /**\n"
+        "{doc}"
+        "     */\n"
+        "    {access} {modifiers}{data_type} {name}{initializer};\n"
+        "\n"
+    ),
+    'default_constructor': (
+        "    /**\n"
+        "     * Default constructor\n"
+        "     */\n"
+        "    public {class_name}() {{\n"
+        "    }}\n"
+        "\n"
+    ),
+    'base_class_header': (
+        "/**\n"
+        " * {class_name} - Auto-generated base class of the fields shared by {subclasses}\n"
+        " * Generated from CSV schema definition\n"
+        " */\n"
+        "public abstract class {class_name} {{\n"
+        "\n"
+    ),
+    'base_default_constructor': (
+        "    /**\n"
+        "     * Default constructor\n"
+        "     */\n"
+        "    protected {class_name}() {{\n"
+        "    }}\n"
+        "\n"
+    ),
+    'base_constructor': (
+        "    /**\n"
+        "     * Parameterized constructor\n"
+        "{param_docs}"
+        "     */\n"
+        "    protected {class_name}({params}) {{\n"
+        "{assignments}"
+        "    }}\n"
+        "\n"
+    ),
+    'subclass_default_constructor': (
+        "    /**\n"
+        "     * Default constructor\n"
+        "     */\n"
+        "    public {class_name}() {{\n"
+        "{assignments}"
+        "    }}\n"
+        "\n"
+    ),
+    'field_assignment': "        this.{name} = {value};\n",
+    'subclass_constructor': (
+        "    /**\n"
+        "     * Parameterized constructor\n"
+        "{param_docs}"
+        "     */\n"
+        "    public {class_name}({params}) {{\n"
+        "        super({super_arguments});\n"
+        "{assignments}"
+        "    }}\n"
+        "\n"
+    ),
+    'constructor_param_doc': "     * @param {name} {description}\n",
+    'constructor_assignment': "        this.{name} = {name};\n",
+    'constructor': (
+        "    /**\n"
+        "     * Parameterized constructor\n"
+        "{param_docs}"
+        "     */\n"
+        "    public {class_name}({params}) {{\n"
+        "{assignments}"
+        "    }}\n"
+        "\n"
+    ),
+    'accessors': (
+        "    /**\n"
+        "     * Get {name}\n"
+        "     * @return {data_type}\n"
+        "     */\n"
+        "    public {data_type} get{capitalized}() {{\n"
+        "        return {name};\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Set {name}\n"
+        "     * @param {name} {data_type}\n"
+        "     */\n"
+        "    public void set{capitalized}({data_type} {name}) {{\n"
+        "        this.{name} = {name};\n"
+        "    }}\n"
+        "\n"
+    ),
+    'getter': (
+        "    /**\n"
+        "     * Get {name}\n"
+        "     * @return {data_type}\n"
+        "     */\n"
+        "    public {data_type} get{capitalized}() {{\n"
+        "        return {name};\n"
+        "    }}\n"
+        "\n"
+    ),
+    'to_string': (
+        "    /**\n"
+        "     * String representation of the object\n"
+        "     * @return String\n"
+        "     */\n"
+        "    @Override\n"
+        "    public String toString() {{\n"
+        "        return {expression};\n"
+        "    }}\n"
+        "\n"
+    ),
+    'equals': (
+        "    /**\n"
+        "     * Check equality with another object\n"
+        "     * @param obj Object to compare\n"
+        "     * @return boolean\n"
+        "     */\n"
+        "    @Override\n"
+        "    public boolean equals(Object obj) {{\n"
+        "        if (this == obj) return true;\n"
+        "        if (obj == null || getClass() != obj.getClass()) return false;\n"
+        "        {class_name} that = ({class_name}) obj;\n"
+        "        return {expression};\n"
+        "    }}\n"
+        "\n"
+    ),
+    'hash_code': (
+        "    /**\n"
+        "     * Generate hash code\n"
+        "     * @return int\n"
+        "     */\n"
+        "    @Override\n"
+        "    public int hashCode() {{\n"
+        "        return {expression};\n"
+        "    }}\n"
+        "\n"
+    ),
+    'equals_fast': (
+        "    /**\n"
+        "     * Check equality with another object\n"
+        "     * Compares cheap primitive and boxed fields first\n"
+        "     * @param obj Object to compare\n"
+        "     * @return boolean\n"
+        "     */\n"
+        "    @Override\n"
+        "    public boolean equals(Object obj) {{\n"
+        "        if (this == obj) return true;\n"
+        "        if (obj == null || getClass() != obj.getClass()) return false;\n"
+        "        {class_name} that = ({class_name}) obj;\n"
+        "{checks}"
+        "        return true;\n"
+        "    }}\n"
+        "\n"
+    ),
+    'equals_check': "        if ({condition}) return false;\n",
+    'hash_code_fast': (
+        "    /**\n"
+        "     * Generate hash code\n"
+        "     * Unrolled equivalent of java.util.Objects.hash without varargs or boxing\n"
+        "     * @return int\n"
+        "     */\n"
+        "    @Override\n"
+        "    public int hashCode() {{\n"
+        "        int h = 1;\n"
+        "{terms}"
+        "        return h;\n"
+        "    }}\n"
+        "\n"
+    ),
+    'hash_code_term': "        h = 31 * h + {term};\n",
+    'to_string_builder': (
+        "    /**\n"
+        "     * String representation of the object\n"
+        "     * Built in a StringBuilder presized to the expected length\n"
+        "     * @return String\n"
+        "     */\n"
+        "    @Override\n"
+        "    public String toString() {{\n"
+        "        StringBuilder toStringBuilder = new StringBuilder({capacity});\n"
+        "{statements}"
+        "        return toStringBuilder.append('}}').toString();\n"
+        "    }}\n"
+        "\n"
+    ),
+    'to_string_chunked': (
+        "    /**\n"
+        "     * String representation of the object\n"
+        "     * Built in a presized StringBuilder by helper methods of up to {chunk_size} fields each\n"
+        "     * @return String\n"
+        "     */\n"
+        "    @Override\n"
+        "    public String toString() {{\n"
+        "        StringBuilder toStringBuilder = new StringBuilder({capacity});\n"
+        "        toStringBuilder.append({prefix});\n"
+        "{statements}"
+        "        return toStringBuilder.append('}}').toString();\n"
+        "    }}\n"
+        "\n"
+    ),
+    'to_string_statement': "        {statement};\n",
+    'to_string_helper': (
+        "    private void toStringFields{index}(StringBuilder toStringBuilder) {{\n"
+        "{statements}"
+        "    }}\n"
+        "\n"
+    ),
+    'to_string_truncated_list': (
+        "    /**\n"
+        "     * Append a list, showing at most {max_items} elements\n"
+        "     */\n"
+        "    private static void appendTruncated(StringBuilder toStringBuilder, List<?> values) {{\n"
+        "        if (values == null || values.size() <= {max_items}) {{\n"
+        "            toStringBuilder.append(values);\n"
+        "            return;\n"
+        "        }}\n"
+        "        toStringBuilder.append('[');\n"
+        "        for (int i = 0; i < {max_items}; i++) {{\n"
+        "            toStringBuilder.append(values.get(i)).append(\", \");\n"
+        "        }}\n"
+        "        toStringBuilder.append(\"... (\").append(values.size() - {max_items}).append(\" more)]\");\n"
+        "    }}\n"
+        "\n"
+    ),
+    'equals_helper': (
+        "    private boolean equalsFields{index}({class_name} that) {{\n"
+        "        return {expression};\n"
+        "    }}\n"
+        "\n"
+    ),
+    'equals_fast_helper': (
+        "    private boolean equalsFields{index}({class_name} that) {{\n"
+        "{checks}"
+        "        return true;\n"
+        "    }}\n"
+        "\n"
+    ),
+    'hash_code_chunked': (
+        "    /**\n"
+        "     * Generate hash code\n"
+        "     * Equal to java.util.Objects.hash over all fields, computed by helper methods\n"
+        "     * of up to {chunk_size} fields each\n"
+        "     * @return int\n"
+        "     */\n"
+        "    @Override\n"
+        "    public int hashCode() {{\n"
+        "        int h = 1;\n"
+        "{calls}"
+        "        return h;\n"
+        "    }}\n"
+        "\n"
+    ),
+    'hash_code_call': "        h = hashCodeFields{index}(h);\n",
+    'hash_code_helper': (
+        "    private int hashCodeFields{index}(int h) {{\n"
+        "{terms}"
+        "        return h;\n"
+        "    }}\n"
+        "\n"
+    ),
+    'hash_cache_field': (
+        "    /**\n"
+        "     * Cached hash code, 0 until computed\n"
+        "     */\n"
+        "    private int {name};\n"
+        "\n"
+    ),
+    'hash_code_cached': (
+        "    /**\n"
+        "     * Generate hash code\n"
+        "     * Computed on first use and cached, as all fields are final\n"
+        "     * @return int\n"
+        "     */\n"
+        "    @Override\n"
+        "    public int hashCode() {{\n"
+        "        int h = {cache_field};\n"
+        "        if (h == 0) {{\n"
+        "{computation}"
+        "            {cache_field} = h;\n"
+        "        }}\n"
+        "        return h;\n"
+        "    }}\n"
+        "\n"
+    ),
+    'hash_code_cached_line': "            {statement}\n",
+    'record': (
+        "/**\n"
+        " * {class_name} - Auto-generated model record\n"
+        " * Generated from CSV schema definition\n"
+        "{component_docs}"
+        " */\n"
+        "public record {class_name}({components}) {{\n"
+        "{body}"
+        "}}"
+    ),
+    'record_component_doc': " * @param {name} {description}\n",
+    'xml_reader': (
+        "    /**\n"
+        "     * Read a {class_name} from an XML stream\n"
+        "     * The reader must be positioned at or before the root element. Elements and\n"
+        "     * attributes are matched by local name against the schema XPaths through the\n"
+        "     * path-state tables of this class and its components; unmatched subtrees are\n"
+        "     * skipped. Reading stops after the root element ends.\n"
+        "     * @param xmlReader XML stream reader\n"
+        "     * @return {class_name}\n"
+        "     * @throws XMLStreamException if the XML cannot be read\n"
+        "     */\n"
+        "    public static {class_name} fromXml(XMLStreamReader xmlReader) throws XMLStreamException {{\n"
+        "        XmlFields xmlFields = new XmlFields();\n"
+        "        XmlSupport.read(xmlReader, xmlFields);\n"
+        "        return xmlFields.build();\n"
+        "    }}\n"
+        "\n"
+    ),
+    'local_variable': "        {data_type} {name} = {value};\n",
+    'xml_fields': (
+        "    /**\n"
+        "     * {class_name} fields being read from XML, with the path-state table of their XPaths\n"
+        "     */\n"
+        "    static final class XmlFields implements XmlSupport.FieldReader {{\n"
+        "\n"
+        "        /**\n"
+        "         * Parent state of each path state\n"
+        "         */\n"
+        "        private static final int[] PARENT_STATES = {{{parent_states}}};\n"
+        "\n"
+        "        /**\n"
+        "         * Path states whose element text is read into a field\n"
+        "         */\n"
+        "        private static final boolean[] TEXT_STATES = {{{text_states}}};\n"
+        "\n"
+        "{fields}"
+        "\n"
+        "        @Override\n"
+        "        public int transition(int xmlState, String xmlName) {{\n"
+        "{transition}"
+        "        }}\n"
+        "\n"
+        "        @Override\n"
+        "        public int parent(int xmlState) {{\n"
+        "            return PARENT_STATES[xmlState];\n"
+        "        }}\n"
+        "\n"
+        "        @Override\n"
+        "        public boolean readsText(int xmlState) {{\n"
+        "            return TEXT_STATES[xmlState];\n"
+        "        }}\n"
+        "\n"
+        "        @Override\n"
+        "        public void attributes(int xmlState, XMLStreamReader xmlReader) {{\n"
+        "{attributes}"
+        "        }}\n"
+        "\n"
+        "        @Override\n"
+        "        public void text(int xmlState, String xmlValue) {{\n"
+        "{text}"
+        "        }}\n"
+        "\n"
+        "        @Override\n"
+        "        public void addReaders(List<XmlSupport.FieldReader> xmlReaders) {{\n"
+        "{add_readers}"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Construct the {class_name} from the fields read\n"
+        "         */\n"
+        "        {class_name} build() {{\n"
+        "            return new {class_name}({arguments});\n"
+        "        }}\n"
+        "{helpers}"
+        "    }}\n"
+        "\n"
+    ),
+    'xml_field': "        {data_type} {name} = {value};\n",
+    'xml_component_field': "        final {class_name}.XmlFields {name} = new {class_name}.XmlFields();\n",
+    'xml_add_self': "            xmlReaders.add(this);\n",
+    'xml_add_component': "            {name}.addReaders(xmlReaders);\n",
+    'xml_dispatch_first': (
+        "            if (xmlState < {bound}) {{\n"
+        "                {statement}\n"
+    ),
+    'xml_dispatch_next': (
+        "            }} else if (xmlState < {bound}) {{\n"
+        "                {statement}\n"
+    ),
+    'xml_dispatch_last': (
+        "            }} else {{\n"
+        "                {statement}\n"
+        "            }}\n"
+    ),
+    'xml_transition_helper': (
+        "\n"
+        "        private static int transition{index}(int xmlState, String xmlName) {{\n"
+        "{switch}"
+        "        }}\n"
+    ),
+    'xml_attributes_helper': (
+        "\n"
+        "        private void attributes{index}(int xmlState, XMLStreamReader xmlReader) {{\n"
+        "{switch}"
+        "        }}\n"
+    ),
+    'xml_text_helper': (
+        "\n"
+        "        private void text{index}(int xmlState, String xmlValue) {{\n"
+        "{switch}"
+        "        }}\n"
+    ),
+    'xml_no_transition': "            return -1;\n",
+    'xml_transition_switch': (
+        "            switch (xmlState) {{\n"
+        "{cases}"
+        "                default:\n"
+        "                    return -1;\n"
+        "            }}\n"
+    ),
+    'xml_transition_case': (
+        "                case {state}:\n"
+        "                    switch (xmlName) {{\n"
+        "{name_cases}"
+        "                        default:\n"
+        "                            return -1;\n"
+        "                    }}\n"
+    ),
+    'xml_name_case': (
+        "                        case {name}:\n"
+        "                            return {state};\n"
+    ),
+    'xml_attributes_switch': (
+        "            String xmlValue;\n"
+        "            switch (xmlState) {{\n"
+        "{cases}"
+        "                default:\n"
+        "                    break;\n"
+        "            }}\n"
+    ),
+    'xml_attribute_case': (
+        "                case {state}:\n"
+        "{statements}"
+        "                    break;\n"
+    ),
+    'xml_attribute_read': (
+        "                    xmlValue = xmlReader.getAttributeValue(null, {attribute});\n"
+        "                    if (xmlValue != null) {{\n"
+        "                        {assignment}\n"
+        "                    }}\n"
+    ),
+    'xml_text_switch': (
+        "            switch (xmlState) {{\n"
+        "{cases}"
+        "                default:\n"
+        "                    break;\n"
+        "            }}\n"
+    ),
+    'xml_text_case': (
+        "                case {state}:\n"
+        "{statements}"
+        "                    break;\n"
+    ),
+    'xml_text_read': "                    {assignment}\n",
+    'json_methods': (
+        "    /**\n"
+        "     * Estimated length of the JSON form, used to presize toJson buffers\n"
+        "     */\n"
+        "    private static final int JSON_SIZE_HINT = {size_hint};\n"
+        "\n"
+        "    /**\n"
+        "     * JSON member names, escaped and preceded by their separators\n"
+        "     */\n"
+        "{name_constants}"
+        "\n"
+        "    /**\n"
+        "     * Write this object as a JSON object\n"
+        "     * @param jsonOut Destination of the JSON text\n"
+        "     * @throws IOException if writing to jsonOut fails\n"
+        "     */\n"
+        "    public void writeJson(Appendable jsonOut) throws IOException {{\n"
+        "        jsonOut.append('{{');\n"
+        "{writes}"
+        "        jsonOut.append('}}');\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Get the JSON form of this object\n"
+        "     * @return String\n"
+        "     */\n"
+        "    public String toJson() {{\n"
+        "        StringBuilder jsonOut = new StringBuilder(JSON_SIZE_HINT);\n"
+        "        try {{\n"
+        "            writeJson(jsonOut);\n"
+        "        }} catch (IOException e) {{\n"
+        "            throw new UncheckedIOException(e);\n"
+        "        }}\n"
+        "        return jsonOut.toString();\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Read a {class_name} from the next value of a JSON stream\n"
+        "     * Members are matched by name in any order; unknown members are skipped.\n"
+        "     * @param jsonIn JSON reader positioned before the object\n"
+        "     * @return {class_name}, or null for a JSON null\n"
+        "     * @throws IOException if the JSON cannot be read\n"
+        "     */\n"
+        "    public static {class_name} readJson(JsonSupport.Reader jsonIn) throws IOException {{\n"
+        "        if (jsonIn.nextNull()) {{\n"
+        "            return null;\n"
+        "        }}\n"
+        "{locals}"
+        "        jsonIn.beginObject();\n"
+        "        while (jsonIn.hasNext()) {{\n"
+        "            switch (jsonIn.nextName()) {{\n"
+        "{cases}"
+        "                default:\n"
+        "                    jsonIn.skipValue();\n"
+        "                    break;\n"
+        "            }}\n"
+        "        }}\n"
+        "        jsonIn.endObject();\n"
+        "        return new {class_name}({arguments});\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Read a {class_name} from JSON text\n"
+        "     * @param json JSON object\n"
+        "     * @return {class_name}\n"
+        "     * @throws IOException if the JSON cannot be read\n"
+        "     */\n"
+        "    public static {class_name} fromJson(String json) throws IOException {{\n"
+        "        return readJson(new JsonSupport.Reader(new StringReader(json)));\n"
+        "    }}\n"
+        "\n"
+    ),
+    'json_name_constant': "    private static final String {constant} = {literal};\n",
+    'json_write': (
+        "        jsonOut.append({constant});\n"
+        "        {statement}\n"
+    ),
+    'json_read_case': (
+        "                case {member}:\n"
+        "                    {name} = {value};\n"
+        "                    break;\n"
+    ),
+    'benchmark_class': (
+        "package {package};\n"
+        "\n"
+        "import java.util.HashMap;\n"
+        "import java.util.Map;\n"
+        "import java.util.concurrent.TimeUnit;\n"
+        "\n"
+        "import org.openjdk.jmh.annotations.Benchmark;\n"
+        "import org.openjdk.jmh.annotations.BenchmarkMode;\n"
+        "import org.openjdk.jmh.annotations.Fork;\n"
+        "import org.openjdk.jmh.annotations.Measurement;\n"
+        "import org.openjdk.jmh.annotations.Mode;\n"
+        "import org.openjdk.jmh.annotations.OutputTimeUnit;\n"
+        "import org.openjdk.jmh.annotations.Scope;\n"
+        "import org.openjdk.jmh.annotations.Setup;\n"
+        "import org.openjdk.jmh.annotations.State;\n"
+        "import org.openjdk.jmh.annotations.Warmup;\n"
+        "\n"
+        "import {model_package}.{class_name};\n"
+        "\n"
+        "/**\n"
+        " * {class_name}Benchmark - Auto-generated JMH benchmark of {class_name} equals and hashCode\n"
+        " */\n"
+        "@BenchmarkMode(Mode.AverageTime)\n"
+        "@OutputTimeUnit(TimeUnit.NANOSECONDS)\n"
+        "@State(Scope.Benchmark)\n"
+        "@Warmup(iterations = 3)\n"
+        "@Measurement(iterations = 5)\n"
+        "@Fork(1)\n"
+        "public class {class_name}Benchmark {{\n"
+        "\n"
+        "    private {class_name} instance;\n"
+        "    private {class_name} equalInstance;\n"
+        "    private Map<{class_name}, Integer> map;\n"
+        "\n"
+        "    @Setup\n"
+        "    public void setUp() {{\n"
+        "        instance = create{class_name}();\n"
+        "        equalInstance = create{class_name}();\n"
+        "        map = new HashMap<>();\n"
+        "        map.put(instance, 1);\n"
+        "    }}\n"
+        "{factories}"
+        "\n"
+        "    @Benchmark\n"
+        "    public int hashCodeBenchmark() {{\n"
+        "        return instance.hashCode();\n"
+        "    }}\n"
+        "\n"
+        "    @Benchmark\n"
+        "    public boolean equalsBenchmark() {{\n"
+        "        return instance.equals(equalInstance);\n"
+        "    }}\n"
+        "\n"
+        "    @Benchmark\n"
+        "    public Integer hashMapLookup() {{\n"
+        "        return map.get(equalInstance);\n"
+        "    }}\n"
+        "}}\n"
+    ),
+    'mapper_class': (
+        "package {package};\n"
+        "\n"
+        "/**\n"
+        " * {mapper_name} - Auto-generated mapper from {source_name} to {target_name}\n"
+        " * Copies {mapped_count} of the {field_count} {target_name} fields from the {source_name} fields\n"
+        " * mapped from the same XPath\n"
+        " */\n"
+        "public final class {mapper_name} {{\n"
+        "\n"
+        "    private {mapper_name}() {{\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Map a {source_name} to a {target_name}\n"
+        "     * {target_name} fields without a {source_name} counterpart get their default values.\n"
+        "     * @param source {source_name} to map\n"
+        "     * @return {target_name}, or null if source is null\n"
+        "     */\n"
+        "    public static {target_name} map({source_name} source) {{\n"
+        "        if (source == null) {{\n"
+        "            return null;\n"
+        "        }}\n"
+        "{locals}"
+        "        return new {target_name}({arguments});\n"
+        "    }}\n"
+        "{component_mappers}"
+        "}}\n"
+    ),
+    'mapper_component_class': (
+        "\n"
+        "    /**\n"
+        "     * Maps a {source_name} to the {component_name} component of a {target_name}\n"
+        "     */\n"
+        "    private static final class {component_name}Mapper {{\n"
+        "\n"
+        "        private {component_name}Mapper() {{\n"
+        "        }}\n"
+        "\n"
+        "        static {component_name} map({source_name} source) {{\n"
+        "{locals}"
+        "            return new {component_name}({arguments});\n"
+        "        }}\n"
+        "    }}\n"
+    ),
+    'mapper_component_local': "            {data_type} {name} = {value};\n",
+    'mapper_benchmark_class': (
+        "package {package};\n"
+        "\n"
+        "import java.util.concurrent.TimeUnit;\n"
+        "\n"
+        "import org.openjdk.jmh.annotations.Benchmark;\n"
+        "import org.openjdk.jmh.annotations.BenchmarkMode;\n"
+        "import org.openjdk.jmh.annotations.Fork;\n"
+        "import org.openjdk.jmh.annotations.Measurement;\n"
+        "import org.openjdk.jmh.annotations.Mode;\n"
+        "import org.openjdk.jmh.annotations.OutputTimeUnit;\n"
+        "import org.openjdk.jmh.annotations.Scope;\n"
+        "import org.openjdk.jmh.annotations.Setup;\n"
+        "import org.openjdk.jmh.annotations.State;\n"
+        "import org.openjdk.jmh.annotations.Warmup;\n"
+        "\n"
+        "{imports}"
+        "\n"
+        "/**\n"
+        " * MapperBenchmark - Auto-generated JMH benchmark of the model mappers\n"
+        " */\n"
+        "@BenchmarkMode(Mode.AverageTime)\n"
+        "@OutputTimeUnit(TimeUnit.NANOSECONDS)\n"
+        "@State(Scope.Benchmark)\n"
+        "@Warmup(iterations = 3)\n"
+        "@Measurement(iterations = 5)\n"
+        "@Fork(1)\n"
+        "public class MapperBenchmark {{\n"
+        "\n"
+        "{sources}"
+        "\n"
+        "    @Setup\n"
+        "    public void setUp() {{\n"
+        "{setups}"
+        "    }}\n"
+        "{methods}"
+        "{factories}"
+        "}}\n"
+    ),
+    'mapper_benchmark_source': "    private {class_name} {variable};\n",
+    'mapper_benchmark_setup': "        {variable} = create{class_name}();\n",
+    'benchmark_factory': (
+        "\n"
+        "    private static {class_name} create{class_name}() {{\n"
+        "        return new {class_name}({arguments});\n"
+        "    }}\n"
+    ),
+    'mapper_benchmark_method': (
+        "\n"
+        "    @Benchmark\n"
+        "    public {target_name} {method}() {{\n"
+        "        return {mapper_name}.map({variable});\n"
+        "    }}\n"
+    ),
+    'json_support': (
+        "package {package};\n"
+        "\n"
+        "import java.io.IOException;\n"
+        "import java.math.BigDecimal;\n"
+        "import java.time.LocalDate;\n"
+        "import java.time.LocalDateTime;\n"
+        "import java.util.ArrayList;\n"
+        "import java.util.List;\n"
+        "\n"
+        "/**\n"
+        " * JsonSupport - Auto-generated JSON helpers of the generated models\n"
+        " * Writes JSON values to any Appendable and reads JSON as a stream of tokens,\n"
+        " * without reflection or intermediate maps\n"
+        " */\n"
+        "public final class JsonSupport {{\n"
+        "\n"
+        "    private static final char[] HEX_DIGITS = \"0123456789abcdef\".toCharArray();\n"
+        "\n"
+        "    private JsonSupport() {{\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Write a JSON string, or null\n"
+        "     * @param out Destination of the JSON text\n"
+        "     * @param value String to write\n"
+        "     * @throws IOException if writing to out fails\n"
+        "     */\n"
+        "    public static void writeString(Appendable out, String value) throws IOException {{\n"
+        "        if (value == null) {{\n"
+        "            out.append(\"null\");\n"
+        "            return;\n"
+        "        }}\n"
+        "        out.append('\"');\n"
+        "        int start = 0;\n"
+        "        int length = value.length();\n"
+        "        for (int i = 0; i < length; i++) {{\n"
+        "            char c = value.charAt(i);\n"
+        "            if (c >= 0x20 && c != '\"' && c != '\\\\') {{\n"
+        "                continue;\n"
+        "            }}\n"
+        "            out.append(value, start, i);\n"
+        "            switch (c) {{\n"
+        "                case '\"':\n"
+        "                    out.append(\"\\\\\\\"\");\n"
+        "                    break;\n"
+        "                case '\\\\':\n"
+        "                    out.append(\"\\\\\\\\\");\n"
+        "                    break;\n"
+        "                case '\\n':\n"
+        "                    out.append(\"\\\\n\");\n"
+        "                    break;\n"
+        "                case '\\r':\n"
+        "                    out.append(\"\\\\r\");\n"
+        "                    break;\n"
+        "                case '\\t':\n"
+        "                    out.append(\"\\\\t\");\n"
+        "                    break;\n"
+        "                default:\n"
+        "                    out.append(\"\\\\u00\").append(HEX_DIGITS[c >> 4]).append(HEX_DIGITS[c & 0xF]);\n"
+        "                    break;\n"
+        "            }}\n"
+        "            start = i + 1;\n"
+        "        }}\n"
+        "        out.append(value, start, length);\n"
+        "        out.append('\"');\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Write the string form of a value as a JSON string, or null\n"
+        "     * @param out Destination of the JSON text\n"
+        "     * @param value Value to write, e.g. a LocalDate\n"
+        "     * @throws IOException if writing to out fails\n"
+        "     */\n"
+        "    public static void writeValue(Appendable out, Object value) throws IOException {{\n"
+        "        writeString(out, value == null ? null : value.toString());\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Write a JSON number, or null for null and non-finite values\n"
+        "     * @param out Destination of the JSON text\n"
+        "     * @param value Number to write\n"
+        "     * @throws IOException if writing to out fails\n"
+        "     */\n"
+        "    public static void writeNumber(Appendable out, Number value) throws IOException {{\n"
+        "        if (value == null) {{\n"
+        "            out.append(\"null\");\n"
+        "        }} else if (value instanceof Double) {{\n"
+        "            writeDouble(out, value.doubleValue());\n"
+        "        }} else if (value instanceof Float) {{\n"
+        "            writeFloat(out, value.floatValue());\n"
+        "        }} else {{\n"
+        "            out.append(value.toString());\n"
+        "        }}\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Write a JSON number\n"
+        "     * @param out Destination of the JSON text\n"
+        "     * @param value Number to write\n"
+        "     * @throws IOException if writing to out fails\n"
+        "     */\n"
+        "    public static void writeInt(Appendable out, int value) throws IOException {{\n"
+        "        if (out instanceof StringBuilder) {{\n"
+        "            ((StringBuilder) out).append(value);\n"
+        "        }} else {{\n"
+        "            out.append(Integer.toString(value));\n"
+        "        }}\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Write a JSON number\n"
+        "     * @param out Destination of the JSON text\n"
+        "     * @param value Number to write\n"
+        "     * @throws IOException if writing to out fails\n"
+        "     */\n"
+        "    public static void writeLong(Appendable out, long value) throws IOException {{\n"
+        "        if (out instanceof StringBuilder) {{\n"
+        "            ((StringBuilder) out).append(value);\n"
+        "        }} else {{\n"
+        "            out.append(Long.toString(value));\n"
+        "        }}\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Write a JSON number, or null for non-finite values\n"
+        "     * @param out Destination of the JSON text\n"
+        "     * @param value Number to write\n"
+        "     * @throws IOException if writing to out fails\n"
+        "     */\n"
+        "    public static void writeDouble(Appendable out, double value) throws IOException {{\n"
+        "        if (Double.isNaN(value) || Double.isInfinite(value)) {{\n"
+        "            out.append(\"null\");\n"
+        "        }} else if (out instanceof StringBuilder) {{\n"
+        "            ((StringBuilder) out).append(value);\n"
+        "        }} else {{\n"
+        "            out.append(Double.toString(value));\n"
+        "        }}\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Write a JSON number, or null for non-finite values\n"
+        "     * @param out Destination of the JSON text\n"
+        "     * @param value Number to write\n"
+        "     * @throws IOException if writing to out fails\n"
+        "     */\n"
+        "    public static void writeFloat(Appendable out, float value) throws IOException {{\n"
+        "        if (Float.isNaN(value) || Float.isInfinite(value)) {{\n"
+        "            out.append(\"null\");\n"
+        "        }} else if (out instanceof StringBuilder) {{\n"
+        "            ((StringBuilder) out).append(value);\n"
+        "        }} else {{\n"
+        "            out.append(Float.toString(value));\n"
+        "        }}\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Write a JSON boolean, or null\n"
+        "     * @param out Destination of the JSON text\n"
+        "     * @param value Boolean to write\n"
+        "     * @throws IOException if writing to out fails\n"
+        "     */\n"
+        "    public static void writeBoolean(Appendable out, Boolean value) throws IOException {{\n"
+        "        out.append(value == null ? \"null\" : value ? \"true\" : \"false\");\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Write a JSON array of strings, or null\n"
+        "     * @param out Destination of the JSON text\n"
+        "     * @param values Strings to write\n"
+        "     * @throws IOException if writing to out fails\n"
+        "     */\n"
+        "    public static void writeStringList(Appendable out, List<String> values) throws IOException {{\n"
+        "        if (values == null) {{\n"
+        "            out.append(\"null\");\n"
+        "            return;\n"
+        "        }}\n"
+        "        out.append('[');\n"
+        "        for (int i = 0; i < values.size(); i++) {{\n"
+        "            if (i > 0) {{\n"
+        "                out.append(',');\n"
+        "            }}\n"
+        "            writeString(out, values.get(i));\n"
+        "        }}\n"
+        "        out.append(']');\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Streaming JSON reader over a buffered character stream\n"
+        "     * Values are read in document order; callers navigate objects with\n"
+        "     * beginObject, hasNext, nextName and endObject.\n"
+        "     */\n"
+        "    public static final class Reader {{\n"
+        "\n"
+        "        private final java.io.Reader in;\n"
+        "        private final char[] buffer;\n"
+        "        private final StringBuilder token = new StringBuilder(64);\n"
+        "        private int position;\n"
+        "        private int limit;\n"
+        "\n"
+        "        /**\n"
+        "         * Create a reader with an 8 KB buffer\n"
+        "         * @param in Character stream to read JSON from\n"
+        "         */\n"
+        "        public Reader(java.io.Reader in) {{\n"
+        "            this(in, 8192);\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Create a reader\n"
+        "         * @param in Character stream to read JSON from\n"
+        "         * @param bufferSize Size of the read buffer in characters\n"
+        "         */\n"
+        "        public Reader(java.io.Reader in, int bufferSize) {{\n"
+        "            this.in = in;\n"
+        "            this.buffer = new char[bufferSize];\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Consume the start of an object\n"
+        "         * @throws IOException if the next token is not '{{'\n"
+        "         */\n"
+        "        public void beginObject() throws IOException {{\n"
+        "            expect('{{');\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Consume the end of an object\n"
+        "         * @throws IOException if the next token is not '}}'\n"
+        "         */\n"
+        "        public void endObject() throws IOException {{\n"
+        "            expect('}}');\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Consume the start of an array\n"
+        "         * @throws IOException if the next token is not '['\n"
+        "         */\n"
+        "        public void beginArray() throws IOException {{\n"
+        "            expect('[');\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Consume the end of an array\n"
+        "         * @throws IOException if the next token is not ']'\n"
+        "         */\n"
+        "        public void endArray() throws IOException {{\n"
+        "            expect(']');\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Check if the current object or array has another member, consuming a separating comma\n"
+        "         * @return boolean\n"
+        "         * @throws IOException if reading fails\n"
+        "         */\n"
+        "        public boolean hasNext() throws IOException {{\n"
+        "            int c = peek();\n"
+        "            if (c == ',') {{\n"
+        "                position++;\n"
+        "                return true;\n"
+        "            }}\n"
+        "            return c >= 0 && c != '}}' && c != ']';\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read the name of the next object member\n"
+        "         * @return String\n"
+        "         * @throws IOException if the next token is not a member name\n"
+        "         */\n"
+        "        public String nextName() throws IOException {{\n"
+        "            String name = readString();\n"
+        "            expect(':');\n"
+        "            return name;\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Consume a null value if it is next\n"
+        "         * @return true if a null was consumed\n"
+        "         * @throws IOException if reading fails\n"
+        "         */\n"
+        "        public boolean nextNull() throws IOException {{\n"
+        "            if (peek() != 'n') {{\n"
+        "                return false;\n"
+        "            }}\n"
+        "            readLiteral(\"null\");\n"
+        "            return true;\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a string value\n"
+        "         * @return String, or null for a JSON null\n"
+        "         * @throws IOException if the next value is not a string\n"
+        "         */\n"
+        "        public String nextString() throws IOException {{\n"
+        "            return nextNull() ? null : readString();\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a number as an int\n"
+        "         * @return int\n"
+        "         * @throws IOException if the next value is not a number\n"
+        "         */\n"
+        "        public int nextInt() throws IOException {{\n"
+        "            return Integer.parseInt(readNumber());\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a number as a long\n"
+        "         * @return long\n"
+        "         * @throws IOException if the next value is not a number\n"
+        "         */\n"
+        "        public long nextLong() throws IOException {{\n"
+        "            return Long.parseLong(readNumber());\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a number as a double\n"
+        "         * @return double\n"
+        "         * @throws IOException if the next value is not a number\n"
+        "         */\n"
+        "        public double nextDouble() throws IOException {{\n"
+        "            return Double.parseDouble(readNumber());\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a number as a float\n"
+        "         * @return float\n"
+        "         * @throws IOException if the next value is not a number\n"
+        "         */\n"
+        "        public float nextFloat() throws IOException {{\n"
+        "            return Float.parseFloat(readNumber());\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a boolean value\n"
+        "         * @return boolean\n"
+        "         * @throws IOException if the next value is not a boolean\n"
+        "         */\n"
+        "        public boolean nextBoolean() throws IOException {{\n"
+        "            int c = peek();\n"
+        "            if (c == 't') {{\n"
+        "                readLiteral(\"true\");\n"
+        "                return true;\n"
+        "            }}\n"
+        "            if (c == 'f') {{\n"
+        "                readLiteral(\"false\");\n"
+        "                return false;\n"
+        "            }}\n"
+        "            throw new IOException(\"Expected a boolean\");\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a number as an Integer\n"
+        "         * @return Integer, or null for a JSON null\n"
+        "         * @throws IOException if the next value is not a number or null\n"
+        "         */\n"
+        "        public Integer nextIntegerOrNull() throws IOException {{\n"
+        "            return nextNull() ? null : Integer.valueOf(readNumber());\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a number as a Long\n"
+        "         * @return Long, or null for a JSON null\n"
+        "         * @throws IOException if the next value is not a number or null\n"
+        "         */\n"
+        "        public Long nextLongOrNull() throws IOException {{\n"
+        "            return nextNull() ? null : Long.valueOf(readNumber());\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a number as a Double\n"
+        "         * @return Double, or null for a JSON null\n"
+        "         * @throws IOException if the next value is not a number or null\n"
+        "         */\n"
+        "        public Double nextDoubleOrNull() throws IOException {{\n"
+        "            return nextNull() ? null : Double.valueOf(readNumber());\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a number as a Float\n"
+        "         * @return Float, or null for a JSON null\n"
+        "         * @throws IOException if the next value is not a number or null\n"
+        "         */\n"
+        "        public Float nextFloatOrNull() throws IOException {{\n"
+        "            return nextNull() ? null : Float.valueOf(readNumber());\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a Boolean value\n"
+        "         * @return Boolean, or null for a JSON null\n"
+        "         * @throws IOException if the next value is not a boolean or null\n"
+        "         */\n"
+        "        public Boolean nextBooleanOrNull() throws IOException {{\n"
+        "            return nextNull() ? null : Boolean.valueOf(nextBoolean());\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read a number as a BigDecimal, without loss of precision\n"
+        "         * @return BigDecimal, or null for a JSON null\n"
+        "         * @throws IOException if the next value is not a number or null\n"
+        "         */\n"
+        "        public BigDecimal nextBigDecimal() throws IOException {{\n"
+        "            return nextNull() ? null : new BigDecimal(readNumber());\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read an ISO-8601 date string\n"
+        "         * @return LocalDate, or null for a JSON null\n"
+        "         * @throws IOException if the next value is not a string or null\n"
+        "         */\n"
+        "        public LocalDate nextLocalDate() throws IOException {{\n"
+        "            String value = nextString();\n"
+        "            return value == null ? null : LocalDate.parse(value);\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read an ISO-8601 date-time string\n"
+        "         * @return LocalDateTime, or null for a JSON null\n"
+        "         * @throws IOException if the next value is not a string or null\n"
+        "         */\n"
+        "        public LocalDateTime nextLocalDateTime() throws IOException {{\n"
+        "            String value = nextString();\n"
+        "            return value == null ? null : LocalDateTime.parse(value);\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Read an array of strings\n"
+        "         * @return List of strings, or null for a JSON null\n"
+        "         * @throws IOException if the next value is not an array of strings or null\n"
+        "         */\n"
+        "        public List<String> nextStringList() throws IOException {{\n"
+        "            if (nextNull()) {{\n"
+        "                return null;\n"
+        "            }}\n"
+        "            List<String> values = new ArrayList<>();\n"
+        "            beginArray();\n"
+        "            while (hasNext()) {{\n"
+        "                values.add(nextString());\n"
+        "            }}\n"
+        "            endArray();\n"
+        "            return values;\n"
+        "        }}\n"
+        "\n"
+        "        /**\n"
+        "         * Skip the next value, including nested objects and arrays\n"
+        "         * @throws IOException if the next value is malformed\n"
+        "         */\n"
+        "        public void skipValue() throws IOException {{\n"
+        "            int c = peek();\n"
+        "            if (c == '{{') {{\n"
+        "                beginObject();\n"
+        "                while (hasNext()) {{\n"
+        "                    nextName();\n"
+        "                    skipValue();\n"
+        "                }}\n"
+        "                endObject();\n"
+        "            }} else if (c == '[') {{\n"
+        "                beginArray();\n"
+        "                while (hasNext()) {{\n"
+        "                    skipValue();\n"
+        "                }}\n"
+        "                endArray();\n"
+        "            }} else if (c == '\"') {{\n"
+        "                readString();\n"
+        "            }} else if (c == 't' || c == 'f') {{\n"
+        "                nextBoolean();\n"
+        "            }} else if (!nextNull()) {{\n"
+        "                readNumber();\n"
+        "            }}\n"
+        "        }}\n"
+        "\n"
+        "        private String readString() throws IOException {{\n"
+        "            expect('\"');\n"
+        "            token.setLength(0);\n"
+        "            while (true) {{\n"
+        "                char c = readChar();\n"
+        "                if (c == '\"') {{\n"
+        "                    return token.toString();\n"
+        "                }}\n"
+        "                if (c != '\\\\') {{\n"
+        "                    token.append(c);\n"
+        "                    continue;\n"
+        "                }}\n"
+        "                char escaped = readChar();\n"
+        "                switch (escaped) {{\n"
+        "                    case 'n':\n"
+        "                        token.append('\\n');\n"
+        "                        break;\n"
+        "                    case 'r':\n"
+        "                        token.append('\\r');\n"
+        "                        break;\n"
+        "                    case 't':\n"
+        "                        token.append('\\t');\n"
+        "                        break;\n"
+        "                    case 'b':\n"
+        "                        token.append('\\b');\n"
+        "                        break;\n"
+        "                    case 'f':\n"
+        "                        token.append('\\f');\n"
+        "                        break;\n"
+        "                    case 'u':\n"
+        "                        int code = 0;\n"
+        "                        for (int i = 0; i < 4; i++) {{\n"
+        "                            int digit = Character.digit(readChar(), 16);\n"
+        "                            if (digit < 0) {{\n"
+        "                                throw new IOException(\"Invalid unicode escape\");\n"
+        "                            }}\n"
+        "                            code = (code << 4) | digit;\n"
+        "                        }}\n"
+        "                        token.append((char) code);\n"
+        "                        break;\n"
+        "                    case '\"':\n"
+        "                    case '\\\\':\n"
+        "                    case '/':\n"
+        "                        token.append(escaped);\n"
+        "                        break;\n"
+        "                    default:\n"
+        "                        throw new IOException(\"Invalid escape sequence: \\\\\" + escaped);\n"
+        "                }}\n"
+        "            }}\n"
+        "        }}\n"
+        "\n"
+        "        private String readNumber() throws IOException {{\n"
+        "            token.setLength(0);\n"
+        "            int c = peek();\n"
+        "            while (c == '-' || c == '+' || c == '.' || c == 'e' || c == 'E' || (c >= '0' && c <= '9')) {{\n"
+        "                token.append((char) c);\n"
+        "                position++;\n"
+        "                c = peekChar();\n"
+        "            }}\n"
+        "            if (token.length() == 0) {{\n"
+        "                throw new IOException(\"Expected a number\");\n"
+        "            }}\n"
+        "            return token.toString();\n"
+        "        }}\n"
+        "\n"
+        "        private void readLiteral(String literal) throws IOException {{\n"
+        "            for (int i = 0; i < literal.length(); i++) {{\n"
+        "                if (readChar() != literal.charAt(i)) {{\n"
+        "                    throw new IOException(\"Expected \" + literal);\n"
+        "                }}\n"
+        "            }}\n"
+        "        }}\n"
+        "\n"
+        "        private void expect(char expected) throws IOException {{\n"
+        "            int c = peek();\n"
+        "            if (c != expected) {{\n"
+        "                throw new IOException(\"Expected '\" + expected + \"' but found \"\n"
+        "                        + (c < 0 ? \"end of input\" : \"'\" + (char) c + \"'\"));\n"
+        "            }}\n"
+        "            position++;\n"
+        "        }}\n"
+        "\n"
+        "        private int peek() throws IOException {{\n"
+        "            while (true) {{\n"
+        "                int c = peekChar();\n"
+        "                if (c != ' ' && c != '\\n' && c != '\\r' && c != '\\t') {{\n"
+        "                    return c;\n"
+        "                }}\n"
+        "                position++;\n"
+        "            }}\n"
+        "        }}\n"
+        "\n"
+        "        private int peekChar() throws IOException {{\n"
+        "            if (position == limit && !fill()) {{\n"
+        "                return -1;\n"
+        "            }}\n"
+        "            return buffer[position];\n"
+        "        }}\n"
+        "\n"
+        "        private char readChar() throws IOException {{\n"
+        "            if (position == limit && !fill()) {{\n"
+        "                throw new IOException(\"Unexpected end of JSON input\");\n"
+        "            }}\n"
+        "            return buffer[position++];\n"
+        "        }}\n"
+        "\n"
+        "        private boolean fill() throws IOException {{\n"
+        "            int count;\n"
+        "            do {{\n"
+        "                count = in.read(buffer, 0, buffer.length);\n"
+        "            }} while (count == 0);\n"
+        "            position = 0;\n"
+        "            limit = Math.max(count, 0);\n"
+        "            return count > 0;\n"
+        "        }}\n"
+        "    }}\n"
+        "}}\n"
+    ),
+    'xml_support': (
+        "package {package};\n"
+        "\n"
+        "import java.util.ArrayList;\n"
+        "import java.util.Arrays;\n"
+        "import java.util.List;\n"
+        "\n"
+        "import javax.xml.stream.XMLStreamConstants;\n"
+        "import javax.xml.stream.XMLStreamException;\n"
+        "import javax.xml.stream.XMLStreamReader;\n"
+        "\n"
+        "/**\n"
+        " * XmlSupport - Auto-generated StAX reading loop of the generated models\n"
+        " * Every class reads its own fields through a path-state table of their XPaths;\n"
+        " * one pass over the XML stream drives the tables of a model and its components\n"
+        " */\n"
+        "public final class XmlSupport {{\n"
+        "\n"
+        "    private XmlSupport() {{\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Fields of one class being read from XML, with the path-state table of their XPaths\n"
+        "     * State 0 is outside the root element.\n"
+        "     */\n"
+        "    public interface FieldReader {{\n"
+        "\n"
+        "        /**\n"
+        "         * Get the path state entered by a child element\n"
+        "         * @param state Path state of the parent element\n"
+        "         * @param name Local name of the child element\n"
+        "         * @return int, or -1 if no field is read in the child element\n"
+        "         */\n"
+        "        int transition(int state, String name);\n"
+        "\n"
+        "        /**\n"
+        "         * Get the path state of the parent element\n"
+        "         * @param state Path state of an element\n"
+        "         * @return int\n"
+        "         */\n"
+        "        int parent(int state);\n"
+        "\n"
+        "        /**\n"
+        "         * Check if the text of the elements in a path state is read into a field\n"
+        "         * @param state Path state of an element\n"
+        "         * @return boolean\n"
+        "         */\n"
+        "        boolean readsText(int state);\n"
+        "\n"
+        "        /**\n"
+        "         * Read the attributes of an element just entered\n"
+        "         * @param state Path state of the element\n"
+        "         * @param xmlReader XML stream reader positioned at the element start\n"
+        "         */\n"
+        "        void attributes(int state, XMLStreamReader xmlReader);\n"
+        "\n"
+        "        /**\n"
+        "         * Read the text of an element being left\n"
+        "         * @param state Path state of the element\n"
+        "         * @param xmlValue Text of the element, without the text of its child elements\n"
+        "         */\n"
+        "        void text(int state, String xmlValue);\n"
+        "\n"
+        "        /**\n"
+        "         * Add this reader, if it reads any field itself, and the readers of its components\n"
+        "         * @param readers Readers driven by read\n"
+        "         */\n"
+        "        void addReaders(List<FieldReader> readers);\n"
+        "    }}\n"
+        "\n"
+        "    /**\n"
+        "     * Read the fields of a class and its components from an XML stream\n"
+        "     * The reader must be positioned at or before the root element. Each element start\n"
+        "     * is only offered to the readers that matched its parent element, and subtrees\n"
+        "     * that no reader matches are skipped. Text is collected per element, so the text\n"
+        "     * of a mixed-content element is not lost around its child elements. Reading stops\n"
+        "     * after the root element ends.\n"
+        "     * @param xmlReader XML stream reader\n"
+        "     * @param fields Fields of the top-level class\n"
+        "     * @throws XMLStreamException if the XML cannot be read\n"
+        "     */\n"
+        "    public static void read(XMLStreamReader xmlReader, FieldReader fields) throws XMLStreamException {{\n"
+        "        List<FieldReader> readerList = new ArrayList<>();\n"
+        "        fields.addReaders(readerList);\n"
+        "        FieldReader[] readers = readerList.toArray(new FieldReader[0]);\n"
+        "        int[] states = new int[readers.length];\n"
+        "        // Readers matching the open elements: those inside the element at depth d are\n"
+        "        // active[bounds[d]] to active[bounds[d + 1] - 1]; depth 0 is the document\n"
+        "        int[] active = new int[2 * readers.length];\n"
+        "        int[] bounds = new int[16];\n"
+        "        // Text length before each open element, and whether the element's text is read\n"
+        "        int[] textStarts = new int[16];\n"
+        "        boolean[] textRead = new boolean[16];\n"
+        "        for (int i = 0; i < readers.length; i++) {{\n"
+        "            active[i] = i;\n"
+        "        }}\n"
+        "        bounds[1] = readers.length;\n"
+        "        StringBuilder text = new StringBuilder();\n"
+        "        int depth = 0;\n"
+        "        int skipDepth = 0;\n"
+        "        int event = xmlReader.getEventType();\n"
+        "        while (true) {{\n"
+        "            if (event == XMLStreamConstants.START_ELEMENT) {{\n"
+        "                if (skipDepth > 0) {{\n"
+        "                    skipDepth++;\n"
+        "                }} else {{\n"
+        "                    String name = xmlReader.getLocalName();\n"
+        "                    int from = bounds[depth];\n"
+        "                    int to = bounds[depth + 1];\n"
+        "                    if (active.length < 2 * to - from) {{\n"
+        "                        active = Arrays.copyOf(active, 2 * (2 * to - from));\n"
+        "                    }}\n"
+        "                    int end = to;\n"
+        "                    boolean anyText = false;\n"
+        "                    for (int i = from; i < to; i++) {{\n"
+        "                        FieldReader reader = readers[active[i]];\n"
+        "                        int next = reader.transition(states[active[i]], name);\n"
+        "                        if (next >= 0) {{\n"
+        "                            states[active[i]] = next;\n"
+        "                            active[end++] = active[i];\n"
+        "                            reader.attributes(next, xmlReader);\n"
+        "                            anyText |= reader.readsText(next);\n"
+        "                        }}\n"
+        "                    }}\n"
+        "                    if (end == to) {{\n"
+        "                        skipDepth = 1;\n"
+        "                    }} else {{\n"
+        "                        depth++;\n"
+        "                        if (depth + 1 == bounds.length) {{\n"
+        "                            bounds = Arrays.copyOf(bounds, 2 * bounds.length);\n"
+        "                            textStarts = Arrays.copyOf(textStarts, bounds.length);\n"
+        "                            textRead = Arrays.copyOf(textRead, bounds.length);\n"
+        "                        }}\n"
+        "                        bounds[depth + 1] = end;\n"
+        "                        textStarts[depth] = text.length();\n"
+        "                        textRead[depth] = anyText;\n"
+        "                    }}\n"
+        "                }}\n"
+        "            }} else if (event == XMLStreamConstants.CHARACTERS || event == XMLStreamConstants.CDATA) {{\n"
+        "                if (skipDepth == 0 && textRead[depth]) {{\n"
+        "                    text.append(xmlReader.getTextCharacters(), xmlReader.getTextStart(), xmlReader.getTextLength());\n"
+        "                }}\n"
+        "            }} else if (event == XMLStreamConstants.END_ELEMENT) {{\n"
+        "                if (skipDepth > 0) {{\n"
+        "                    skipDepth--;\n"
+        "                }} else {{\n"
+        "                    String value = textRead[depth] ? text.substring(textStarts[depth]) : null;\n"
+        "                    for (int i = bounds[depth]; i < bounds[depth + 1]; i++) {{\n"
+        "                        FieldReader reader = readers[active[i]];\n"
+        "                        int state = states[active[i]];\n"
+        "                        if (value != null && reader.readsText(state)) {{\n"
+        "                            reader.text(state, value);\n"
+        "                        }}\n"
+        "                        states[active[i]] = reader.parent(state);\n"
+        "                    }}\n"
+        "                    text.setLength(textStarts[depth]);\n"
+        "                    depth--;\n"
+        "                    if (depth == 0) {{\n"
+        "                        break;\n"
+        "                    }}\n"
+        "                }}\n"
+        "            }} else if (event == XMLStreamConstants.END_DOCUMENT) {{\n"
+        "                break;\n"
+        "            }}\n"
+        "            if (!xmlReader.hasNext()) {{\n"
+        "                break;\n"
+        "            }}\n"
+        "            event = xmlReader.next();\n"
+        "        }}\n"
+        "    }}\n"
+        "}}\n"
+    ),
+}
+
+
+# Delimits streamed placeholders while splitting a rendered template; never
+# valid in Java source or in the values rendered into it
+STREAM_MARKER = '\0'
+
+
+class JavaTemplates:
+    """
+    Compiled set of Java source templates.
+    
+    Each template is compiled once, when the set is created, into a function
+    evaluating an equivalent f-string, which avoids parsing the template on
+    every call as ``str.format`` does. The functions take the placeholders
+    as keyword arguments and are available as attributes, e.g.
+    ``templates.accessors(name=..., data_type=..., capitalized=...)``.
+    """
+    
+    def __init__(self, overrides: Optional[Dict[str, str]] = None):
+        """
+        Compile the templates.
+        
+        Args:
+            overrides: Replacement template text by template name
+        
+        Raises:
+            ValueError: If an override names an unknown template or uses
+                placeholders the default template does not provide
+        """
+        for name in overrides or {}:
+            if name not in TEMPLATES:
+                raise ValueError(f"Unknown Java template: {name}")
+        
+        self.renderers: Dict[str, Callable[..., str]] = {}
+        for name, default_text in TEMPLATES.items():
+            text = (overrides or {}).get(name, default_text)
+            renderer = compile_template(name, text, sorted(_placeholders(default_text)))
+            self.renderers[name] = renderer
+            setattr(self, name, renderer)
+    
+    @staticmethod
+    def stream(renderer: Callable[..., str], streamed: Dict[str, Iterable[str]],
+               **values: str) -> Iterator[str]:
+        """
+        Render a template with some placeholders filled from streams of fragments.
+        
+        Streams given as lists or tuples are already in memory; when every
+        stream is one, the template is rendered in one piece. Otherwise it is
+        rendered once with marker values for the streamed placeholders and
+        split on the markers, so the streamed content is never joined into a
+        single string.
+        
+        Args:
+            renderer: Compiled template, e.g. ``templates.constructor``
+            streamed: Iterable of fragments for each streamed placeholder
+            values: Values of the remaining placeholders
+        
+        Returns:
+            Iterator over consecutive fragments of the rendered text
+        """
+        if all(isinstance(fragments, (list, tuple)) for fragments in streamed.values()):
+            joined = {name: "".join(fragments) for name, fragments in streamed.items()}
+            return iter((renderer(**values, **joined),))
+        return _split_stream(renderer, streamed, values)
+
+
+def _split_stream(renderer: Callable[..., str], streamed: Dict[str, Iterable[str]],
+                  values: Dict[str, str]) -> Iterator[str]:
+    """Render a template with marker values and yield its text with the markers replaced by their streams."""
+    markers = {name: f"{STREAM_MARKER}{name}{STREAM_MARKER}" for name in streamed}
+    pieces = renderer(**values, **markers).split(STREAM_MARKER)
+    # Pieces alternate between literal text and streamed placeholder names
+    for index, piece in enumerate(pieces):
+        if index % 2:
+            yield from streamed[piece]
+        elif piece:
+            yield piece
+
+
+def _placeholders(text: str) -> Set[str]:
+    """Get the placeholder names used by a template."""
+    return {field_name for _, field_name, _, _ in Formatter().parse(text) if field_name is not None}
+
+
+def compile_template(name: str, text: str, parameters: List[str]) -> Callable[..., str]:
+    """
+    Compile a str.format-style template into a function.
+    
+    Args:
+        name: Template name, used in error messages and the function name
+        text: Template text with {placeholder} fields and doubled literal braces
+        parameters: Keyword parameters of the function; a superset of the placeholders
+    
+    Returns:
+        Function taking the parameters as keyword arguments and returning the rendered text
+    
+    Raises:
+        ValueError: If the template is malformed or uses a placeholder not in parameters
+    """
+    try:
+        parsed = list(Formatter().parse(text))
+    except ValueError as e:
+        raise ValueError(f"Invalid Java template '{name}': {e}")
+    
+    unknown = {field_name for _, field_name, _, _ in parsed if field_name is not None} - set(parameters)
+    if unknown:
+        raise ValueError(f"Template '{name}' uses unknown placeholders: {', '.join(sorted(unknown))}")
+    
+    # Rebuild the template as f-string source; literal braces are doubled again
+    parts = []
+    for literal, field_name, format_spec, conversion in parsed:
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field_name is not None:
+            conversion = f"!{conversion}" if conversion else ""
+            format_spec = f":{format_spec}" if format_spec else ""
+            parts.append(f"{{{field_name}{conversion}{format_spec}}}")
+    
+    signature = f"*, {', '.join(parameters)}" if parameters else ""
+    source = f"def render_{name}({signature}):\n    return f{''.join(parts)!r}\n"
+    namespace: Dict[str, Callable[..., str]] = {}
+    exec(compile(source, f"<java template {name}>", 'exec'), namespace)
+    return namespace[f"render_{name}"]
@@ -4,14 +4,202 @@ Model Generator Module
 This module creates data models based on parsed CSV schema information.
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import os
+from typing import Callable, Container, Dict, List, Any, Optional, Iterable, Iterator, Set, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from sys import intern
 from src.csv_parser import SchemaField
 
 
-@dataclass
+# Model values that exclude a field from that model
+SKIP_INDICATORS = frozenset([
+    'do not use', 'skip', 'ignore', 'exclude',
+    'n/a', 'na', 'null', 'none', '-'
+])
+
+# Separators converted to underscores before camel-casing names
+SEPARATOR_TABLE = str.maketrans({'-': '_', '.': '_', '/': '_'})
+
+# Default number of entries kept by each name and type conversion cache
+DEFAULT_CACHE_SIZE = 4096
+
+# Primitive types used for required fields of these boxed types in primitive mode
+PRIMITIVE_TYPES = {
+    'Integer': 'int',
+    'Long': 'long',
+    'Double': 'double',
+    'Float': 'float',
+    'Boolean': 'boolean'
+}
+
+# Parameter slots available to a constructor; the JVM allows 255 including 'this',
+# and long and double parameters take two slots each
+MAX_CONSTRUCTOR_SLOTS = 254
+WIDE_TYPES = frozenset(['long', 'double'])
+
+# Class name of the abstract base class holding the fields shared by all models
+SHARED_BASE_CLASS = 'ModelBase'
+
+# Java keywords and literals, which cannot be field names and are escaped with a trailing underscore
+JAVA_RESERVED_WORDS = frozenset([
+    'abstract', 'assert', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'const',
+    'continue', 'default', 'do', 'double', 'else', 'enum', 'extends', 'final', 'finally', 'float',
+    'for', 'goto', 'if', 'implements', 'import', 'instanceof', 'int', 'interface', 'long', 'native',
+    'new', 'package', 'private', 'protected', 'public', 'return', 'short', 'static', 'strictfp',
+    'super', 'switch', 'synchronized', 'this', 'throw', 'throws', 'transient', 'try', 'void',
+    'volatile', 'while', 'true', 'false', 'null', '_'
+])
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    """Intern a string value, passing None through."""
+    return intern(value) if value is not None else None
+
+
+def _step_name(step: str) -> str:
+    """Get the element or attribute name of one XPath step, e.g. "ns:person[1]" -> "person"."""
+    return step.split('[', 1)[0].strip().lstrip('@').rsplit(':', 1)[-1]
+
+
+def xpath_segments(xpath: str) -> List[str]:
+    """
+    Split an XPath into element names.
+    
+    Attribute markers and namespace prefixes are dropped, predicates are
+    removed, "." is ignored and ".." steps back to the parent element,
+    e.g. "/root/ns:person[1]/@id" -> ["root", "person", "id"].
+    
+    Args:
+        xpath: XPath expression from the schema
+        
+    Returns:
+        List of element names from the document root down
+    """
+    segments = []
+    for part in xpath.split('/'):
+        part = _step_name(part)
+        if part == '..':
+            if segments:
+                segments.pop()
+        elif part and part != '.':
+            segments.append(intern(part))
+    return segments
+
+
+@dataclass(slots=True)
+class XPathNode:
+    """A node of the XPath trie; one per distinct element path."""
+    segment: str
+    children: Dict[str, 'XPathNode'] = field(default_factory=dict)
+    fields: List[SchemaField] = field(default_factory=list)  # Schema rows ending at this path
+
+
+class XPathTrie:
+    """
+    Prefix trie over the XPaths of a schema.
+    
+    Every distinct element path is stored once, so building the trie costs
+    O(total path length) and looking up a path costs O(depth), however many
+    rows share a prefix. Children keep the order in which they first appear
+    in the schema.
+    """
+    
+    def __init__(self, schema_fields: Iterable[SchemaField] = ()):
+        """
+        Initialize the trie.
+        
+        Args:
+            schema_fields: Schema fields to insert
+        """
+        self.root = XPathNode('')
+        self.size = 0
+        for schema_field in schema_fields:
+            self.insert(schema_field)
+    
+    def insert(self, schema_field: SchemaField) -> XPathNode:
+        """
+        Insert a schema field under its XPath.
+        
+        Args:
+            schema_field: Schema field to insert
+            
+        Returns:
+            Node of the field's element path
+        """
+        node = self.root
+        for segment in xpath_segments(schema_field.xpath):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = XPathNode(segment)
+            node = child
+        node.fields.append(schema_field)
+        self.size += 1
+        return node
+    
+    def find(self, xpath: str) -> Optional[XPathNode]:
+        """
+        Look up the node of an XPath.
+        
+        Args:
+            xpath: XPath expression
+            
+        Returns:
+            Node of the element path, or None if no schema field lies on or below it
+        """
+        node = self.root
+        for segment in xpath_segments(xpath):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+    
+    def __contains__(self, xpath: str) -> bool:
+        node = self.find(xpath)
+        return node is not None and bool(node.fields)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def common_prefix(self) -> Tuple[str, XPathNode]:
+        """
+        Get the longest element path shared by every schema field.
+        
+        Returns:
+            (path, node) tuple; the path is "" if the fields share no prefix
+        """
+        path, node = '', self.root
+        while len(node.children) == 1 and not node.fields:
+            child = next(iter(node.children.values()))
+            if not child.children:
+                break
+            path, node = f"{path}/{child.segment}", child
+        return path, node
+    
+    def iter_paths(self) -> Iterator[Tuple[str, XPathNode]]:
+        """
+        Iterate over all element paths in depth-first, schema order.
+        
+        Yields:
+            (path, node) tuples, excluding the root
+        """
+        stack = [('', node) for node in reversed(self.root.children.values())]
+        while stack:
+            prefix, node = stack.pop()
+            path = f"{prefix}/{node.segment}"
+            yield path, node
+            stack.extend((path, child) for child in reversed(node.children.values()))
+
+
+@dataclass(slots=True)
 class ModelField:
-    """Represents a field in a generated model."""
+    """
+    Represents a field in a generated model.
+    
+    Instances are slotted and their string values are interned, so the same
+    schema row shared by several models is stored only once.
+    """
     name: str
     data_type: str
     required: bool
@@ -21,6 +209,135 @@ class ModelField:
     required_optional_status: Optional[str] = None
     model_value: Optional[str] = None
     additional_info: Optional[str] = None
+    
+    def __post_init__(self):
+        self.name = intern(self.name)
+        self.data_type = intern(self.data_type)
+        self.default_value = _intern_optional(self.default_value)
+        self.description = _intern_optional(self.description)
+        self.required_optional_status = _intern_optional(self.required_optional_status)
+        self.model_value = _intern_optional(self.model_value)
+        self.additional_info = _intern_optional(self.additional_info)
+    
+    def __reduce__(self):
+        # Pickling positional values is smaller and faster than slot state,
+        # which matters when models are sent to render worker processes
+        return (ModelField, (
+            self.name, self.data_type, self.required, self.default_value, self.description,
+            self.xpath, self.required_optional_status, self.model_value, self.additional_info
+        ))
+
+
+def parameter_slots(fields: Iterable[ModelField]) -> int:
+    """Count the JVM parameter slots taken by one constructor parameter per field."""
+    return sum(2 if field.data_type in WIDE_TYPES else 1 for field in fields)
+
+
+def shared_field_key(field: ModelField) -> Tuple[Optional[str], str, str]:
+    """Get the key under which fields of different models are the same base class field."""
+    return field.xpath, field.data_type, field.name
+
+
+def _parent_xpath(xpath: Optional[str]) -> str:
+    """Get the XPath of an XPath's parent step, or "" if it has none."""
+    return (xpath or "").rstrip('/').rpartition('/')[0]
+
+
+def _common_xpath(xpaths: List[str]) -> str:
+    """Get the longest sequence of whole XPath steps that all the given XPaths start with."""
+    prefix = os.path.commonprefix(xpaths)
+    # Cut back to a step boundary unless the prefix already ends on one in every XPath
+    if any(len(xpath) > len(prefix) and xpath[len(prefix)] != '/' for xpath in xpaths):
+        prefix = prefix[:prefix.rfind('/')]
+    return prefix.rstrip('/')
+
+
+@dataclass(slots=True)
+class NameConflict:
+    """A generated field name that clashed with an earlier field, in every class renaming it alike."""
+    class_names: List[str]
+    name: str  # Name derived from the XPath
+    resolved_name: str  # Unique name given to the field instead
+    xpath: str
+    existing_xpath: str  # XPath of the field that kept the name
+    
+    def __str__(self) -> str:
+        return (f"{', '.join(self.class_names)}: field '{self.name}' from {self.xpath} clashes with "
+                f"{self.existing_xpath}; renamed to '{self.resolved_name}'")
+
+
+class FieldNameIndex:
+    """
+    Hash index of the field names of one generated class.
+    
+    Names are keyed case-insensitively, because getters and setters are
+    named from the capitalized field name and therefore clash whenever two
+    names differ only in case. A clashing name is prefixed with the names
+    of its parent elements, nearest first, until it is unique, falling back
+    to a numeric suffix. The first field keeps its name, so the outcome is
+    deterministic for a given schema order and each lookup is O(1). A Java
+    reserved word that is free gets a trailing underscore ("class_").
+    """
+    
+    def __init__(self, class_name: str, camel_case: Callable[[str], str],
+                 conflicts: Dict[Tuple[str, str, str], NameConflict]):
+        """
+        Initialize the index.
+        
+        Args:
+            class_name: Name of the class whose fields are indexed
+            camel_case: Function converting element names to field names
+            conflicts: Resolved conflicts by (XPath, existing XPath, resolved
+                name), shared by the indexes of all classes so that a schema
+                row renamed alike in several models is recorded once
+        """
+        self.class_name = class_name
+        self._camel_case = camel_case
+        self._conflicts = conflicts
+        self._xpaths: Dict[str, str] = {}  # Lowercased name -> XPath of its field
+    
+    def add(self, name: str, xpath: str) -> str:
+        """
+        Register the field name of an XPath.
+        
+        Args:
+            name: Field name derived from the XPath
+            xpath: XPath of the field
+            
+        Returns:
+            The name itself if it is free, otherwise a unique disambiguated name
+        """
+        # Prefixed and numbered names are never reserved words
+        free_name = name + '_' if name in JAVA_RESERVED_WORDS else name
+        key = free_name.lower()
+        existing_xpath = self._xpaths.get(key)
+        if existing_xpath is None:
+            self._xpaths[key] = xpath
+            return free_name
+        
+        resolved_name = self._disambiguate(name, xpath)
+        self._xpaths[resolved_name.lower()] = xpath
+        conflict = self._conflicts.get((xpath, existing_xpath, resolved_name))
+        if conflict is None:
+            self._conflicts[xpath, existing_xpath, resolved_name] = NameConflict(
+                [self.class_name], name, resolved_name, xpath, existing_xpath
+            )
+        else:
+            conflict.class_names.append(self.class_name)
+        return resolved_name
+    
+    def _disambiguate(self, name: str, xpath: str) -> str:
+        """Get a free name by prefixing parent element names, then by numbering."""
+        candidate = name
+        for segment in reversed(xpath_segments(xpath)[:-1]):
+            candidate = self._camel_case(segment) + candidate[:1].upper() + candidate[1:]
+            if candidate.lower() not in self._xpaths:
+                return candidate
+        
+        suffix = 2
+        while f"{name}{suffix}".lower() in self._xpaths:
+            suffix += 1
+        return f"{name}{suffix}"
 
 
 @dataclass
@@ -29,18 +346,65 @@ class Model:
     name: str
     fields: List[ModelField]
     package_name: str = "com.example.models"
+    component_of: Optional[str] = None  # Top-level class a component class was split from
     
     @property
     def class_name(self) -> str:
         """Get properly formatted class name."""
-        # Capitalize first letter and ensure proper Java naming
-        return self.name.replace("_", "").replace("-", "").title()
+        # Capitalize each part without lowercasing the rest, so that nested
+        # names such as Model1PersonAddress keep their inner capitals
+        parts = self.name.replace("-", "_").split("_")
+        return "".join(part[:1].upper() + part[1:] for part in parts)
+
+
+def component_models(models: Dict[str, Model]) -> Dict[str, Model]:
+    """Index the component classes among models by class name, the type of the fields holding them."""
+    return {model.class_name: model for model in models.values() if model.component_of is not None}
+
+
+def leaf_fields(model: Model, components: Dict[str, Model]) -> Iterator[ModelField]:
+    """
+    Yield the fields of a class with every component field replaced by the fields of its component.
+    
+    Args:
+        model: Class whose fields are yielded
+        components: Component classes by class name, from component_models
+        
+    Yields:
+        The schema fields of the class in constructor order, through any number of component levels
+    """
+    for model_field in model.fields:
+        component = components.get(model_field.data_type)
+        if component is None:
+            yield model_field
+        else:
+            yield from leaf_fields(component, components)
 
 
 class ModelGenerator:
     """Generates model structures from schema data."""
     
-    def __init__(self):
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE, primitives: bool = False,
+                 max_slots: Optional[int] = MAX_CONSTRUCTOR_SLOTS):
+        """
+        Initialize the generator.
+        
+        Args:
+            cache_size: Maximum number of entries kept by each conversion cache
+            primitives: Use primitive types (int, long, double, float, boolean) for
+                required numeric and boolean fields instead of their boxed types
+            max_slots: Split classes whose constructor would take more parameter
+                slots than this into component classes (see split_large_models);
+                None disables splitting
+        
+        Raises:
+            ValueError: If max_slots is less than 2
+        """
+        if max_slots is not None and max_slots < 2:
+            raise ValueError(f"max_slots must be at least 2, got {max_slots}")
+        
+        self.primitives = primitives
+        self.max_slots = max_slots
         self.java_type_mapping = {
             'string': 'String',
             'str': 'String',
@@ -58,102 +422,442 @@ class ModelGenerator:
             'list': 'List<String>',
             'array': 'List<String>'
         }
+        
+        # Bounded memoization of name and type conversion; schema rows repeat
+        # the same segment names and data types many times
+        self._camel_case = lru_cache(maxsize=cache_size)(self._convert_camel_case)
+        self._map_to_java_type = lru_cache(maxsize=cache_size)(self._convert_java_type)
+        
+        # Field name collisions resolved by the last generate_* call
+        self._name_conflicts: Dict[Tuple[str, str, str], NameConflict] = {}
+    
+    @property
+    def name_conflicts(self) -> List[NameConflict]:
+        """Field name collisions resolved by the last generate_* call, one per XPath and resolution."""
+        return list(self._name_conflicts.values())
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss statistics of the conversion caches.
+        
+        Returns:
+            Dictionary of cache name to functools CacheInfo (hits, misses, maxsize, currsize)
+        """
+        return {
+            'camel_case': self._camel_case.cache_info(),
+            'java_type': self._map_to_java_type.cache_info()
+        }
     
-    def generate_models(self, schema_fields: List[SchemaField]) -> Dict[str, Model]:
+    def clear_caches(self) -> None:
+        """Clear the conversion caches, e.g. after changing java_type_mapping."""
+        self._camel_case.cache_clear()
+        self._map_to_java_type.cache_clear()
+    
+    def generate_models(self, schema_fields: Iterable[SchemaField]) -> Dict[str, Model]:
         """
-        Generate four different models based on schema data.
+        Generate one model per modelN column based on schema data.
+        
+        All models are built in a single pass over the schema fields, each
+        row being appended to per-model field buffers, so the cost is linear
+        in the number of rows. Duplicate field names are resolved through a
+        FieldNameIndex per model and recorded in ``name_conflicts``. A
+        generator such as ``CSVSchemaParser.iter_fields`` can be passed
+        without materializing it.
         
         Args:
-            schema_fields: List of parsed schema fields
+            schema_fields: Iterable of parsed schema fields
             
         Returns:
-            Dictionary with model names as keys and Model objects as values
+            Dictionary with model names (Model1..ModelN) as keys and Model objects as values,
+            each followed by its component classes (marked by component_of) if it had to be split
         """
-        models = {}
+        # Per model: the fields collected so far and the index naming them
+        model_buffers: List[Tuple[List[ModelField], FieldNameIndex]] = []
+        self._name_conflicts = {}
         
-        # Generate each of the four models
-        for model_num in range(1, 5):
-            model_name = f"Model{model_num}"
-            model_fields = self._generate_model_fields(schema_fields, model_num)
+        for schema_field in schema_fields:
+            model_values = schema_field.model_values
+            while len(model_buffers) < len(model_values):
+                model_name = f"Model{len(model_buffers) + 1}"
+                model_buffers.append(([], FieldNameIndex(model_name, self._camel_case, self._name_conflicts)))
+            
+            # Models that use this field; skip if value indicates "do not use"
+            using_models = [
+                (model_fields, name_index, model_value)
+                for (model_fields, name_index), model_value in zip(model_buffers, model_values)
+                if not self._should_skip_field(model_value)
+            ]
+            if not using_models:
+                continue
+            
+            # Name, type and description are shared by every model using the field
+            # The last step may be an attribute ("@id") or carry a prefix or predicate
+            field_name = self._camel_case(_step_name(schema_field.field_name))
+            java_type = self._field_java_type(schema_field)
+            description = f"Field mapped from XPath: {schema_field.xpath}"
             
+            for model_fields, name_index, model_value in using_models:
+                model_fields.append(self._create_model_field(
+                    schema_field, model_value, name_index.add(field_name, schema_field.xpath),
+                    java_type, description
+                ))
+        
+        models = {}
+        for model_num, (model_fields, _) in enumerate(model_buffers, start=1):
+            model_name = f"Model{model_num}"
             models[model_name] = Model(
                 name=model_name,
                 fields=model_fields,
                 package_name="com.example.models"
             )
         
-        return models
+        return self.split_large_models(models)
     
-    def _generate_model_fields(self, schema_fields: List[SchemaField], model_num: int) -> List[ModelField]:
+    def generate_nested_models(self, schema_fields: Iterable[SchemaField]) -> Dict[str, Model]:
         """
-        Generate fields for a specific model based on schema data.
+        Generate one class per element path instead of flattening each model.
+        
+        The schema is indexed in an XPathTrie. Elements with child elements
+        become nested classes named after their path (e.g. Model1PersonAddress),
+        referenced by a field of the parent class; leaf elements and attributes
+        become plain fields. A schema row whose element also has children is
+        kept as a "value" field of the nested class. The path prefix shared by
+        all rows (e.g. /root/person) is folded into the top-level ModelN class.
         
         Args:
-            schema_fields: List of schema fields
-            model_num: Model number (1-4)
+            schema_fields: Iterable of parsed schema fields
             
         Returns:
-            List of ModelField objects
+            Dictionary of class name to Model, top-level ModelN classes first
+            in model order, each followed by its nested and component classes
+            (components are marked by component_of)
         """
-        model_fields = []
-        
+        trie = XPathTrie()
+        model_count = 0
         for schema_field in schema_fields:
-            # Get the value for this specific model
-            model_value = self._get_model_value(schema_field, model_num)
+            trie.insert(schema_field)
+            model_count = max(model_count, len(schema_field.model_values))
+        
+        prefix, top_node = trie.common_prefix()
+        models: Dict[str, Model] = {}
+        self._name_conflicts = {}
+        for model_num in range(1, model_count + 1):
+            model_name = f"Model{model_num}"
+            models[model_name] = Model(name=model_name, fields=[])
+            models[model_name].fields = self._nested_model_fields(
+                top_node, prefix, model_name, model_num, models
+            )
+        
+        return self.split_large_models(models)
+    
+    def _nested_model_fields(self, node: XPathNode, path: str, class_name: str,
+                             model_num: int, models: Dict[str, Model]) -> List[ModelField]:
+        """
+        Build the fields of the class for a trie node, adding nested classes to models.
+        
+        Args:
+            node: Trie node of the class
+            path: Element path of the node
+            class_name: Name of the class
+            model_num: Model number (1-based)
+            models: Dictionary receiving the nested classes
             
-            # Skip if value indicates "do not use"
-            if self._should_skip_field(model_value):
+        Returns:
+            Fields of the class for this model; empty if every field is skipped
+        """
+        name_index = FieldNameIndex(class_name, self._camel_case, self._name_conflicts)
+        fields = [
+            model_field
+            for schema_field in node.fields
+            if (model_field := self._nested_leaf_field(schema_field, 'value', model_num, name_index))
+        ]
+        
+        for child in node.children.values():
+            child_path = f"{path}/{child.segment}"
+            field_name = self._camel_case(child.segment)
+            
+            if not child.children:
+                fields.extend(
+                    model_field
+                    for schema_field in child.fields
+                    if (model_field := self._nested_leaf_field(schema_field, field_name, model_num, name_index))
+                )
                 continue
             
-            # Create model field
-            field_name = self._camel_case(schema_field.field_name)
-            java_type = self._map_to_java_type(schema_field.data_type)
-            
-            model_field = ModelField(
-                name=field_name,
-                data_type=java_type,
-                required=schema_field.is_required,
-                default_value=model_value if model_value and model_value != schema_field.field_name else None,
-                description=f"Field mapped from XPath: {schema_field.xpath}",
-                xpath=schema_field.xpath,
-                required_optional_status=schema_field.required,
-                model_value=model_value,
-                additional_info=schema_field.additional_info
-            )
+            child_name = self._nested_class_name(class_name, child.segment, models)
+            # Reserve the name so the nested class follows its parent in models
+            models[child_name] = child_model = Model(name=child_name, fields=[])
+            child_model.fields = self._nested_model_fields(child, child_path, child_name, model_num, models)
+            if not child_model.fields:
+                del models[child_name]
+                continue
             
-            model_fields.append(model_field)
+            fields.append(ModelField(
+                name=name_index.add(field_name, child_path),
+                data_type=child_model.class_name,
+                required=any(child_field.required for child_field in child_model.fields),
+                description=f"Nested element at XPath: {child_path}",
+                xpath=child_path
+            ))
         
-        return model_fields
+        return fields
     
-    def _get_model_value(self, schema_field: SchemaField, model_num: int) -> str:
-        """Get the value for a specific model from schema field."""
-        model_values = {
-            1: schema_field.model1_value,
-            2: schema_field.model2_value,
-            3: schema_field.model3_value,
-            4: schema_field.model4_value
-        }
-        return model_values.get(model_num, '')
+    def _nested_leaf_field(self, schema_field: SchemaField, field_name: str, model_num: int,
+                           name_index: FieldNameIndex) -> Optional[ModelField]:
+        """Create the field of a nested class for a schema row, or None if the model skips it."""
+        if model_num > len(schema_field.model_values):
+            return None
+        model_value = schema_field.model_values[model_num - 1]
+        if self._should_skip_field(model_value):
+            return None
+        return self._create_model_field(
+            schema_field, model_value, name_index.add(field_name, schema_field.xpath),
+            self._field_java_type(schema_field),
+            f"Field mapped from XPath: {schema_field.xpath}"
+        )
+    
+    def split_large_models(self, models: Dict[str, Model]) -> Dict[str, Model]:
+        """
+        Partition classes too wide for a JVM constructor into component classes.
+        
+        The fields of a class whose parameterized constructor would take more
+        than ``max_slots`` parameter slots are grouped by the element path of
+        their XPath parent. Consecutive groups are packed into component
+        classes of at most ``max_slots`` slots, and a group too large for one
+        component is cut into several. The class keeps one field per
+        component, typed with the component class and named after the
+        element path its fields share. If the class is still too wide, its
+        component fields are grouped by their own parents in turn, so each
+        level divides the width by roughly ``max_slots``. Components are
+        marked with the name of their top-level class in ``component_of``.
+        
+        Args:
+            models: Dictionary of class name to Model
+            
+        Returns:
+            Dictionary of class name to Model, each class followed by its
+            components; models is returned as is if no class is too wide
+        """
+        if self.max_slots is None or all(
+            parameter_slots(model.fields) <= self.max_slots for model in models.values()
+        ):
+            return models
+        
+        taken = set(models)
+        split_models: Dict[str, Model] = {}
+        for name, model in models.items():
+            split_models[name] = model
+            split_models.update(self._split_model(model, self.max_slots, taken))
+        
+        return split_models
+    
+    def extract_shared_base(self, models: Dict[str, Model]) -> Optional[Model]:
+        """
+        Find the fields shared by all top-level models and build their base class model.
+        
+        Fields are compared through components, so split models share the
+        fields of their components too. Fields are keyed by shared_field_key,
+        so a shared field is declared identically in every model;
+        model-specific documentation and defaults stay with the subclasses.
+        
+        If the models were split, they are split again around the base, so
+        that no subclass constructor, which also takes the inherited fields,
+        exceeds ``max_slots``. The base gets components of its own if it
+        would take more than half of the slots, and the fields each model
+        does not inherit are split to fit the slots the base leaves. The
+        fields of every subclass then start with those of the base. models
+        is updated in place with the new component classes.
+        
+        Args:
+            models: Dictionary of class name to Model, from generate_models
+            
+        Returns:
+            Model of the base class, which is not added to models, or None if
+            there are fewer than two top-level models or they share no field
+        """
+        components = component_models(models)
+        top_models = [model for model in models.values() if model.component_of is None]
+        if len(top_models) < 2:
+            return None
+        
+        fields_by_model = [list(leaf_fields(model, components)) for model in top_models]
+        shared_keys = set(map(shared_field_key, fields_by_model[0]))
+        for model_fields in fields_by_model[1:]:
+            shared_keys.intersection_update(map(shared_field_key, model_fields))
+        if not shared_keys:
+            return None
+        
+        base = Model(
+            name=SHARED_BASE_CLASS,
+            fields=[
+                ModelField(
+                    name=model_field.name,
+                    data_type=model_field.data_type,
+                    required=model_field.required,
+                    description=model_field.description,
+                    xpath=model_field.xpath,
+                    required_optional_status=model_field.required_optional_status,
+                    additional_info=model_field.additional_info
+                )
+                for model_field in fields_by_model[0] if shared_field_key(model_field) in shared_keys
+            ],
+            package_name=top_models[0].package_name
+        )
+        if not components or self.max_slots is None:
+            return base
+        
+        own_fields_by_model = [
+            [model_field for model_field in model_fields if shared_field_key(model_field) not in shared_keys]
+            for model_fields in fields_by_model
+        ]
+        # Names of the base components must not clash with any field a subclass declares
+        taken = {model.name for model in top_models} | {SHARED_BASE_CLASS}
+        base_components = self._split_model(
+            base, self.max_slots // 2, taken, reserved=list(chain.from_iterable(own_fields_by_model))
+        )
+        
+        models.clear()
+        for model, model_fields, own_fields in zip(top_models, fields_by_model, own_fields_by_model):
+            # Unsplit inherited fields keep the model's own defaults for its constructors
+            inherited = base.fields if base_components else [
+                model_field for model_field in model_fields if shared_field_key(model_field) in shared_keys
+            ]
+            model.fields = own_fields
+            models[model.name] = model
+            models.update(self._split_model(
+                model, self.max_slots - parameter_slots(inherited), taken, reserved=inherited
+            ))
+            model.fields = inherited + model.fields
+        models.update(base_components)
+        
+        return base
+    
+    def _split_model(self, model: Model, max_slots: int, taken: Set[str],
+                     reserved: Iterable[ModelField] = ()) -> Dict[str, Model]:
+        """
+        Replace the fields of a class by component fields until its constructor fits.
+        
+        Args:
+            model: Class whose fields are split
+            max_slots: Parameter slots the constructor may take
+            taken: Class names in use, updated with the new component names
+            reserved: Fields whose names the component fields of the class must not take
+            
+        Returns:
+            Dictionary of the new component classes, outermost level last
+        """
+        components: Dict[str, Model] = {}
+        while parameter_slots(model.fields) > max_slots:
+            model.fields = self._component_fields(model, components, taken, reserved)
+        return components
+    
+    def _component_fields(self, model: Model, components: Dict[str, Model],
+                          taken: Set[str], reserved: Iterable[ModelField] = ()) -> List[ModelField]:
+        """
+        Move the fields of a class into component classes, one level deep.
+        
+        Args:
+            model: Class whose fields are split
+            components: Dictionary receiving the component classes
+            taken: Class names in use, updated with the new component names
+            reserved: Fields whose names the component fields must not take
+            
+        Returns:
+            The fields referencing the components, which replace the fields of the class
+        """
+        groups: Dict[str, List[ModelField]] = {}
+        for model_field in model.fields:
+            groups.setdefault(_parent_xpath(model_field.xpath), []).append(model_field)
+        
+        # Pack whole groups while they fit and cut groups larger than a component
+        chunks: List[List[ModelField]] = []
+        current: List[ModelField] = []
+        current_slots = 0
+        for group in groups.values():
+            group_slots = parameter_slots(group)
+            if current and current_slots + group_slots > self.max_slots:
+                chunks.append(current)
+                current, current_slots = [], 0
+            for model_field in group:
+                field_slots = 2 if model_field.data_type in WIDE_TYPES else 1
+                if current_slots + field_slots > self.max_slots:
+                    chunks.append(current)
+                    current, current_slots = [], 0
+                current.append(model_field)
+                current_slots += field_slots
+        if current:
+            chunks.append(current)
+        
+        # Component field names are not schema names, so their clashes are not reported
+        name_index = FieldNameIndex(model.class_name, self._camel_case, {})
+        for name, xpath in {model_field.name: model_field.xpath for model_field in reserved}.items():
+            name_index.add(name, xpath or "")
+        fields = []
+        for chunk in chunks:
+            xpath = _common_xpath([model_field.xpath or "" for model_field in chunk])
+            segments = xpath_segments(xpath)
+            segment = segments[-1] if segments else 'part'
+            
+            class_name = self._nested_class_name(model.class_name, segment, taken)
+            taken.add(class_name)
+            component = components[class_name] = Model(
+                name=class_name, fields=chunk, package_name=model.package_name,
+                component_of=model.component_of or model.name
+            )
+            fields.append(ModelField(
+                name=name_index.add(self._camel_case(segment), xpath or f"/{segment}"),
+                data_type=component.class_name,
+                required=any(model_field.required for model_field in chunk),
+                description=f"Component holding fields under XPath: {xpath or '/'}",
+                xpath=xpath or None
+            ))
+        
+        return fields
+    
+    def _nested_class_name(self, parent_name: str, segment: str, models: Container[str]) -> str:
+        """Get a unique nested class name from the parent class name and element name."""
+        camel = self._camel_case(segment)
+        base_name = parent_name + camel[:1].upper() + camel[1:]
+        class_name, suffix = base_name, 2
+        while class_name in models:
+            class_name = f"{base_name}{suffix}"
+            suffix += 1
+        return class_name
+    
+    def _create_model_field(self, schema_field: SchemaField, model_value: str, field_name: str,
+                            java_type: str, description: str) -> ModelField:
+        """Create a model field for a schema row included in a model."""
+        return ModelField(
+            name=field_name,
+            data_type=java_type,
+            required=schema_field.is_required,
+            default_value=model_value if model_value and model_value != schema_field.field_name else None,
+            description=description,
+            xpath=schema_field.xpath,
+            required_optional_status=schema_field.required,
+            model_value=model_value,
+            additional_info=schema_field.additional_info
+        )
+    
+    def _field_java_type(self, schema_field: SchemaField) -> str:
+        """Get the Java type of a schema field, primitive if required in primitive mode."""
+        java_type = self._map_to_java_type(schema_field.data_type)
+        if self.primitives and schema_field.is_required:
+            return PRIMITIVE_TYPES.get(java_type, java_type)
+        return java_type
     
     def _should_skip_field(self, model_value: str) -> bool:
         """Check if field should be skipped based on model value."""
-        skip_indicators = [
-            'do not use', 'skip', 'ignore', 'exclude', 
-            'n/a', 'na', 'null', 'none', '-'
-        ]
-        return model_value.lower().strip() in skip_indicators
+        return model_value.lower().strip() in SKIP_INDICATORS
     
-    def _camel_case(self, snake_str: str) -> str:
-        """Convert snake_case or kebab-case to camelCase."""
+    def _convert_camel_case(self, snake_str: str) -> str:
+        """Convert snake_case or kebab-case to camelCase (memoized as _camel_case)."""
         # Handle various separators
-        for separator in ['_', '-', '.', '/']:
-            snake_str = snake_str.replace(separator, '_')
-        
-        components = snake_str.split('_')
+        components = snake_str.translate(SEPARATOR_TABLE).split('_')
         # Keep first component lowercase, capitalize rest
         return components[0].lower() + ''.join(word.capitalize() for word in components[1:])
     
-    def _map_to_java_type(self, data_type: str) -> str:
-        """Map string data type to Java type."""
+    def _convert_java_type(self, data_type: str) -> str:
+        """Map string data type to Java type (memoized as _map_to_java_type)."""
         normalized_type = data_type.lower().strip()
         return self.java_type_mapping.get(normalized_type, 'String')  # Default to String
@@ -0,0 +1,143 @@
+"""
+Schema Cache Module
+
+This module stores parsed schemas on disk so that unchanged CSV files are not parsed again.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+
+# Environment variable naming the cache directory, used when no directory is given
+CACHE_DIR_ENV = 'CSV_SCHEMA_CACHE_DIR'
+
+# Default upper bound on the total size of the cache directory
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# File extension of cache entries
+ENTRY_SUFFIX = '.schema'
+
+
+class SchemaCache:
+    """
+    On-disk cache of parsed schemas keyed by file content hash.
+    
+    Entries are stored as zlib-compressed JSON rather than pickles: the cache
+    directory may come from CSV_SCHEMA_CACHE_DIR and be shared, so a tampered
+    entry must at worst load as wrong data, never run code. Reading an entry
+    refreshes its modification time, and whenever the cache grows beyond
+    ``max_bytes`` the least recently used entries are evicted.
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory holding the cache entries (created if missing)
+            max_bytes: Maximum total size of all cache entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    @classmethod
+    def from_env(cls) -> Optional['SchemaCache']:
+        """Create a cache in the directory named by CSV_SCHEMA_CACHE_DIR, or None if unset."""
+        cache_dir = os.environ.get(CACHE_DIR_ENV)
+        return cls(cache_dir) if cache_dir else None
+    
+    def key_for(self, file_path: str, namespace: str, version: int) -> str:
+        """
+        Build the cache key for a file.
+        
+        Args:
+            file_path: Path to the CSV file
+            namespace: Kind of parsed data stored under the key
+            version: Version of the parser producing the data
+        
+        Returns:
+            Hex digest identifying the file content, namespace and version
+        
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        digest = hashlib.sha256(f"{namespace}:{version}:".encode('utf-8'))
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def load(self, key: str) -> Optional[Any]:
+        """
+        Load a cache entry.
+        
+        Args:
+            key: Cache key from key_for
+        
+        Returns:
+            The stored value, with JSON arrays loaded as lists, or None if
+            there is no usable entry
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as file:
+                value = json.loads(zlib.decompress(file.read()).decode('utf-8'))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or incompatible entry; drop it and parse again
+            entry_path.unlink(missing_ok=True)
+            return None
+        
+        # Mark the entry as recently used
+        os.utime(entry_path)
+        return value
+    
+    def store(self, key: str, value: Any) -> None:
+        """
+        Store a cache entry, then evict old entries if the cache is too large.
+        
+        Args:
+            key: Cache key from key_for
+            value: JSON-serializable value to store; tuples are stored as arrays
+        """
+        data = zlib.compress(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 1)
+        
+        # Write to a temporary file first so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data)
+            os.replace(temp_path, self._entry_path(key))
+        except Exception:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        
+        self._evict()
+    
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path of a cache entry."""
+        return self.cache_dir / f"{key}{ENTRY_SUFFIX}"
+    
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for entry_path in self.cache_dir.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+        
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
@@ -3,15 +3,21 @@ UML Diagram Generator for CSV Schema
 Generates PlantUML diagrams from CSV schema files
 """
 
-import csv
 import os
-from typing import Dict, List, Tuple, Set
+from typing import List, Optional, Tuple
+
+from src.csv_parser import CSVSchemaParser, SchemaField
+
+
+# Model values that leave a field out of a model's class in the diagram
+UML_SKIP_VALUES = frozenset(['do not use', 'skip', 'ignore', ''])
 
 
 class UMLGenerator:
     """Generates UML class diagrams from CSV schema data"""
     
-    def __init__(self):
+    def __init__(self, parser: Optional[CSVSchemaParser] = None):
+        self.parser = parser or CSVSchemaParser()
         self.java_type_mapping = {
             'String': 'String',
             'Integer': 'int',
@@ -26,10 +32,13 @@ class UMLGenerator:
     
     def generate_plantuml(self, csv_file_path: str, output_file_path: str) -> None:
         """Generate PlantUML diagram from CSV schema"""
-        schema_data = self._parse_csv_file(csv_file_path)
-        
+        schema_fields = self._parse_csv_file(csv_file_path)
+        self.write_plantuml(schema_fields, output_file_path)
+    
+    def write_plantuml(self, schema_fields: List[SchemaField], output_file_path: str) -> None:
+        """Generate PlantUML diagram from already parsed schema fields"""
         # Generate UML content
-        uml_content = self._create_plantuml_content(schema_data)
+        uml_content = self._create_plantuml_content(schema_fields)
         
         # Write to file
         with open(output_file_path, 'w', encoding='utf-8') as file:
@@ -37,116 +46,11 @@ class UMLGenerator:
         
         print(f"UML diagram generated: {output_file_path}")
     
-    def _parse_csv_file(self, csv_file_path: str) -> List[Dict]:
-        """Parse CSV file and return schema data"""
-        schema_data = []
-        delimiter = ','  # Initialize with default
-        
-        try:
-            # First, read and clean the CSV content
-            with open(csv_file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                
-                # Clean up problematic quotes while preserving commas
-                # Remove multiple consecutive quotes but keep single quotes if needed
-                import re
-                # Replace 3+ quotes with single quote
-                content = re.sub(r'"{3,}', '"', content)
-                # Replace double quotes that aren't at field boundaries
-                content = re.sub(r'""(?!")', '', content)
-                
-                # Create a StringIO object for csv.DictReader
-                from io import StringIO
-                cleaned_file = StringIO(content)
-                
-                # Use csv.Sniffer to detect delimiter
-                sample = content[:1024]
-                sniffer = csv.Sniffer()
-                
-                try:
-                    delimiter = sniffer.sniff(sample).delimiter
-                    print(f"Auto-detected delimiter: {repr(delimiter)}")
-                except csv.Error:
-                    # Try common delimiters in order of preference
-                    for test_delimiter in [',', ';', '\t', '|']:
-                        if test_delimiter in sample:
-                            delimiter = test_delimiter
-                            print(f"Using delimiter: {repr(delimiter)}")
-                            break
-                    else:
-                        # Fallback to comma if no delimiter found
-                        delimiter = ','
-                        print(f"Using default delimiter: {repr(delimiter)}")
-                
-                # Parse the cleaned content
-                reader = csv.DictReader(
-                    cleaned_file, 
-                    delimiter=delimiter,
-                    quotechar='"',
-                    quoting=csv.QUOTE_MINIMAL,
-                    skipinitialspace=True
-                )
-                
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 since row 1 is headers
-                    # Clean up the row data
-                    cleaned_row = {}
-                    for key, value in row.items():
-                        if key is None:
-                            continue  # Skip None keys from malformed CSV
-                        
-                        # Clean the key and value
-                        cleaned_key = key.strip() if key else key
-                        cleaned_value = value.strip() if value else value
-                        
-                        cleaned_row[cleaned_key] = cleaned_value
-                    
-                    # Only add rows that have an xpath value
-                    if cleaned_row.get('xpath'):
-                        schema_data.append(cleaned_row)
-                    elif any(cleaned_row.values()):  # Row has some data but no xpath
-                        print(f"⚠️  Warning: Row {row_num} has data but missing xpath: {cleaned_row}")
-                        
-        except UnicodeDecodeError:
-            # Try with different encodings if UTF-8 fails
-            for encoding in ['latin1', 'cp1252', 'iso-8859-1']:
-                try:
-                    with open(csv_file_path, 'r', encoding=encoding) as file:
-                        content = file.read()
-                        # Apply same cleaning
-                        import re
-                        content = re.sub(r'"{3,}', '"', content)
-                        content = re.sub(r'""(?!")', '', content)
-                        
-                        from io import StringIO
-                        cleaned_file = StringIO(content)
-                        reader = csv.DictReader(
-                            cleaned_file, 
-                            delimiter=delimiter,
-                            quotechar='"',
-                            quoting=csv.QUOTE_MINIMAL,
-                            skipinitialspace=True
-                        )
-                        schema_data = []
-                        for row in reader:
-                            cleaned_row = {}
-                            for key, value in row.items():
-                                if key is None:
-                                    continue
-                                cleaned_key = key.strip() if key else key
-                                cleaned_value = value.strip() if value else value
-                                cleaned_row[cleaned_key] = cleaned_value
-                            
-                            if cleaned_row.get('xpath'):
-                                schema_data.append(cleaned_row)
-                        break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                raise Exception("Could not decode CSV file with any common encoding")
-        
-        return schema_data
+    def _parse_csv_file(self, csv_file_path: str) -> List[SchemaField]:
+        """Parse CSV file with the shared schema parser and return schema fields"""
+        return self.parser.parse_csv(csv_file_path)
     
-    def _create_plantuml_content(self, schema_data: List[Dict]) -> str:
+    def _create_plantuml_content(self, schema_data: List[SchemaField]) -> str:
         """Create PlantUML content from schema data"""
         uml_lines = [
             "@startuml CSV Schema Models",
@@ -162,9 +66,9 @@ class UMLGenerator:
         ]
         
         # Generate classes for each model
-        for model_num in range(1, 5):
+        for model_num in self._get_model_numbers(schema_data):
             model_name = f"Model{model_num}"
-            fields = self._get_model_fields(schema_data, f"model{model_num}")
+            fields = self._get_model_fields(schema_data, model_num)
             
             if fields:
                 uml_lines.extend(self._create_class_definition(model_name, fields))
@@ -183,20 +87,25 @@ class UMLGenerator:
         
         return "\n".join(uml_lines)
     
-    def _get_model_fields(self, schema_data: List[Dict], model_column: str) -> List[Tuple[str, str, str]]:
+    def _get_model_numbers(self, schema_data: List[SchemaField]) -> range:
+        """Get the model numbers (1..N) present in the schema data"""
+        model_count = len(schema_data[0].model_values) if schema_data else 0
+        return range(1, model_count + 1)
+    
+    def _get_model_fields(self, schema_data: List[SchemaField], model_num: int) -> List[Tuple[str, str, str]]:
         """Get fields for a specific model"""
         fields = []
         
         for row in schema_data:
-            model_value = row.get(model_column, '').strip().lower()
+            model_value = row.model_value(model_num).strip().lower()
             
             # Skip if field should not be included in this model
-            if model_value in ['do not use', 'skip', 'ignore', '']:
+            if model_value in UML_SKIP_VALUES:
                 continue
             
-            xpath = row.get('xpath', '')
-            data_type = row.get('data_type', 'String')
-            required = row.get('required/optional', 'optional')
+            xpath = row.xpath
+            data_type = row.data_type
+            required = row.required
             
             # Convert xpath to field name
             field_name = self._xpath_to_field_name(xpath)
@@ -310,15 +219,15 @@ class UMLGenerator:
         
         return lines
     
-    def _find_relationships(self, schema_data: List[Dict]) -> List[str]:
+    def _find_relationships(self, schema_data: List[SchemaField]) -> List[str]:
         """Find relationships between models based on common fields"""
         relationships = []
         
         # Get field sets for each model
         model_fields = {}
-        for model_num in range(1, 5):
+        for model_num in self._get_model_numbers(schema_data):
             model_name = f"Model{model_num}"
-            fields = self._get_model_fields(schema_data, f"model{model_num}")
+            fields = self._get_model_fields(schema_data, model_num)
             if fields:
                 model_fields[model_name] = set(field[0] for field in fields)
         
@@ -339,7 +248,7 @@ class UMLGenerator:
         
         return relationships
     
-    def _create_notes(self, schema_data: List[Dict]) -> List[str]:
+    def _create_notes(self, schema_data: List[SchemaField]) -> List[str]:
         """Create notes with additional information"""
         notes = [
             "note top : Generated from CSV Schema",
@@ -347,7 +256,7 @@ class UMLGenerator:
         ]
         
         # Count required vs optional fields
-        required_count = sum(1 for row in schema_data if row.get('required/optional', '').lower() == 'required')
+        required_count = sum(1 for row in schema_data if row.required.lower() == 'required')
         optional_count = len(schema_data) - required_count
         
         notes.append(f"note bottom : Required: {required_count}, Optional: {optional_count}")
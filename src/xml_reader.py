@@ -0,0 +1,84 @@
+"""
+XML Reader Module
+
+This module builds the path-state tables from which streaming XML readers are generated.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from src.model_generator import ModelField, xpath_segments
+
+
+# State of a reader before it enters the document's root element
+ROOT_STATE = 0
+
+
+@dataclass(slots=True)
+class PathState:
+    """A state of the XML reader: one element path of the schema."""
+    parent: int  # State entered again when the element ends
+    transitions: Dict[str, int] = field(default_factory=dict)  # Child element name -> state
+    text_fields: List[ModelField] = field(default_factory=list)  # Fields read from the element text
+    attribute_fields: List[Tuple[str, ModelField]] = field(default_factory=list)  # (attribute, field)
+
+
+def xpath_target(xpath: str) -> Tuple[List[str], Optional[str]]:
+    """
+    Split an XPath into the element path and the attribute it selects.
+    
+    Only an "@" on the last step selects an attribute; elsewhere it is
+    ignored like other XPath syntax, as in xpath_segments.
+    
+    Args:
+        xpath: XPath expression from the schema
+    
+    Returns:
+        (element names from the root, attribute name or None) tuple
+    """
+    segments = xpath_segments(xpath)
+    last_step = xpath.rstrip('/').rsplit('/', 1)[-1].strip()
+    if last_step.startswith('@') and segments:
+        return segments[:-1], segments[-1]
+    return segments, None
+
+
+def build_path_table(fields: List[ModelField]) -> List[PathState]:
+    """
+    Build the path-state table of a reader for the given fields.
+    
+    Each distinct element path becomes a state numbered in order of first
+    appearance, with ROOT_STATE before the root element. The reader moves
+    between states with one lookup per element start and end, so matching
+    costs O(1) per event however many XPaths the schema has. Fields without
+    an XPath are not read.
+    
+    Args:
+        fields: Model fields carrying the XPath they map from
+    
+    Returns:
+        States indexed by state number
+    """
+    states = [PathState(parent=-1)]
+    for model_field in fields:
+        if not model_field.xpath:
+            continue
+        
+        elements, attribute = xpath_target(model_field.xpath)
+        if not elements:
+            continue
+        
+        state = ROOT_STATE
+        for element in elements:
+            next_state = states[state].transitions.get(element)
+            if next_state is None:
+                next_state = states[state].transitions[element] = len(states)
+                states.append(PathState(parent=state))
+            state = next_state
+        
+        if attribute is None:
+            states[state].text_fields.append(model_field)
+        else:
+            states[state].attribute_fields.append((attribute, model_field))
+    
+    return states
@@ -0,0 +1,80 @@
+"""
+Checks of generated readers and mappers for models split into components.
+
+Run with: python -m unittest discover tests
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.csv_parser import SchemaField
+from src.java_structure import JavaStructureGenerator
+from src.model_generator import ModelGenerator, component_models, leaf_fields
+
+
+SCHEMA = [
+    SchemaField(f'/example/group{group}/field{index}', 'required', 'string', ('x', 'y'))
+    for group in range(3)
+    for index in range(4)
+]
+
+
+class ComponentTest(unittest.TestCase):
+    """Components are read, mapped and benchmarked through their top-level models."""
+    
+    def setUp(self):
+        self.generator = ModelGenerator(max_slots=5)
+        self.models = self.generator.generate_models(SCHEMA)
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_dir.cleanup)
+        JavaStructureGenerator(xml_readers=True, mappers=True, benchmarks=True).generate_java_files(
+            self.models, self.output_dir.name)
+    
+    def _read(self, name: str) -> str:
+        return (Path(self.output_dir.name) / name).read_text()
+    
+    def test_components_are_marked(self):
+        top_models = [model.name for model in self.models.values() if model.component_of is None]
+        components = {model.component_of for model in self.models.values() if model.component_of}
+        
+        self.assertEqual(top_models, ['Model1', 'Model2'])
+        self.assertEqual(components, {'Model1', 'Model2'})
+    
+    def test_reader_binds_every_leaf_field(self):
+        reader = self._read('Model1.java')
+        components = component_models(self.models)
+        
+        self.assertIn('public static Model1 fromXml(XMLStreamReader xmlReader)', reader)
+        self.assertIn('return new Model1(group0.build(), group1.build(), group2.build());', reader)
+        for component in components.values():
+            if component.component_of != 'Model1':
+                continue
+            code = self._read(f'{component.class_name}.java')
+            for field in component.fields:
+                self.assertIn(f'{field.name} = xmlValue;', code)
+            self.assertNotIn('fromXml(', code)
+        self.assertEqual(
+            {field.name for field in leaf_fields(self.models['Model1'], components)},
+            {field.name for component in components.values() if component.component_of == 'Model1'
+             for field in component.fields}
+        )
+    
+    def test_mappers_and_benchmarks_cover_top_level_models(self):
+        files = {path.name for path in Path(self.output_dir.name).rglob('*.java')}
+        mapper = self._read('Model1ToModel2Mapper.java')
+        
+        # Each target component is built by its own component mapper
+        self.assertIn('return new Model2(Model2Group0Mapper.map(source), Model2Group1Mapper.map(source), '
+                      'Model2Group2Mapper.map(source));', mapper)
+        self.assertIn('Model1Group2 sourceComponent1 = source.getGroup2();', mapper)
+        self.assertIn('sourceComponent1 == null ? "y" : sourceComponent1.getGroup2field3()', mapper)
+        self.assertIn('Copies 12 of the 12 Model2 fields', mapper)
+        self.assertEqual({name for name in files if name.endswith('Mapper.java')},
+                         {'Model1ToModel2Mapper.java', 'Model2ToModel1Mapper.java'})
+        self.assertEqual({name for name in files if name.endswith('Benchmark.java')},
+                         {'Model1Benchmark.java', 'Model2Benchmark.java', 'MapperBenchmark.java'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Checks of CSV schema parsing across engines.
+
+Run with: python -m unittest discover tests
+"""
+
+import codecs
+import contextlib
+import io
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+from src import csv_parser
+from src.csv_parser import CSVSchemaParser
+from src.encoding_detector import SAMPLE_BYTES
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+HEADER = 'xpath,required/optional,data_type,model1,model2\n'
+
+
+def write_csv(directory: str, content: bytes) -> str:
+    """Write a schema file into a directory and return its path."""
+    file_path = os.path.join(directory, 'schema.csv')
+    with open(file_path, 'wb') as f:
+        f.write(content)
+    return file_path
+
+
+class MissingXpathRowTest(unittest.TestCase):
+    """Rows with data but no xpath are reported by the line they end on, whatever the engine."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+    
+    def _warned_rows(self, content: str, **options) -> list:
+        file_path = write_csv(self.directory.name, content.encode('utf-8'))
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            list(CSVSchemaParser(**options).iter_fields(file_path, chunksize=2))
+        return [int(row) for row in re.findall(r'Row (\d+) has data', output.getvalue())]
+    
+    def test_quoted_line_breaks(self):
+        for newline in ('\n', '\r\n'):
+            content = (HEADER + '/a/b,required,string,"two\nlines",x\n'
+                       + '/a/c,required,string,"three{crlf}line\nbreaks",y\n'
+                       + ',,,orphan,z\n\n/a/d,required,string,p,q\n,,,last,w\n').replace('\n', newline)
+            content = content.replace('{crlf}', '\r\n')
+            with self.subTest(newline=repr(newline)):
+                self.assertEqual(self._warned_rows(content), [7, 10])
+                if pandas is not None:
+                    self.assertEqual(self._warned_rows(content, engine='pandas'), [7, 10])
+
+
+
+def tricky_rows(count: int, newline: str) -> str:
+    """Get schema rows with quoted line breaks, escaped quotes and rows missing their xpath."""
+    rows = []
+    for index in range(count):
+        if index % 5 == 0:
+            rows.append(f'/root/item{index},required,string,"first{newline}line ""{index}""","b,{index}"')
+        elif index % 5 == 1:
+            rows.append(f',,,"orphan ""{index}""{newline}continued",z')
+        elif index % 5 == 2:
+            rows.append(f'/root/item{index},optional,integer,"""quoted""",""')
+        elif index % 5 == 3:
+            rows.append('')
+        else:
+            rows.append(f'/root/item{index}/@id,required,string,"a{newline}{newline}b",plain')
+    return HEADER.replace('\n', newline) + newline.join(rows) + newline
+
+
+class ParallelParseTest(unittest.TestCase):
+    """Parsing in byte ranges gives the fields and warnings of a sequential parse."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+    
+    def _parse(self, file_path: str, **options) -> tuple:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            fields = CSVSchemaParser(**options).parse_csv(file_path)
+        return fields, output.getvalue().splitlines()
+    
+    def test_fields_and_warnings_match_across_workers(self):
+        for newline in ('\n', '\r\n'):
+            file_path = write_csv(self.directory.name, tricky_rows(300, newline).encode('utf-8'))
+            expected_fields, expected_warnings = self._parse(file_path)
+            self.assertEqual(len(expected_fields), 180)
+            self.assertEqual(len(expected_warnings), 60)
+            self.assertEqual(expected_fields[0].model_values, (f'first{newline}line "0"', 'b,0'))
+            
+            # Small ranges put record boundaries, quoted line breaks and escaped quotes on range edges
+            with mock.patch.object(csv_parser, 'MIN_PARALLEL_BYTES', 0), \
+                    mock.patch.object(csv_parser, 'MIN_CHUNK_BYTES', 97):
+                for workers in (2, 3):
+                    with self.subTest(newline=repr(newline), workers=workers):
+                        self.assertEqual(self._parse(file_path, workers=workers),
+                                         (expected_fields, expected_warnings))
+            if pandas is not None:
+                with self.subTest(newline=repr(newline), engine='pandas'):
+                    self.assertEqual(self._parse(file_path, engine='pandas'), (expected_fields, expected_warnings))
+
+
+
+class DecodingFallbackTest(unittest.TestCase):
+    """Files are decoded past a BOM, and re-read in a fallback encoding without repeating fields."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+    
+    def _parse_all(self, content: bytes) -> dict:
+        """Parse a file with every engine, giving (fields, encoding, output) by engine."""
+        file_path = write_csv(self.directory.name, content)
+        engines = {'stdlib': {}, 'parallel': {'workers': 2}}
+        if pandas is not None:
+            engines['pandas'] = {'engine': 'pandas'}
+        results = {}
+        for name, options in engines.items():
+            parser = CSVSchemaParser(**options)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output), mock.patch.object(csv_parser, 'MIN_PARALLEL_BYTES', 0), \
+                    mock.patch.object(csv_parser, 'MIN_CHUNK_BYTES', SAMPLE_BYTES // 8):
+                fields = parser.parse_csv(file_path)
+            results[name] = fields, parser.encoding, output.getvalue()
+        return results
+    
+    def _late_row(self, value: bytes) -> bytes:
+        """Get an ASCII file whose last row, past the detection sample, holds a non-ASCII value."""
+        rows = b''.join(b'/root/field%d,required,string,value%d,other\n' % (index, index)
+                        for index in range(SAMPLE_BYTES // 32))
+        self.assertGreater(len(rows), SAMPLE_BYTES)
+        return HEADER.encode('ascii') + rows + b'/root/last,optional,string,' + value + b',x\n'
+    
+    def _assert_fields(self, fields: list, last_value: str) -> None:
+        xpaths = [field.xpath for field in fields]
+        self.assertEqual(len(xpaths), SAMPLE_BYTES // 32 + 1)
+        self.assertEqual(len(set(xpaths)), len(xpaths))
+        self.assertEqual(xpaths[:2], ['/root/field0', '/root/field1'])
+        self.assertEqual(fields[-1].model_values, (last_value, 'x'))
+    
+    def test_bom_is_skipped(self):
+        content = codecs.BOM_UTF8 + (HEADER + '/root/name,required,string,Zoë,Chloé\n').encode('utf-8')
+        
+        for engine, (fields, encoding, _) in self._parse_all(content).items():
+            with self.subTest(engine=engine):
+                self.assertEqual(encoding, 'utf-8')
+                self.assertEqual([field.xpath for field in fields], ['/root/name'])
+                self.assertEqual(fields[0].model_values, ('Zoë', 'Chloé'))
+    
+    def test_cp1252_byte_past_the_sample(self):
+        content = self._late_row(b'\x93quoted\x94')
+        
+        for engine, (fields, encoding, output) in self._parse_all(content).items():
+            with self.subTest(engine=engine):
+                self.assertEqual(encoding, 'cp1252')
+                self.assertIn(f'byte 0x93 at offset {content.index(bytes([0x93]))}', output)
+                self._assert_fields(fields, '\u201cquoted\u201d')
+    
+    def test_latin1_only_byte_past_the_sample(self):
+        # 0x81 is undefined in cp1252 too, so parsing restarts twice
+        content = self._late_row(b'a\x81b')
+        
+        for engine, (fields, encoding, output) in self._parse_all(content).items():
+            with self.subTest(engine=engine):
+                self.assertEqual(encoding, 'latin-1')
+                self.assertIn('re-reading the file as cp1252', output)
+                self.assertIn('re-reading the file as latin-1', output)
+                self._assert_fields(fields, 'a\x81b')
+
+
+if __name__ == '__main__':
+    unittest.main()
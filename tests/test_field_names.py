@@ -0,0 +1,67 @@
+"""
+Checks of generated field names: clash resolution, reserved words and conflict reports.
+
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+
+from src.csv_parser import SchemaField
+from src.model_generator import FieldNameIndex, ModelGenerator
+
+
+class FieldNameIndexTest(unittest.TestCase):
+    """Clashing names take parent prefixes, nearest first, then a numeric suffix."""
+    
+    def setUp(self):
+        self.conflicts = {}
+        self.index = FieldNameIndex('Model1', ModelGenerator()._camel_case, self.conflicts)
+    
+    def test_renaming_order(self):
+        names = [
+            self.index.add('city', '/root/person/address/city'),
+            self.index.add('city', '/root/company/address/city'),
+            self.index.add('city', '/root/shop/address/city'),
+            self.index.add('city', '/address/city'),
+            self.index.add('City', '/City'),
+        ]
+        
+        self.assertEqual(names, ['city', 'addressCity', 'shopAddressCity', 'city2', 'City3'])
+        self.assertEqual([conflict.existing_xpath for conflict in self.conflicts.values()],
+                         ['/root/person/address/city'] * 4)
+    
+    def test_reserved_words(self):
+        names = [
+            self.index.add('class', '/root/class'),
+            self.index.add('long', '/root/position/long'),
+            self.index.add('class', '/root/item/class'),
+            self.index.add('class', '/class'),
+        ]
+        
+        self.assertEqual(names, ['class_', 'long_', 'itemClass', 'class2'])
+        self.assertEqual([conflict.name for conflict in self.conflicts.values()], ['class', 'class'])
+
+
+class NameConflictTest(unittest.TestCase):
+    """A schema row renamed alike in several models is reported once."""
+    
+    def test_conflicts_are_reported_once_per_xpath(self):
+        schema = [
+            SchemaField('/root/person/name', 'required', 'string', ('a', 'b', 'c')),
+            SchemaField('/root/company/name', 'required', 'string', ('d', 'e', 'skip')),
+            SchemaField('/root/company/class', 'optional', 'string', ('f', 'g', 'h')),
+        ]
+        generator = ModelGenerator()
+        
+        models = generator.generate_models(schema)
+        
+        self.assertEqual([field.name for field in models['Model1'].fields], ['name', 'companyName', 'class_'])
+        self.assertEqual([field.name for field in models['Model3'].fields], ['name', 'class_'])
+        self.assertEqual([str(conflict) for conflict in generator.name_conflicts], [
+            "Model1, Model2: field 'name' from /root/company/name clashes with /root/person/name; "
+            "renamed to 'companyName'"
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
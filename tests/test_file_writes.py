@@ -0,0 +1,75 @@
+"""
+Checks that regenerating into an output directory leaves unchanged files untouched.
+
+Run with: python -m unittest discover tests
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.csv_parser import SchemaField
+from src.java_structure import JavaStructureGenerator
+from src.model_generator import ModelGenerator
+
+
+SCHEMA = [
+    SchemaField('/order/@id', 'required', 'integer', ('1', '2')),
+    SchemaField('/order/customer', 'required', 'string', ('buyer', 'client')),
+    SchemaField('/order/total', 'optional', 'decimal', ('amount', 'sum')),
+]
+
+# Modification time set on every file before regenerating, far from the current time
+OLD_MTIME_NS = 1_000_000_000 * 10**9
+
+
+class UnchangedFileTest(unittest.TestCase):
+    """A second identical run skips every file without writing or replacing it."""
+    
+    def setUp(self):
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_dir.cleanup)
+        self.output_path = Path(self.output_dir.name)
+    
+    def _generate(self, schema) -> JavaStructureGenerator:
+        generator = JavaStructureGenerator(xml_readers=True, json=True, mappers=True, benchmarks=True)
+        generator.generate_java_files(ModelGenerator().generate_models(schema), self.output_dir.name)
+        return generator
+    
+    def _files(self):
+        return {path.relative_to(self.output_path).as_posix(): path for path in self.output_path.rglob('*')
+                if path.is_file()}
+    
+    def test_second_run_skips_unchanged_files(self):
+        first = self._generate(SCHEMA)
+        files = self._files()
+        for path in files.values():
+            os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+        
+        second = self._generate(SCHEMA)
+        
+        self.assertEqual(sorted(first.written_files), sorted(files))
+        self.assertEqual(second.written_files, [])
+        self.assertEqual(sorted(second.skipped_files), sorted(files))
+        self.assertEqual(self._files().keys(), files.keys())
+        for path in files.values():
+            self.assertEqual(path.stat().st_mtime_ns, OLD_MTIME_NS)
+    
+    def test_changed_files_are_replaced(self):
+        self._generate(SCHEMA)
+        for path in self._files().values():
+            os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+        changed = SCHEMA[:2] + [SchemaField('/order/total', 'optional', 'string', ('amount', 'sum'))]
+        
+        generator = self._generate(changed)
+        
+        self.assertIn('Model1.java', generator.written_files)
+        self.assertIn('Model1ToModel2Mapper.java', generator.skipped_files)
+        self.assertIn('String total', (self.output_path / 'Model1.java').read_text())
+        self.assertNotEqual((self.output_path / 'Model1.java').stat().st_mtime_ns, OLD_MTIME_NS)
+        self.assertFalse([path for path in self._files() if path.endswith('.tmp')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Checks of the fields copied by generated mappers.
+
+Run with: python -m unittest discover tests
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.csv_parser import SchemaField
+from src.java_structure import JavaStructureGenerator
+from src.model_generator import ModelGenerator
+
+
+SCHEMA = [
+    SchemaField('/person/@id', 'required', 'integer', ('1', '2')),
+    SchemaField('/person/name', 'required', 'string', ('fullName', 'displayName')),
+    SchemaField('/person/age', 'optional', 'integer', ('do not use', '30')),
+    SchemaField('/person/email', 'optional', 'string', ('mail', 'do not use')),
+]
+
+
+class MapperFieldTest(unittest.TestCase):
+    """Mappers copy the fields of the same XPath and default the fields the source does not use."""
+    
+    def setUp(self):
+        self.models = ModelGenerator().generate_models(SCHEMA)
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_dir.cleanup)
+    
+    def _mapper(self, name: str, style: str = 'pojo') -> str:
+        JavaStructureGenerator(mappers=True, style=style).generate_java_files(self.models, self.output_dir.name)
+        return (Path(self.output_dir.name) / f'{name}.java').read_text()
+    
+    def test_model_fields(self):
+        self.assertEqual([field.name for field in self.models['Model1'].fields], ['id', 'name', 'email'])
+        self.assertEqual([field.name for field in self.models['Model2'].fields], ['id', 'name', 'age'])
+    
+    def test_mapped_fields(self):
+        to_model2 = self._mapper('Model1ToModel2Mapper')
+        to_model1 = self._mapper('Model2ToModel1Mapper')
+        
+        # age is not used by Model1, and email not by Model2
+        self.assertIn('return new Model2(source.getId(), source.getName(), null);', to_model2)
+        self.assertIn('Copies 2 of the 3 Model2 fields', to_model2)
+        self.assertIn('return new Model1(source.getId(), source.getName(), "mail");', to_model1)
+        self.assertIn('Copies 2 of the 3 Model1 fields', to_model1)
+    
+    def test_record_accessors(self):
+        to_model2 = self._mapper('Model1ToModel2Mapper', style='record')
+        
+        self.assertIn('return new Model2(source.id(), source.name(), null);', to_model2)
+
+
+if __name__ == '__main__':
+    unittest.main()
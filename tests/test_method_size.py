@@ -0,0 +1,58 @@
+"""
+Checks that no generated method outgrows the JVM method size limit on a wide schema.
+
+Run with: python -m unittest discover tests
+"""
+
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.csv_parser import SchemaField
+from src.java_structure import JavaStructureGenerator
+from src.model_generator import ModelGenerator
+
+
+# Source characters allowed per method body; the JVM limits the bytecode of a method to 64 KB
+MAX_METHOD_CHARS = 64 * 1024
+
+# Two models sharing 2000 fields, split into components by the default slot limit
+SCHEMA = [
+    SchemaField(f'/document/section{index // 100}/item{index % 100}', 'optional', 'string',
+                ('first sample value', 'second sample value'))
+    for index in range(2000)
+]
+
+# A method or constructor header indented by one or two levels, and its body up to the closing
+# brace at the same indentation; statements of top-level methods share the second level
+METHOD = re.compile(
+    r'^( {4}| {8})(?!(?:if|for|while|switch|synchronized)\b)(?:[\w<>\[\],.?]+ )*(\w+)\([^()]*\)'
+    r'(?: throws [\w., ]+)? \{\n(.*?)^\1\}\n',
+    re.MULTILINE | re.DOTALL
+)
+
+
+class MethodSizeTest(unittest.TestCase):
+    """Readers, JSON methods, mappers and benchmarks of wide models stay within the method size limit."""
+    
+    def test_generated_methods_are_bounded(self):
+        models = ModelGenerator().generate_models(SCHEMA)
+        with tempfile.TemporaryDirectory() as output_dir:
+            JavaStructureGenerator(xml_readers=True, json=True, mappers=True, benchmarks=True).generate_java_files(
+                models, output_dir)
+            sizes = [
+                (path.name, match.group(2), len(match.group(3)))
+                for path in Path(output_dir).rglob('*.java')
+                for match in METHOD.finditer(path.read_text())
+            ]
+        
+        methods = {(file_name, method) for file_name, method, _ in sizes}
+        self.assertIn(('MapperBenchmark.java', 'setUp'), methods)
+        self.assertIn(('Model1.java', 'fromXml'), methods)
+        self.assertIn(('Model1ToModel2Mapper.java', 'map'), methods)
+        self.assertEqual([size for size in sizes if size[2] > MAX_METHOD_CHARS], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
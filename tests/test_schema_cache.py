@@ -0,0 +1,92 @@
+"""
+Checks of the on-disk schema cache: keys, eviction and recovery from bad entries.
+
+Run with: python -m unittest discover tests
+"""
+
+import os
+import pickle
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+
+from src.csv_parser import PARSER_VERSION, CSVSchemaParser
+from src.schema_cache import ENTRY_SUFFIX, SchemaCache
+
+
+SCHEMA_CSV = (
+    'xpath,required/optional,data_type,model1,model2\n'
+    '/order/@id,required,integer,orderId,id\n'
+    '/order/note,optional,string,"two\nlines",do not use\n'
+)
+
+
+class SchemaCacheTest(unittest.TestCase):
+    """Entries are keyed by content and version, evicted least recently used first, and dropped when unreadable."""
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.cache = SchemaCache(str(self.directory / 'cache'))
+        self.schema_path = self.directory / 'schema.csv'
+        self.schema_path.write_text(SCHEMA_CSV, encoding='utf-8')
+    
+    def _entries(self) -> set:
+        return {path.name[:-len(ENTRY_SUFFIX)] for path in self.cache.cache_dir.glob(f'*{ENTRY_SUFFIX}')}
+    
+    def test_key_changes_with_content_namespace_and_version(self):
+        key = self.cache.key_for(str(self.schema_path), 'schema', 1)
+        
+        self.assertEqual(self.cache.key_for(str(self.schema_path), 'schema', 1), key)
+        self.assertNotEqual(self.cache.key_for(str(self.schema_path), 'schema', 2), key)
+        self.assertNotEqual(self.cache.key_for(str(self.schema_path), 'other', 1), key)
+        self.schema_path.write_text(SCHEMA_CSV + '/order/total,optional,decimal,sum,total\n', encoding='utf-8')
+        self.assertNotEqual(self.cache.key_for(str(self.schema_path), 'schema', 1), key)
+    
+    def test_parser_reuses_entry_until_the_file_changes(self):
+        parsed = CSVSchemaParser(cache=self.cache).parse_csv(str(self.schema_path))
+        cached = CSVSchemaParser(cache=self.cache).parse_csv(str(self.schema_path))
+        
+        self.assertEqual(cached, parsed)
+        self.assertEqual(cached[1].model_values, ('two\nlines', 'do not use'))
+        self.assertEqual(self._entries(), {self.cache.key_for(str(self.schema_path), 'schema', PARSER_VERSION)})
+        
+        self.schema_path.write_text(SCHEMA_CSV.replace('orderId', 'orderNumber'), encoding='utf-8')
+        changed = CSVSchemaParser(cache=self.cache).parse_csv(str(self.schema_path))
+        self.assertEqual(changed[0].model_values, ('orderNumber', 'id'))
+        self.assertEqual(len(self._entries()), 2)
+    
+    def test_least_recently_used_entries_are_evicted(self):
+        for index, key in enumerate(['a', 'b', 'c']):
+            self.cache.store(key, ['value', key])
+            os.utime(self.cache.cache_dir / f'{key}{ENTRY_SUFFIX}', (1000 + index, 1000 + index))
+        entry_size = (self.cache.cache_dir / f'a{ENTRY_SUFFIX}').stat().st_size
+        
+        # Loading refreshes "a", so "b" is now the least recently used
+        self.assertEqual(self.cache.load('a'), ['value', 'a'])
+        self.cache.max_bytes = 3 * entry_size
+        self.cache.store('d', ['value', 'd'])
+        
+        self.assertEqual(self._entries(), {'a', 'c', 'd'})
+    
+    def test_unreadable_entries_are_dropped_and_parsed_again(self):
+        key = self.cache.key_for(str(self.schema_path), 'schema', PARSER_VERSION)
+        entry_path = self.cache.cache_dir / f'{key}{ENTRY_SUFFIX}'
+        expected = CSVSchemaParser().parse_csv(str(self.schema_path))
+        
+        # Truncated data, and a pickled entry in the old format or from an untrusted writer, are never loaded
+        for content in (b'\x78\x9c\x01', zlib.compress(pickle.dumps(['value']))):
+            with self.subTest(content=content[:4]):
+                entry_path.write_bytes(content)
+                self.assertIsNone(self.cache.load(key))
+                self.assertFalse(entry_path.exists())
+                
+                entry_path.write_bytes(content)
+                self.assertEqual(CSVSchemaParser(cache=self.cache).parse_csv(str(self.schema_path)), expected)
+                self.assertIsNotNone(self.cache.load(key))
+
+
+if __name__ == '__main__':
+    unittest.main()
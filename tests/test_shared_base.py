@@ -0,0 +1,83 @@
+"""
+Checks of the shared base class extracted from two models.
+
+Run with: python -m unittest discover tests
+"""
+
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.csv_parser import SchemaField
+from src.java_structure import JavaStructureGenerator
+from src.model_generator import ModelGenerator
+
+
+SCHEMA = [
+    SchemaField('/person/@id', 'required', 'integer', ('personId', 'id')),
+    SchemaField('/person/name', 'required', 'string', ('fullName', 'displayName')),
+    SchemaField('/person/email', 'optional', 'string', ('mail', 'do not use')),
+    SchemaField('/person/age', 'optional', 'integer', ('-', 'years')),
+    SchemaField('/person/address/city', 'optional', 'string', ('town', 'city')),
+]
+
+# Field declarations of a generated class, as (access, name) pairs
+FIELD = re.compile(r'^    (private|protected) (?:final )?[\w<>]+ (\w+)(?: = .*)?;$', re.MULTILINE)
+
+
+class SharedBaseTest(unittest.TestCase):
+    """ModelBase holds the fields shared by XPath, and the models build on it through super."""
+    
+    def _generate(self, **options) -> dict:
+        generator = JavaStructureGenerator(shared_base=True, **options)
+        with tempfile.TemporaryDirectory() as output_dir:
+            generator.generate_java_files(ModelGenerator().generate_models(SCHEMA), output_dir)
+            self.assertEqual([field.xpath for field in generator.base_model.fields],
+                             ['/person/@id', '/person/name', '/person/address/city'])
+            return {path.stem: path.read_text() for path in Path(output_dir).glob('*.java')}
+    
+    def test_base_holds_the_shared_fields(self):
+        for style in ('pojo', 'immutable'):
+            with self.subTest(style=style):
+                classes = self._generate(style=style)
+                
+                self.assertEqual(set(classes), {'ModelBase', 'Model1', 'Model2'})
+                self.assertIn('public abstract class ModelBase {', classes['ModelBase'])
+                self.assertEqual(FIELD.findall(classes['ModelBase']),
+                                 [('protected', 'id'), ('protected', 'name'), ('protected', 'city')])
+                # Immutable models also declare their cached hash code
+                self.assertEqual([field for field in FIELD.findall(classes['Model1']) if field[1] != 'cachedHashCode'],
+                                 [('private', 'email')])
+                self.assertEqual([field for field in FIELD.findall(classes['Model2']) if field[1] != 'cachedHashCode'],
+                                 [('private', 'age')])
+    
+    def test_subclasses_call_super(self):
+        for style in ('pojo', 'immutable'):
+            with self.subTest(style=style):
+                classes = self._generate(style=style)
+                model1, model2 = classes['Model1'], classes['Model2']
+                
+                self.assertIn('extends ModelBase {', model1)
+                self.assertIn('public Model1(Integer id, String name, String email, String city) {\n'
+                              '        super(id, name, city);\n'
+                              '        this.email = email;\n', model1)
+                self.assertIn('super(id, name, city);\n        this.age = age;\n', model2)
+                self.assertIn('return super.equals(obj) && java.util.Objects.equals(email, that.email);', model1)
+                self.assertIn('return super.equals(obj) && java.util.Objects.equals(age, that.age);', model2)
+                self.assertIn('java.util.Objects.hash(super.hashCode(), email)', model1)
+                self.assertIn('java.util.Objects.hash(super.hashCode(), age)', model2)
+                self.assertIn('ModelBase that = (ModelBase) obj;', classes['ModelBase'])
+                self.assertIn('java.util.Objects.hash(id, name, city)', classes['ModelBase'])
+    
+    def test_fast_equals_checks_super_first(self):
+        model1 = self._generate(fast_equals=True)['Model1']
+        
+        self.assertIn('        if (!super.equals(obj)) return false;\n'
+                      '        if (!java.util.Objects.equals(email, that.email)) return false;\n', model1)
+        self.assertIn('        h = 31 * h + super.hashCode();\n'
+                      '        h = 31 * h + java.util.Objects.hashCode(email);\n', model1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Checks of generated fromXml readers for attribute fields.
+
+Run with: python -m unittest discover tests
+"""
+
+import re
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.csv_parser import SchemaField
+from src.java_structure import METHOD_CHUNK_FIELDS, JavaStructureGenerator
+from src.model_generator import ModelGenerator
+
+
+SCHEMA = [
+    SchemaField('/example/person/@id', 'required', 'integer', ('7',)),
+    SchemaField('/example/person/ns:name', 'required', 'string', ('Ada',)),
+    SchemaField('/example/person/phone[1]', 'optional', 'string', ('555',)),
+]
+
+
+class XmlReaderAttributeTest(unittest.TestCase):
+    """Generated readers use sanitized names for attribute, prefixed and predicated steps, and split wide switches."""
+    
+    def setUp(self):
+        self.models = ModelGenerator().generate_models(SCHEMA)
+        self.generator = JavaStructureGenerator(xml_readers=True)
+    
+    def test_field_names_are_java_identifiers(self):
+        names = [field.name for field in self.models['Model1'].fields]
+        
+        self.assertEqual(names, ['id', 'name', 'phone'])
+    
+    def test_reader_identifiers(self):
+        code = self.generator._generate_java_class(self.models['Model1'])
+        reader = code[code.index('public static Model1 fromXml'):]
+        
+        self.assertIn('Integer id = null;', reader)
+        self.assertIn('id = Integer.valueOf(xmlValue.trim());', reader)
+        # The attribute is still matched by its XML name
+        self.assertIn('xmlReader.getAttributeValue(null, "id")', reader)
+        self.assertNotIn('@id', reader)
+    
+    def test_state_switches_are_split_by_state_range(self):
+        schema = [
+            SchemaField(f'/example/group{index // 10}/item{index % 10}/value', 'required', 'string', (f'v{index}',))
+            for index in range(300)
+        ]
+        models = ModelGenerator(max_slots=None).generate_models(schema)
+        code = self.generator._generate_java_class(models['Model1'])
+        
+        # Child elements of transition helpers, and fields of text helpers
+        for method, case in (('transition', 'case "'), ('text', ' = xmlValue;')):
+            helpers = re.findall(rf'private (?:static int|void) {method}\d+\(.*?\n        }}\n', code, re.DOTALL)
+            self.assertGreater(len(helpers), 1, method)
+            self.assertEqual(sum(helper.count(case) for helper in helpers), 300 if method == 'text' else 631)
+            for helper in helpers:
+                self.assertLessEqual(helper.count(case), METHOD_CHUNK_FIELDS)
+    
+    @unittest.skipUnless(shutil.which('javac'), "javac is not installed")
+    def test_reader_compiles(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.generator.generate_java_files(self.models, output_dir)
+            sources = [str(path) for path in Path(output_dir).rglob('*.java')]
+            result = subprocess.run(['javac', '-d', output_dir, *sources], capture_output=True, text=True)
+        
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()